@@ -12,7 +12,15 @@ from sqlalchemy import pool
 from alembic import context
 from app.core.config import settings
 from app.db.base_class import Base
-from app.models import health_event, family_member, user  # Import all models here
+from app.models import (  # Import all models here
+    health_event,
+    family_member,
+    user,
+    event_stats,
+    sync,
+    watermark,
+    attachment,
+)
 
 config = context.config
 
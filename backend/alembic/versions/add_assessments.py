@@ -0,0 +1,72 @@
+"""add the test scale and assessment result tables
+
+Revision ID: add_assessments
+Revises: add_measurements
+Create Date: 2026-10-19 23:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_assessments"
+down_revision: Union[str, None] = "add_measurements"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "test_scales",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("key", sa.String(length=50), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column(
+            "definition", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key"),
+    )
+    op.create_table(
+        "assessment_results",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("test_scale_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("scale_version", sa.Integer(), nullable=False),
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("submitted_by_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("answers", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("total_score", sa.Float(), nullable=False),
+        sa.Column(
+            "subscale_scores", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column("band", sa.String(length=100), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["test_scale_id"], ["test_scales.id"]),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["submitted_by_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_assessment_results_member_scale",
+        "assessment_results",
+        ["family_member_id", "test_scale_id", "completed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_assessment_results_member_scale", table_name="assessment_results"
+    )
+    op.drop_table("assessment_results")
+    op.drop_table("test_scales")
@@ -0,0 +1,116 @@
+"""move event files into an attachments table
+
+Revision ID: add_attachments
+Revises: partition_health_events
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+import hashlib
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_attachments"
+down_revision: Union[str, None] = "partition_health_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attachments",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_date_time", sa.DateTime(), nullable=False),
+        sa.Column("hash", sa.String(length=64), nullable=True),
+        sa.Column("size", sa.BigInteger(), nullable=True),
+        sa.Column("mime", sa.String(length=255), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("storage_path", sa.String(length=1024), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["event_id", "event_date_time"],
+            ["health_events.id", "health_events.date_time"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_attachments_event_id", "attachments", ["event_id"])
+    op.create_index("ix_attachments_hash", "attachments", ["hash"])
+
+    # One attachment per array element, keeping the original order
+    op.execute("""
+        INSERT INTO attachments (
+            id, event_id, event_date_time, mime, filename, storage_path, created_at
+        )
+        SELECT
+            gen_random_uuid(),
+            e.id,
+            e.date_time,
+            coalesce(f.file_type, 'application/octet-stream'),
+            regexp_replace(f.file_path, '^.*/', ''),
+            f.file_path,
+            coalesce(e.updated_at, now()) + f.position * interval '1 microsecond'
+        FROM health_events e,
+            unnest(e.file_paths, e.file_types)
+                WITH ORDINALITY AS f(file_path, file_type, position)
+        WHERE f.file_path IS NOT NULL
+        """)
+
+    # Fill in hash and size for the files readable from this host
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, storage_path FROM attachments")).all()
+    for attachment_id, path in rows:
+        if not os.path.isfile(path):
+            continue
+        file_hash, size = hash_file(path)
+        bind.execute(
+            sa.text("UPDATE attachments SET hash = :hash, size = :size WHERE id = :id"),
+            {"hash": file_hash, "size": size, "id": attachment_id},
+        )
+
+    op.drop_column("health_events", "file_types")
+    op.drop_column("health_events", "file_paths")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "health_events",
+        sa.Column("file_paths", postgresql.ARRAY(sa.String()), nullable=True),
+    )
+    op.add_column(
+        "health_events",
+        sa.Column("file_types", postgresql.ARRAY(sa.String()), nullable=True),
+    )
+    op.execute("""
+        UPDATE health_events e
+        SET file_paths = a.file_paths, file_types = a.file_types
+        FROM (
+            SELECT
+                event_id,
+                array_agg(storage_path ORDER BY created_at) AS file_paths,
+                array_agg(mime ORDER BY created_at) AS file_types
+            FROM attachments
+            GROUP BY event_id
+        ) a
+        WHERE e.id = a.event_id
+        """)
+    op.drop_index("ix_attachments_hash", table_name="attachments")
+    op.drop_index("ix_attachments_event_id", table_name="attachments")
+    op.drop_table("attachments")
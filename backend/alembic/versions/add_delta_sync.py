@@ -0,0 +1,113 @@
+"""add change tracking and tombstones for delta sync
+
+Revision ID: add_delta_sync
+Revises: add_event_stats
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_delta_sync"
+down_revision: Union[str, None] = "add_event_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEXT_SEQ = sa.text("nextval('change_seq')")
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence("change_seq")))
+
+    for table in ("family_members", "health_events"):
+        # Existing rows get transaction id 0 so they sort before any change
+        # made after the upgrade
+        op.add_column(
+            table,
+            sa.Column(
+                "change_xid", sa.BigInteger(), nullable=False, server_default="0"
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "change_seq", sa.BigInteger(), nullable=False, server_default=NEXT_SEQ
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "created_xid", sa.BigInteger(), nullable=False, server_default="0"
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "created_seq", sa.BigInteger(), nullable=False, server_default=NEXT_SEQ
+            ),
+        )
+        # Values are assigned by the application on every write
+        for column in ("change_xid", "change_seq", "created_xid", "created_seq"):
+            op.alter_column(table, column, server_default=None)
+
+    op.create_index(
+        "ix_family_members_manager_change",
+        "family_members",
+        ["manager_id", "change_xid", "change_seq"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_health_events_change",
+        "health_events",
+        ["change_xid", "change_seq"],
+        unique=False,
+    )
+
+    op.create_table(
+        "tombstones",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("entity_type", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("change_xid", sa.BigInteger(), nullable=False),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tombstones_user_change",
+        "tombstones",
+        ["user_id", "change_xid", "change_seq"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tombstones_deleted_at", "tombstones", ["deleted_at"], unique=False
+    )
+
+    op.create_table(
+        "watermarks",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("value", sa.String(length=255), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("watermarks")
+    op.drop_index("ix_tombstones_deleted_at", table_name="tombstones")
+    op.drop_index("ix_tombstones_user_change", table_name="tombstones")
+    op.drop_table("tombstones")
+    op.drop_index("ix_health_events_change", table_name="health_events")
+    op.drop_index("ix_family_members_manager_change", table_name="family_members")
+    for table in ("family_members", "health_events"):
+        op.drop_column(table, "created_seq")
+        op.drop_column(table, "created_xid")
+        op.drop_column(table, "change_seq")
+        op.drop_column(table, "change_xid")
+    op.execute(sa.schema.DropSequence(sa.Sequence("change_seq")))
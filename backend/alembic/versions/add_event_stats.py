@@ -0,0 +1,73 @@
+"""add event statistics rollup tables
+
+Revision ID: add_event_stats
+Revises: rebuild_tables
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_event_stats"
+down_revision: Union[str, None] = "rebuild_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the bound recomputation done when an event is removed
+    op.create_index(
+        "ix_health_events_member_type_date",
+        "health_events",
+        ["family_member_id", "event_type", "date_time"],
+        unique=False,
+    )
+
+    op.create_table(
+        "member_event_type_stats",
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_type", sa.String(length=255), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("first_event_at", sa.DateTime(), nullable=True),
+        sa.Column("last_event_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("family_member_id", "event_type"),
+    )
+    op.create_table(
+        "member_monthly_event_stats",
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("family_member_id", "month"),
+    )
+
+    # Backfill from the existing events
+    op.execute("""
+        INSERT INTO member_event_type_stats
+            (family_member_id, event_type, event_count, first_event_at, last_event_at)
+        SELECT family_member_id, event_type, count(*), min(date_time), max(date_time)
+        FROM health_events
+        GROUP BY family_member_id, event_type
+        """)
+    op.execute("""
+        INSERT INTO member_monthly_event_stats (family_member_id, month, event_count)
+        SELECT family_member_id, date_trunc('month', date_time)::date, count(*)
+        FROM health_events
+        GROUP BY family_member_id, date_trunc('month', date_time)::date
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("member_monthly_event_stats")
+    op.drop_table("member_event_type_stats")
+    op.drop_index("ix_health_events_member_type_date", table_name="health_events")
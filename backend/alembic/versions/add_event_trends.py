@@ -0,0 +1,47 @@
+"""add the member event trends table
+
+Revision ID: add_event_trends
+Revises: add_health_scores
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_event_trends"
+down_revision: Union[str, None] = "add_health_scores"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "member_event_trends",
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_type", sa.String(length=255), nullable=False),
+        sa.Column("week_start", sa.Date(), nullable=False),
+        sa.Column("weekly_counts", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("rolling_mean", postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column("baseline_mean", sa.Float(), nullable=False),
+        sa.Column("baseline_std", sa.Float(), nullable=False),
+        sa.Column("zscore", sa.Float(), nullable=False),
+        sa.Column("is_anomaly", sa.Boolean(), nullable=False),
+        sa.Column("slope", sa.Float(), nullable=False),
+        sa.Column("change_week", sa.Date(), nullable=True),
+        sa.Column("change_score", sa.Float(), nullable=False),
+        sa.Column("is_change_point", sa.Boolean(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("family_member_id", "event_type"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("member_event_trends")
@@ -0,0 +1,41 @@
+"""add the stale health score queue
+
+Revision ID: add_health_scores
+Revises: add_attachments
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_health_scores"
+down_revision: Union[str, None] = "add_attachments"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stale_health_scores",
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("marked_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("family_member_id"),
+    )
+
+    # Have the first run score every member with events
+    op.execute("""
+        INSERT INTO stale_health_scores (family_member_id, marked_at)
+        SELECT DISTINCT family_member_id, now() FROM health_events
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("stale_health_scores")
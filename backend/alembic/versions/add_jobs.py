@@ -0,0 +1,78 @@
+"""add the background jobs table
+
+Revision ID: add_jobs
+Revises: add_recurrences
+Create Date: 2026-10-20 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_jobs"
+down_revision: Union[str, None] = "add_recurrences"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(length=100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("dedup_key", sa.String(length=255), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("locked_by", sa.String(length=255), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_jobs_queued",
+        "jobs",
+        ["priority", "run_at", "id"],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "ux_jobs_dedup_key",
+        "jobs",
+        ["dedup_key"],
+        unique=True,
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "ix_jobs_running",
+        "jobs",
+        ["locked_at"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+    # Members already waiting to be rescored get their job right away
+    op.execute(
+        """
+        INSERT INTO jobs (kind, payload, priority, dedup_key, status, attempts,
+            max_attempts, run_at, created_at)
+        SELECT 'health_scores.recompute_stale', '{}', 100,
+            'health_scores.recompute_stale', 'queued', 0, 5,
+            now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+        WHERE EXISTS (SELECT 1 FROM stale_health_scores)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_running", table_name="jobs")
+    op.drop_index("ux_jobs_dedup_key", table_name="jobs")
+    op.drop_index("ix_jobs_queued", table_name="jobs")
+    op.drop_table("jobs")
@@ -0,0 +1,37 @@
+"""add the measurements table
+
+Revision ID: add_measurements
+Revises: add_event_trends
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_measurements"
+down_revision: Union[str, None] = "add_event_trends"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "measurements",
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("metric", sa.String(length=50), nullable=False),
+        sa.Column("ts", sa.DateTime(), nullable=False),
+        sa.Column("value", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("family_member_id", "metric", "ts"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("measurements")
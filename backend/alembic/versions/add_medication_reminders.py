@@ -0,0 +1,62 @@
+"""add the medication reminders table
+
+Revision ID: add_medication_reminders
+Revises: add_assessments
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_medication_reminders"
+down_revision: Union[str, None] = "add_assessments"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "medication_reminders",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("health_event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("due_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("health_event_id"),
+    )
+    op.create_index(
+        "ix_medication_reminders_pending",
+        "medication_reminders",
+        ["due_at"],
+        postgresql_where=sa.text("sent_at IS NULL"),
+    )
+    # Reminders of the medication events that are still ahead
+    op.execute(
+        """
+        INSERT INTO medication_reminders
+            (id, health_event_id, family_member_id, title, due_at, created_at)
+        SELECT gen_random_uuid(), id, family_member_id, title, date_time,
+            now() AT TIME ZONE 'utc'
+        FROM health_events
+        WHERE event_type = 'MEDICATION'
+            AND date_time > now() AT TIME ZONE 'utc'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_medication_reminders_pending", table_name="medication_reminders"
+    )
+    op.drop_table("medication_reminders")
@@ -0,0 +1,40 @@
+"""add the transactional outbox of changes
+
+Revision ID: add_outbox
+Revises: add_jobs
+Create Date: 2026-10-20 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_outbox"
+down_revision: Union[str, None] = "add_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("entity_type", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("action", sa.String(length=20), nullable=False),
+        sa.Column("change_xid", sa.BigInteger(), nullable=False),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_outbox_change", "outbox", ["change_xid", "change_seq"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_change", table_name="outbox")
+    op.drop_table("outbox")
@@ -0,0 +1,68 @@
+"""add recurrence rules and occurrence overrides of health events
+
+Revision ID: add_recurrences
+Revises: add_medication_reminders
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_recurrences"
+down_revision: Union[str, None] = "add_medication_reminders"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_recurrences",
+        sa.Column("health_event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("frequency", sa.String(length=20), nullable=False),
+        sa.Column("interval", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=True),
+        sa.Column("until", sa.DateTime(), nullable=True),
+        sa.Column("starts_at", sa.DateTime(), nullable=False),
+        sa.Column("ends_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"], ["family_members.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("health_event_id"),
+    )
+    op.create_index(
+        "ix_event_recurrences_family_member_id",
+        "event_recurrences",
+        ["family_member_id"],
+    )
+    op.create_table(
+        "occurrence_overrides",
+        sa.Column("health_event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("occurrence_at", sa.DateTime(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("date_time", sa.DateTime(), nullable=True),
+        sa.Column("cancelled", sa.Boolean(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["health_event_id"],
+            ["event_recurrences.health_event_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("health_event_id", "occurrence_at"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("occurrence_overrides")
+    op.drop_index(
+        "ix_event_recurrences_family_member_id", table_name="event_recurrences"
+    )
+    op.drop_table("event_recurrences")
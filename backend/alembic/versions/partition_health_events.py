@@ -0,0 +1,137 @@
+"""partition health_events by date_time
+
+Revision ID: partition_health_events
+Revises: add_delta_sync
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from datetime import datetime, UTC
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "partition_health_events"
+down_revision: Union[str, None] = "add_delta_sync"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, title, event_type, description, date_time, family_member_id, "
+    "created_by_id, created_at, updated_at, file_paths, file_types, "
+    "change_xid, change_seq, created_xid, created_seq"
+)
+
+
+def create_health_events(*args, **kwargs) -> None:
+    op.create_table(
+        "health_events",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("event_type", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("date_time", sa.DateTime(), nullable=False),
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_by_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("file_paths", postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column("file_types", postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column("change_xid", sa.BigInteger(), nullable=False),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False),
+        sa.Column("created_xid", sa.BigInteger(), nullable=False),
+        sa.Column("created_seq", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["created_by_id"], ["users.id"], name="health_events_created_by_id_fkey"
+        ),
+        sa.ForeignKeyConstraint(
+            ["family_member_id"],
+            ["family_members.id"],
+            name="health_events_family_member_id_fkey",
+        ),
+        *args,
+        **kwargs,
+    )
+    op.create_index(
+        "ix_health_events_member_type_date",
+        "health_events",
+        ["family_member_id", "event_type", "date_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_health_events_change",
+        "health_events",
+        ["change_xid", "change_seq"],
+        unique=False,
+    )
+
+
+def rename_existing_table() -> None:
+    constraints = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT conname FROM pg_constraint "
+                "WHERE conrelid = 'health_events'::regclass"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    op.rename_table("health_events", "health_events_old")
+    # Index and constraint names are schema-wide, free them for the new table
+    op.drop_index("ix_health_events_member_type_date", table_name="health_events_old")
+    op.drop_index("ix_health_events_change", table_name="health_events_old")
+    for name in constraints:
+        op.execute(
+            f"ALTER TABLE health_events_old RENAME CONSTRAINT {name} TO old_{name}"
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    rename_existing_table()
+
+    create_health_events(
+        postgresql_partition_by="RANGE (date_time)",
+    )
+    op.create_primary_key("health_events_pkey", "health_events", ["id", "date_time"])
+    op.execute("CREATE TABLE health_events_default PARTITION OF health_events DEFAULT")
+
+    # One partition per year holding data, plus the current and next year
+    current_year = datetime.now(UTC).year
+    years = set(range(current_year, current_year + 2))
+    years.update(
+        int(year)
+        for year in bind.execute(
+            sa.text(
+                "SELECT DISTINCT extract(year FROM date_time) FROM health_events_old"
+            )
+        ).scalars()
+    )
+    for year in sorted(years):
+        op.execute(
+            f"CREATE TABLE health_events_y{year} PARTITION OF health_events "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+
+    op.execute(
+        f"INSERT INTO health_events ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM health_events_old"
+    )
+    op.drop_table("health_events_old")
+
+
+def downgrade() -> None:
+    rename_existing_table()
+
+    create_health_events(sa.PrimaryKeyConstraint("id", name="health_events_pkey"))
+    op.execute(
+        f"INSERT INTO health_events ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM health_events_old"
+    )
+    # Drops every partition along with the parent
+    op.drop_table("health_events_old")
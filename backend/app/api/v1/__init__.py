@@ -1,5 +1,16 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import health_events, files, auth, family_members
+from app.api.v1.endpoints import (
+    health_events,
+    files,
+    auth,
+    family_members,
+    dashboard,
+    metrics,
+    sync,
+    batch,
+    measurements,
+    assessments,
+)
 
 api_router = APIRouter()
 
@@ -11,3 +22,13 @@ api_router.include_router(
     health_events.router, prefix="/health-events", tags=["health-events"]
 )
 api_router.include_router(files.router, prefix="/files", tags=["files"])
+api_router.include_router(
+    measurements.router, prefix="/measurements", tags=["measurements"]
+)
+api_router.include_router(
+    assessments.router, prefix="/assessments", tags=["assessments"]
+)
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
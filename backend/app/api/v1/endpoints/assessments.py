@@ -0,0 +1,128 @@
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.session import get_db
+from app.models.assessment import TestScale
+from app.models.family_member import FamilyMember
+from app.models.user import User
+from app.schemas.assessment import (
+    AssessmentResultsResponse,
+    AssessmentSubmit,
+    TestScaleResponse,
+)
+from app.services.assessment_service import AnswerError, assessment_service
+from app.utils.http_cache import json_response
+from app.utils.serialization import render_json
+from app.api.v1.endpoints.auth import get_current_user
+
+router = APIRouter()
+
+
+@router.get(
+    "/scales",
+    response_model=List[TestScaleResponse],
+    summary="List test scales",
+)
+def list_scales(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    List the available test scales with their current definition.
+
+    The definition holds the items and answer options to present, and the
+    version that submitted results will be scored with.
+    """
+    scales = db.scalars(select(TestScale).order_by(TestScale.key)).all()
+    return json_response(render_json(List[TestScaleResponse], scales), {})
+
+
+@router.post(
+    "/results",
+    response_model=AssessmentResultsResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Submit assessment answers",
+)
+def submit_assessments(
+    assessments_in: AssessmentSubmit,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Score and store a batch of completed assessments.
+
+    Answers are scored against the current version of each scale as part
+    of the request, and the results are returned in submission order.
+
+    - **submissions**: Answer sets with `test_scale_id`, `family_member_id`,
+      `answers` (item id to option value) and an optional `completed_at`
+    """
+    submissions = assessments_in.submissions
+    if len(submissions) > settings.ASSESSMENT_MAX_SUBMISSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Too many submissions, at most "
+            f"{settings.ASSESSMENT_MAX_SUBMISSIONS} per request",
+        )
+    member_ids = {submission.family_member_id for submission in submissions}
+    managed = db.scalars(
+        select(FamilyMember.id).where(
+            FamilyMember.id.in_(list(member_ids)),
+            FamilyMember.manager_id == current_user.id,
+        )
+    ).all()
+    if len(managed) != len(member_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Family member not found"
+        )
+
+    try:
+        results = assessment_service.submit(db, submissions, current_user.id)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except AnswerError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+    db.commit()
+    return AssessmentResultsResponse(results=results)
+
+
+@router.get(
+    "/results",
+    response_model=AssessmentResultsResponse,
+    summary="Get assessment results of a family member",
+)
+def get_assessment_results(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    family_member_id: UUID = Query(..., description="Family member UUID"),
+    test_scale_id: Optional[UUID] = Query(None, description="Filter by test scale"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum results to return"),
+):
+    """
+    Get the latest assessment results of a family member, newest first.
+
+    - **family_member_id**: UUID of the family member
+    - **test_scale_id**: Only return results of this scale
+    - **limit**: Maximum number of results to return
+    """
+    managed = db.scalar(
+        select(FamilyMember.id).where(
+            FamilyMember.id == family_member_id,
+            FamilyMember.manager_id == current_user.id,
+        )
+    )
+    if managed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Family member not found"
+        )
+
+    results = assessment_service.get_results(
+        db, family_member_id, test_scale_id, limit
+    )
+    body = render_json(AssessmentResultsResponse, {"results": results})
+    return json_response(body, {})
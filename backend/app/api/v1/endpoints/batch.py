@@ -0,0 +1,178 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import BATCH_SESSION_KEY, get_db
+from app.models.user import User
+from app.schemas.batch import (
+    BatchRequest,
+    BatchRequestItem,
+    BatchResponse,
+    BatchResponseItem,
+)
+from app.api.v1.endpoints.auth import BATCH_USER_KEY, get_current_user
+
+router = APIRouter()
+
+READ_METHODS = {"GET", "HEAD"}
+# Sub-requests that cannot complete inside a batch
+EXCLUDED_PATHS = ("/batch", "/sync/events")
+# Request headers a sub-request may set itself
+FORWARDED_HEADERS = {"accept", "if-none-match", "if-modified-since"}
+
+
+@router.post("/", response_model=BatchResponse, summary="Run several API calls")
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Run a list of API calls in one HTTP request.
+
+    Each sub-request names a `method`, a `path` relative to the API prefix
+    (e.g. `/family-members/`), and optional `query`, `headers` and JSON
+    `body`. Sub-requests run as the caller of the batch; responses come
+    back in request order, each with its own status, headers and body.
+
+    Runs of consecutive reads (GET) execute concurrently, each on its own
+    pooled session, since a database connection serves one query at a time.
+    Writes run one at a time, in order, on the session of the batch. Every
+    sub-request is handed a detached, fully loaded copy of the caller.
+    """
+    if len(batch.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"A batch may contain at most {settings.BATCH_MAX_REQUESTS} requests"
+            ),
+        )
+
+    # Reads use the user from other threads; a copy bound to this session
+    # would be expired by a write's commit and refreshed from those threads
+    db.refresh(current_user)
+    db.expunge(current_user)
+
+    semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+
+    async def run_read(item: BatchRequestItem) -> BatchResponseItem:
+        async with semaphore:
+            return await _dispatch(request, item, current_user, None)
+
+    responses: List[BatchResponseItem] = []
+    reads: List[BatchRequestItem] = []
+    for item in batch.requests:
+        if item.method.upper() in READ_METHODS:
+            reads.append(item)
+            continue
+        responses.extend(await asyncio.gather(*map(run_read, reads)))
+        reads = []
+        responses.append(await _dispatch(request, item, current_user, db))
+    responses.extend(await asyncio.gather(*map(run_read, reads)))
+
+    return BatchResponse(responses=responses)
+
+
+async def _dispatch(
+    request: Request,
+    item: BatchRequestItem,
+    user: User,
+    db: Optional[Session],
+) -> BatchResponseItem:
+    """Run one sub-request through the application in-process."""
+    path = "/" + item.path.lstrip("/")
+    if path.startswith(EXCLUDED_PATHS):
+        return _error(item, 400, f"{path} cannot be used in a batch")
+
+    body = b"" if item.body is None else orjson.dumps(item.body)
+    headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in item.headers.items()
+        if name.lower() in FORWARDED_HEADERS
+    ]
+    authorization = request.headers.get("authorization")
+    if authorization:
+        headers.append((b"authorization", authorization.encode()))
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+
+    full_path = settings.API_V1_STR + path
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": item.method.upper(),
+        "scheme": request.url.scheme,
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": full_path,
+        "raw_path": full_path.encode(),
+        "query_string": urlencode(item.query, doseq=True).encode(),
+        "headers": headers,
+        "app": request.app,
+        "state": {},
+        BATCH_USER_KEY: user,
+    }
+    if db is not None:
+        scope[BATCH_SESSION_KEY] = db
+
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            # Sub-requests never disconnect; wait like an idle client
+            await asyncio.Event().wait()
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = 500
+    response_headers: Dict[str, str] = {}
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status, response_headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers = {
+                name.decode("latin-1"): value.decode("latin-1")
+                for name, value in message.get("headers", [])
+            }
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # Already turned into a 500 response by the error middleware
+        if not chunks:
+            return _error(item, 500, "Internal Server Error")
+
+    response_headers.pop("content-length", None)
+    content = b"".join(chunks)
+    if not content:
+        payload = None
+    elif "json" in response_headers.get("content-type", ""):
+        payload = orjson.loads(content)
+    else:
+        payload = content.decode(errors="replace")
+    return BatchResponseItem(
+        id=item.id, status=status, headers=response_headers, body=payload
+    )
+
+
+def _error(item: BatchRequestItem, status: int, detail: str) -> BatchResponseItem:
+    return BatchResponseItem(
+        id=item.id,
+        status=status,
+        headers={"content-type": "application/json"},
+        body={"detail": detail},
+    )
@@ -0,0 +1,155 @@
+from collections import defaultdict
+from datetime import date, datetime, UTC
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.db.session import get_db
+from app.models.family_member import FamilyMember
+from app.models.health_event import EventType
+from app.models.user import User
+from app.schemas.dashboard import (
+    DashboardHomeResponse,
+    DashboardStatsResponse,
+    EventTrendsResponse,
+    MemberStatsResponse,
+    MonthlyEventCount,
+)
+from app.services.dashboard_service import dashboard_service
+from app.services.recurrence_service import recurrence_service
+from app.services.stats_service import stats_service
+from app.services.trend_service import trend_service
+from app.utils.http_cache import json_response
+from app.utils.serialization import render_json
+from app.api.v1.endpoints.auth import get_current_user
+
+router = APIRouter()
+
+
+@router.get(
+    "/stats",
+    response_model=DashboardStatsResponse,
+    summary="Get per-member event statistics",
+)
+def get_dashboard_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    months: int = Query(12, ge=1, le=120, description="Months of history"),
+):
+    """
+    Get event statistics for every family member of the current user.
+
+    Statistics are read from the rollup tables, so the cost depends on the
+    number of members rather than the number of health events. Past
+    occurrences of recurring events are expanded and added to them.
+
+    - **months**: Number of calendar months to include in the monthly series
+    """
+    now = datetime.now(UTC).replace(tzinfo=None)
+    today = now.date()
+    month_index = today.year * 12 + today.month - months
+    since = date(month_index // 12, month_index % 12 + 1, 1)
+
+    members = (
+        db.query(FamilyMember.id, FamilyMember.name)
+        .filter(FamilyMember.manager_id == current_user.id)
+        .order_by(FamilyMember.name)
+        .all()
+    )
+    type_stats = stats_service.get_type_stats(db, current_user.id)
+    monthly_stats = stats_service.get_monthly_stats(db, current_user.id, since)
+    occurrences = defaultdict(list)
+    for row in recurrence_service.occurrence_counts(db, current_user.id, now):
+        occurrences[row.family_member_id].append(row)
+
+    results = []
+    for member_id, name in members:
+        rows = type_stats.get(member_id, [])
+        counts_by_type = {row.event_type: row.event_count for row in rows}
+        last_by_type = {row.event_type: row.last_event_at for row in rows}
+        monthly = {
+            row.month: row.event_count for row in monthly_stats.get(member_id, [])
+        }
+        for row in occurrences[member_id]:
+            counts_by_type[row.event_type] = (
+                counts_by_type.get(row.event_type, 0) + row.event_count
+            )
+            last = last_by_type.get(row.event_type)
+            if last is None or row.last_event_at > last:
+                last_by_type[row.event_type] = row.last_event_at
+            if row.month >= since:
+                monthly[row.month] = monthly.get(row.month, 0) + row.event_count
+        results.append(
+            MemberStatsResponse(
+                family_member_id=member_id,
+                name=name,
+                total_events=sum(counts_by_type.values()),
+                counts_by_type=counts_by_type,
+                last_event_at=max(
+                    (last for last in last_by_type.values() if last), default=None
+                ),
+                last_checkup_at=last_by_type.get(EventType.CHECKUP.value),
+                monthly=[
+                    MonthlyEventCount(month=month, event_count=count)
+                    for month, count in sorted(monthly.items())
+                ],
+            )
+        )
+
+    return DashboardStatsResponse(members=results)
+
+
+@router.get(
+    "/home",
+    response_model=DashboardHomeResponse,
+    summary="Get family members with their latest events",
+)
+def get_dashboard_home(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    per_type: int = Query(3, ge=1, le=20, description="Latest events per type"),
+):
+    """
+    Get every family member of the current user with their recent events.
+
+    Returns, per member, the latest events of each event type and the next
+    upcoming event, all read with a single database query.
+
+    - **per_type**: Number of latest events to return per event type
+    """
+    now = datetime.now(UTC).replace(tzinfo=None)
+    members = dashboard_service.get_home(db, current_user.id, per_type, now)
+    body = render_json(DashboardHomeResponse, {"members": members})
+    return json_response(body, {})
+
+
+@router.get(
+    "/trends",
+    response_model=EventTrendsResponse,
+    summary="Get weekly event trends and alerts",
+)
+def get_dashboard_trends(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    family_member_id: Optional[UUID] = Query(
+        None, description="Only trends of this family member"
+    ),
+    flagged_only: bool = Query(
+        False, description="Only series with an anomaly or a change point"
+    ),
+):
+    """
+    Get the weekly event series of the current user's family members.
+
+    Series are analyzed by a nightly batch: each carries a rolling mean, a
+    z-score of last week against the weeks before it (`is_anomaly`), a
+    trend slope and the strongest shift of its mean (`is_change_point`).
+
+    - **family_member_id**: Filter by family member UUID
+    - **flagged_only**: Only return series that raise an alert
+    """
+    trends = trend_service.get_trends(
+        db, current_user.id, family_member_id, flagged_only
+    )
+    body = render_json(EventTrendsResponse, {"trends": trends})
+    return json_response(body, {})
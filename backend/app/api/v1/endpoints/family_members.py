@@ -1,6 +1,7 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.user import User
@@ -9,13 +10,37 @@ from app.schemas.family_member import (
     FamilyMemberCreate,
     FamilyMemberUpdate,
     FamilyMemberResponse,
+    FamilyMemberSummary,
     PaginatedResponse,
 )
+from app.services.change_feed import change_feed
+from app.services.response_cache import response_cache
+from app.services.stats_service import stats_service
+from app.services.sync_service import FAMILY_MEMBER, sync_service
+from app.utils.http_cache import (
+    is_not_modified,
+    json_response,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from app.utils.serialization import render_json
 from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
 
 
+def _summary_key(family_member: FamilyMember) -> tuple:
+    """Everything a summarized member representation depends on."""
+    return (
+        family_member.id,
+        family_member.updated_at,
+        family_member.event_count,
+        family_member.last_event_at,
+        sorted(family_member.counts_by_type.items()),
+    )
+
+
 @router.post(
     "/", response_model=FamilyMemberResponse, status_code=status.HTTP_201_CREATED
 )
@@ -38,8 +63,13 @@ def create_family_member(
         **family_member_in.model_dump(), manager_id=current_user.id
     )
     db.add(db_family_member)
+    db.flush()
+    change_feed.publish(
+        db, current_user.id, FAMILY_MEMBER, db_family_member.id, "created"
+    )
     db.commit()
     db.refresh(db_family_member)
+    response_cache.invalidate_user(current_user.id)
 
     return db_family_member
 
@@ -50,59 +80,95 @@ def get_family_members(
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
 ):
     """
     Get list of family members for the current user.
 
+    Every member carries a summary of their health events (count, date of
+    the latest one, counts by type) read from the event rollups.
+
+    Responses carry a collection ETag; send it back in `If-None-Match` to get
+    a 304 when nothing changed.
+
     - **skip**: Number of records to skip
     - **limit**: Maximum number of records to return
     """
-    total = (
-        db.query(FamilyMember)
-        .filter(FamilyMember.manager_id == current_user.id)
-        .count()
-    )
+    query = db.query(FamilyMember).filter(FamilyMember.manager_id == current_user.id)
+    total = query.with_entities(func.count(FamilyMember.id)).scalar()
+
     family_members = (
-        db.query(FamilyMember)
-        .filter(FamilyMember.manager_id == current_user.id)
+        stats_service.with_member_summary(query)
+        .order_by(FamilyMember.created_at, FamilyMember.id)
         .offset(skip)
         .limit(limit)
         .all()
     )
 
-    return PaginatedResponse(
-        items=family_members,
-        total=total,
-        page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit,
+    # The summaries change with every event write, so the tag covers them
+    # and Last-Modified (member rows only) is not sent
+    headers = validator_headers(
+        make_etag(skip, limit, total, *map(_summary_key, family_members))
     )
+    if is_not_modified(headers, if_none_match, if_modified_since):
+        return not_modified(headers)
+
+    body = render_json(
+        PaginatedResponse,
+        {
+            "items": family_members,
+            "total": total,
+            "page": skip // limit + 1,
+            "size": limit,
+            "pages": (total + limit - 1) // limit,
+        },
+    )
+    return json_response(body, headers)
 
 
-@router.get("/{family_member_id}", response_model=FamilyMemberResponse)
+@router.get("/{family_member_id}", response_model=FamilyMemberSummary)
 def get_family_member(
     family_member_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
 ):
     """
-    Get a specific family member by ID.
+    Get a specific family member by ID, with a summary of their events.
+
+    Responses carry a weak ETag covering the member and the event summary.
 
     - **family_member_id**: UUID of the family member
     """
-    family_member = (
-        db.query(FamilyMember)
-        .filter(
+    cache_key = response_cache.key(
+        current_user.id, "family_member", {"family_member_id": family_member_id}
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        if is_not_modified(cached.headers, if_none_match, if_modified_since):
+            return not_modified(cached.headers)
+        return json_response(cached.body, {**cached.headers, "X-Cache": "HIT"})
+
+    family_member = stats_service.with_member_summary(
+        db.query(FamilyMember).filter(
             FamilyMember.id == family_member_id,
             FamilyMember.manager_id == current_user.id,
         )
-        .first()
-    )
+    ).first()
     if not family_member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Family member not found"
         )
-    return family_member
+
+    headers = validator_headers(make_etag(*_summary_key(family_member)))
+    if is_not_modified(headers, if_none_match, if_modified_since):
+        return not_modified(headers)
+
+    body = render_json(FamilyMemberSummary, family_member)
+    response_cache.set(cache_key, body, headers)
+    return json_response(body, {**headers, "X-Cache": "MISS"})
 
 
 @router.put("/{family_member_id}", response_model=FamilyMemberResponse)
@@ -139,8 +205,10 @@ def update_family_member(
     for field, value in update_data.items():
         setattr(family_member, field, value)
 
+    change_feed.publish(db, current_user.id, FAMILY_MEMBER, family_member.id, "updated")
     db.commit()
     db.refresh(family_member)
+    response_cache.invalidate_user(current_user.id)
     return family_member
 
 
@@ -169,5 +237,8 @@ def delete_family_member(
         )
 
     db.delete(family_member)
+    sync_service.record_deletion(db, FAMILY_MEMBER, family_member.id, current_user.id)
+    change_feed.publish(db, current_user.id, FAMILY_MEMBER, family_member.id, "deleted")
     db.commit()
+    response_cache.invalidate_user(current_user.id)
     return None
@@ -1,25 +1,108 @@
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Literal, Optional
+from datetime import datetime, timedelta, UTC
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    UploadFile,
+    File,
+    Form,
+    Header,
+    Query,
+)
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.query import Query as ORMQuery
+from sqlalchemy import func, or_, select
+from app.core.config import settings
 from app.db.session import get_db
+from app.schemas.attachment import AttachmentResponse
 from app.schemas.health_event import (
     HealthEventCreate,
     HealthEventUpdate,
     HealthEventResponse,
     HealthEventInDB,
     HealthEventFilter,
+    OccurrenceOverrideResponse,
+    OccurrenceOverrideUpdate,
     PaginatedResponse,
+    RecurrenceResponse,
+    RecurrenceRule,
+    sparse_page_model,
 )
+from app.models.family_member import FamilyMember
 from app.models.health_event import HealthEvent, EventType
 from app.models.user import User
+from app.services.attachment_service import attachment_service
+from app.services.event_reader import event_reader
 from app.services.file_service import file_service
+from app.services.health_score_service import health_score_service
+from app.services.recurrence_service import TIMELINE_COLUMNS, recurrence_service
+from app.services.reminder_service import reminder_service
+from app.services.response_cache import response_cache
+from app.utils.http_cache import (
+    is_not_modified,
+    json_response,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from app.utils.datetimes import naive_utc
+from app.utils.fieldsets import parse_fields
+from app.utils.serialization import render_json
+from app.services.change_feed import change_feed
+from app.services.stats_service import stats_service
+from app.services.sync_service import HEALTH_EVENT, sync_service
 from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
 
+# Fields that can be picked with ``fields=`` on the event list, and the
+# timeline columns each of them needs; attachment fields are read separately
+SPARSE_FIELD_COLUMNS = {
+    "id": ("id",),
+    "title": ("title",),
+    "event_type": ("event_type",),
+    "description": ("description",),
+    "date_time": ("date_time",),
+    "family_member_id": ("family_member_id",),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+    "series_id": ("series_id",),
+    "occurrence_at": ("occurrence_at",),
+    "attachments": (),
+    "file_paths": (),
+    "file_types": (),
+}
+ATTACHMENT_FIELDS = {"attachments", "file_paths", "file_types"}
+
+
+def _event_query(db: Session) -> ORMQuery:
+    """Query events with everything their representation needs."""
+    return db.query(HealthEvent).options(selectinload(HealthEvent.attachments))
+
+
+def _get_event(db: Session, event_id: UUID, user: User, action: str) -> HealthEvent:
+    """Load an event of one of the user's family members, or fail with 404/403."""
+    event = (
+        _event_query(db)
+        .options(joinedload(HealthEvent.family_member))
+        .filter(HealthEvent.id == event_id)
+        .first()
+    )
+    if not event:
+        raise HTTPException(status_code=404, detail="Health event not found")
+    if event.family_member.manager_id != user.id:
+        raise HTTPException(
+            status_code=403, detail=f"Not authorized to {action} this event"
+        )
+    return event
+
+
+def _reload_event(db: Session, event_id: UUID) -> HealthEvent:
+    """Read back an event after commit, attachments included."""
+    return _event_query(db).populate_existing().filter(HealthEvent.id == event_id).one()
+
 
 @router.post(
     "/", response_model=HealthEventResponse, summary="Create a new health event"
@@ -62,39 +145,30 @@ async def create_health_event(
         description=description,
         family_member_id=family_member_id,
         created_by_id=current_user.id,
-        date_time=date_time,
-        file_paths=[],  # Initialize empty lists for files
-        file_types=[],
+        date_time=naive_utc(date_time),
     )
+    db.add(db_event)
 
-    try:
-        db.add(db_event)
-        db.commit()
-        db.refresh(db_event)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    # Handle file uploads if provided
+    # Store the files first so the event and its attachments commit together
     if files:
         try:
-            file_paths = []
-            file_types = []
-            for file in files:
-                file_path = await file_service.save_file(file, str(db_event.id))
-                file_paths.append(file_path)
-                file_types.append(file.content_type)
-
-            db_event.file_paths = file_paths
-            db_event.file_types = file_types
-            db.commit()
-            db.refresh(db_event)
+            await attachment_service.add_files(db, db_event, files)
         except ValueError as e:
-            # If file upload fails, delete the created event
-            db.delete(db_event)
-            db.commit()
             raise HTTPException(status_code=400, detail=str(e))
 
-    return db_event
+    try:
+        db.flush()
+        event_id = db_event.id
+        stats_service.event_added(db, stats_service.event_key(db_event))
+        health_score_service.mark_stale(db, family_member_id)
+        reminder_service.sync_event(db, db_event)
+        change_feed.publish(db, current_user.id, HEALTH_EVENT, db_event.id, "created")
+        db.commit()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response_cache.invalidate_user(current_user.id)
+    return _reload_event(db, event_id)
 
 
 @router.get("/", response_model=PaginatedResponse, summary="List health events")
@@ -110,10 +184,36 @@ def get_health_events(
     start_date: Optional[datetime] = Query(None, description="Filter by start date"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date"),
     search: Optional[str] = Query(None, description="Search in title and description"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return for each event (id is "
+        "always included)",
+    ),
+    render: Literal["app", "db"] = Query(
+        "app",
+        description="Where the JSON body is built; 'db' has Postgres assemble "
+        "the whole page",
+    ),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
 ):
     """
     Get paginated list of health events with optional filtering.
 
+    Pass `fields` to receive only some fields of each event, e.g.
+    `fields=title,event_type,date_time` for a timeline; only the columns
+    behind them are read from the database.
+
+    Pass `render=db` to have Postgres build the whole JSON page, which takes
+    the serialization work off the API worker for heavy list views.
+
+    Recurring events are listed with their occurrences up to `end_date`, or
+    RECURRENCE_HORIZON_DAYS ahead; occurrences carry the `series_id` of
+    their event and the `occurrence_at` given by its rule.
+
+    Events are ordered by date, newest first. Responses carry a collection
+    ETag; send it back in `If-None-Match` to get a 304 when nothing changed.
+
     - **page**: Page number (1-based)
     - **size**: Number of items per page (1-100)
     - **event_type**: Filter by event type
@@ -121,44 +221,146 @@ def get_health_events(
     - **start_date**: Filter by start date
     - **end_date**: Filter by end date
     - **search**: Search in title and description
+    - **fields**: Fields to return, among id, title, event_type, description,
+      date_time, family_member_id, created_at, updated_at, series_id,
+      occurrence_at, attachments, file_paths and file_types
+    - **render**: `app` (default) or `db`
     """
-    # Build query
-    query = db.query(HealthEvent)
+    selected = None
+    if fields:
+        try:
+            selected = parse_fields(fields, SPARSE_FIELD_COLUMNS.keys())
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    # Only show events for family members managed by current user
-    query = query.join(HealthEvent.family_member).filter(
-        HealthEvent.family_member.has(manager_id=current_user.id)
+    params = {
+        "page": page,
+        "size": size,
+        "event_type": event_type,
+        "family_member_id": family_member_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "search": search,
+        "fields": ",".join(sorted(selected)) if selected else None,
+        "render": render,
+    }
+    cache_key = response_cache.key(current_user.id, "health_events", params)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        if is_not_modified(cached.headers, if_none_match, if_modified_since):
+            return not_modified(cached.headers)
+        return json_response(cached.body, {**cached.headers, "X-Cache": "HIT"})
+
+    # Stored events, and the occurrences of recurring ones within the window,
+    # with only the columns the filters, validators and fields need
+    columns = None
+    if selected is not None:
+        columns = {"family_member_id", "date_time", "updated_at"}
+        columns.update(
+            name for field in selected for name in SPARSE_FIELD_COLUMNS[field]
+        )
+        if event_type:
+            columns.add("event_type")
+        if search:
+            columns.update(("title", "description"))
+    now = datetime.now(UTC).replace(tzinfo=None)
+    events = recurrence_service.timeline(
+        start_date,
+        end_date or now + timedelta(days=settings.RECURRENCE_HORIZON_DAYS),
+        current_user.id,
+        columns,
     )
 
-    # Apply filters
+    # Only show events for family members managed by current user
+    conditions = [FamilyMember.manager_id == current_user.id]
     if event_type:
-        query = query.filter(HealthEvent.event_type == event_type)
+        conditions.append(events.c.event_type == event_type)
     if family_member_id:
-        query = query.filter(HealthEvent.family_member_id == family_member_id)
+        conditions.append(events.c.family_member_id == family_member_id)
     if start_date:
-        query = query.filter(HealthEvent.date_time >= start_date)
+        conditions.append(events.c.date_time >= start_date)
     if end_date:
-        query = query.filter(HealthEvent.date_time <= end_date)
+        conditions.append(events.c.date_time <= end_date)
     if search:
-        search_filter = or_(
-            HealthEvent.title.ilike(f"%{search}%"),
-            HealthEvent.description.ilike(f"%{search}%"),
+        conditions.append(
+            or_(
+                events.c.title.ilike(f"%{search}%"),
+                events.c.description.ilike(f"%{search}%"),
+            )
         )
-        query = query.filter(search_filter)
 
-    # Get total count
-    total = query.count()
+    def filtered(*columns):
+        return (
+            select(*columns)
+            .select_from(events)
+            .join(FamilyMember, FamilyMember.id == events.c.family_member_id)
+            .where(*conditions)
+        )
+
+    # Get total count and the newest modification; together they identify the
+    # current state of the filtered collection. A delete leaves the newest
+    # modification as it was, so it is not sent as Last-Modified
+    total, last_modified = db.execute(
+        filtered(func.count(events.c.id), func.max(events.c.updated_at))
+    ).one()
+    headers = validator_headers(make_etag(sorted(params.items()), total, last_modified))
+    if is_not_modified(headers, if_none_match, if_modified_since):
+        return not_modified(headers)
 
     # Calculate pagination
     total_pages = (total + size - 1) // size
     offset = (page - 1) * size
 
-    # Get paginated results
-    events = query.offset(offset).limit(size).all()
+    if render == "db":
+        body = event_reader.page_json(
+            db,
+            filtered(events.c.id),
+            [
+                field
+                for field in HealthEventResponse.model_fields
+                if selected is None or field in selected
+            ],
+            offset,
+            size,
+            columns=events.c,
+            total=total,
+            page=page,
+            size=size,
+            pages=total_pages,
+        )
+        response_cache.set(cache_key, body, headers)
+        return json_response(body, {**headers, "X-Cache": "MISS"})
+
+    # Get paginated results as plain rows, the ORM is not needed to render them
+    if selected is None:
+        schema = PaginatedResponse
+        names = TIMELINE_COLUMNS
+    else:
+        schema = sparse_page_model(selected)
+        names = dict.fromkeys(
+            name for field in selected for name in SPARSE_FIELD_COLUMNS[field]
+        )
+    items = event_reader.fetch(
+        db,
+        filtered(*(events.c[name] for name in names))
+        .order_by(events.c.date_time.desc(), events.c.id)
+        .offset(offset)
+        .limit(size),
+        with_attachments=selected is None or bool(selected & ATTACHMENT_FIELDS),
+    )
 
-    return PaginatedResponse(
-        items=events, total=total, page=page, size=size, pages=total_pages
+    body = render_json(
+        schema,
+        {
+            "items": items,
+            "total": total,
+            "page": page,
+            "size": size,
+            "pages": total_pages,
+        },
     )
+    response_cache.set(cache_key, body, headers)
+    return json_response(body, {**headers, "X-Cache": "MISS"})
 
 
 @router.get(
@@ -168,23 +370,34 @@ def get_health_event(
     event_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
 ):
     """
     Get a specific health event by ID.
 
+    Responses carry a weak ETag and `Last-Modified` derived from `updated_at`.
+
     - **event_id**: UUID of the health event
     """
-    event = db.query(HealthEvent).filter(HealthEvent.id == event_id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Health event not found")
+    cache_key = response_cache.key(
+        current_user.id, "health_event", {"event_id": event_id}
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        if is_not_modified(cached.headers, if_none_match, if_modified_since):
+            return not_modified(cached.headers)
+        return json_response(cached.body, {**cached.headers, "X-Cache": "HIT"})
 
-    # Check if user has access to this event
-    if event.family_member.manager_id != current_user.id:
-        raise HTTPException(
-            status_code=403, detail="Not authorized to access this event"
-        )
+    event = _get_event(db, event_id, current_user, "access")
 
-    return event
+    headers = validator_headers(make_etag(event.id, event.updated_at), event.updated_at)
+    if is_not_modified(headers, if_none_match, if_modified_since):
+        return not_modified(headers)
+
+    body = render_json(HealthEventResponse, event)
+    response_cache.set(cache_key, body, headers)
+    return json_response(body, {**headers, "X-Cache": "MISS"})
 
 
 @router.put(
@@ -211,17 +424,10 @@ async def update_health_event(
     - **family_member_id**: New family member UUID (optional)
     - **files**: New file attachments (optional)
     """
-    event = db.query(HealthEvent).filter(HealthEvent.id == event_id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Health event not found")
-
-    # Check if user has access to this event
-    if event.family_member.manager_id != current_user.id:
-        raise HTTPException(
-            status_code=403, detail="Not authorized to modify this event"
-        )
+    event = _get_event(db, event_id, current_user, "modify")
 
     # Update event data
+    stats_key = stats_service.event_key(event)
     update_data = HealthEventUpdate(
         title=title,
         event_type=event_type,
@@ -229,33 +435,32 @@ async def update_health_event(
         family_member_id=family_member_id,
     )
 
-    for field, value in update_data.model_dump(exclude_unset=True).items():
+    for field, value in update_data.model_dump(exclude_none=True).items():
         setattr(event, field, value)
+    recurrence_service.event_updated(db, event)
 
-    # Handle file uploads if provided
+    # Replace the attachments if files are provided; re-uploaded files that
+    # are already stored are not written again
+    unused_files = []
     if files:
+        previous = list(event.attachments)
         try:
-            # Delete old files if they exist
-            if event.file_paths:
-                for file_path in event.file_paths:
-                    await file_service.delete_file(file_path)
-
-            # Save new files
-            file_paths = []
-            file_types = []
-            for file in files:
-                file_path = await file_service.save_file(file, str(event_id))
-                file_paths.append(file_path)
-                file_types.append(file.content_type)
-
-            event.file_paths = file_paths
-            event.file_types = file_types
+            await attachment_service.add_files(db, event, files)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
-
+        unused_files = attachment_service.remove(db, event, previous)
+        event.updated_at = datetime.now(UTC)
+
+    stats_service.event_changed(db, stats_key, stats_service.event_key(event))
+    health_score_service.mark_stale(db, stats_key.family_member_id)
+    if event.family_member_id != stats_key.family_member_id:
+        health_score_service.mark_stale(db, event.family_member_id)
+    reminder_service.sync_event(db, event)
+    attachment_service.delete_later(db, unused_files)
+    change_feed.publish(db, current_user.id, HEALTH_EVENT, event.id, "updated")
     db.commit()
-    db.refresh(event)
-    return event
+    response_cache.invalidate_user(current_user.id)
+    return _reload_event(db, event_id)
 
 
 @router.delete("/{event_id}", summary="Delete health event")
@@ -269,21 +474,222 @@ async def delete_health_event(
 
     - **event_id**: UUID of the health event to delete
     """
-    event = db.query(HealthEvent).filter(HealthEvent.id == event_id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Health event not found")
+    event = _get_event(db, event_id, current_user, "delete")
 
-    # Check if user has access to this event
-    if event.family_member.manager_id != current_user.id:
-        raise HTTPException(
-            status_code=403, detail="Not authorized to delete this event"
+    stats_key = stats_service.event_key(event)
+    paths = [attachment.storage_path for attachment in event.attachments]
+    db.delete(event)
+    db.flush()
+    unused_files = attachment_service.unreferenced(db, paths)
+    stats_service.event_removed(db, stats_key)
+    health_score_service.mark_stale(db, stats_key.family_member_id)
+    reminder_service.cancel_event(db, event.id)
+    recurrence_service.remove_rule(db, event.id)
+    sync_service.record_deletion(db, HEALTH_EVENT, event.id, current_user.id)
+    attachment_service.delete_later(db, unused_files)
+    change_feed.publish(db, current_user.id, HEALTH_EVENT, event.id, "deleted")
+    db.commit()
+    response_cache.invalidate_user(current_user.id)
+    return {"message": "Health event deleted successfully"}
+
+
+@router.post(
+    "/{event_id}/attachments",
+    response_model=List[AttachmentResponse],
+    status_code=201,
+    summary="Add attachments to a health event",
+)
+async def add_attachments(
+    event_id: UUID,
+    *,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    files: List[UploadFile] = File(...),
+):
+    """
+    Attach files to a health event, keeping its existing attachments.
+
+    - **event_id**: UUID of the health event
+    - **files**: File attachments to add (images or PDFs)
+    """
+    event = _get_event(db, event_id, current_user, "modify")
+
+    try:
+        attachments = await attachment_service.add_files(db, event, files)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    event.updated_at = datetime.now(UTC)
+    change_feed.publish(db, current_user.id, HEALTH_EVENT, event.id, "updated")
+    db.commit()
+    response_cache.invalidate_user(current_user.id)
+    return attachments
+
+
+@router.delete(
+    "/{event_id}/attachments/{attachment_id}",
+    status_code=204,
+    summary="Remove an attachment from a health event",
+)
+async def remove_attachment(
+    event_id: UUID,
+    attachment_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Remove a single attachment from a health event.
+
+    - **event_id**: UUID of the health event
+    - **attachment_id**: UUID of the attachment to remove
+    """
+    event = _get_event(db, event_id, current_user, "modify")
+    attachment = next((a for a in event.attachments if a.id == attachment_id), None)
+    if attachment is None:
+        raise HTTPException(status_code=404, detail="Attachment not found")
+
+    unused_files = attachment_service.remove(db, event, [attachment])
+    event.updated_at = datetime.now(UTC)
+    attachment_service.delete_later(db, unused_files)
+    change_feed.publish(db, current_user.id, HEALTH_EVENT, event.id, "updated")
+    db.commit()
+    response_cache.invalidate_user(current_user.id)
+    return None
+
+
+@router.get(
+    "/{event_id}/recurrence",
+    response_model=RecurrenceResponse,
+    summary="Get the recurrence rule of a health event",
+)
+def get_recurrence(
+    event_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the recurrence rule of a health event.
+
+    - **event_id**: UUID of the health event
+    """
+    _get_event(db, event_id, current_user, "access")
+    rule = recurrence_service.get_rule(db, event_id)
+    if rule is None:
+        raise HTTPException(status_code=404, detail="Health event is not recurring")
+    return rule
+
+
+@router.put(
+    "/{event_id}/recurrence",
+    response_model=RecurrenceResponse,
+    summary="Make a health event recurring",
+)
+def set_recurrence(
+    event_id: UUID,
+    rule_in: RecurrenceRule,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Set or replace the recurrence rule of a health event.
+
+    The event is the first occurrence. The others are not stored: event
+    lists expand them for the dates they show. Overrides of occurrences the
+    new rule no longer produces are dropped.
+
+    - **event_id**: UUID of the health event
+    - **frequency**: DAILY, WEEKLY or MONTHLY
+    - **interval**: Repeat every `interval` days, weeks or months
+    - **count**: Number of occurrences, the event included (optional)
+    - **until**: Date and time of the last possible occurrence (optional)
+    """
+    event = _get_event(db, event_id, current_user, "modify")
+    try:
+        rule = recurrence_service.set_rule(
+            db,
+            event,
+            rule_in.frequency,
+            rule_in.interval,
+            rule_in.count,
+            rule_in.until,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # Delete associated files if they exist
-    if event.file_paths:
-        for file_path in event.file_paths:
-            await file_service.delete_file(file_path)
+    event.updated_at = datetime.now(UTC)
+    change_feed.publish(db, current_user.id, HEALTH_EVENT, event.id, "updated")
+    db.commit()
+    response_cache.invalidate_user(current_user.id)
+    return rule
 
-    db.delete(event)
+
+@router.delete(
+    "/{event_id}/recurrence",
+    status_code=204,
+    summary="Stop a health event from recurring",
+)
+def delete_recurrence(
+    event_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Remove the recurrence rule of a health event, and its overrides.
+
+    - **event_id**: UUID of the health event
+    """
+    event = _get_event(db, event_id, current_user, "modify")
+    recurrence_service.remove_rule(db, event_id)
+    event.updated_at = datetime.now(UTC)
+    change_feed.publish(db, current_user.id, HEALTH_EVENT, event.id, "updated")
     db.commit()
-    return {"message": "Health event deleted successfully"}
+    response_cache.invalidate_user(current_user.id)
+    return None
+
+
+@router.put(
+    "/{event_id}/occurrences/{occurrence_at}",
+    response_model=OccurrenceOverrideResponse,
+    summary="Change or cancel one occurrence of a recurring event",
+)
+def override_occurrence(
+    event_id: UUID,
+    occurrence_at: datetime,
+    override_in: OccurrenceOverrideUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Change or cancel a single occurrence of a recurring health event.
+
+    Fields left out keep the values of the event. Sending the override
+    again replaces it.
+
+    - **event_id**: UUID of the recurring health event
+    - **occurrence_at**: Date and time the rule gives the occurrence
+    - **title**: Title of this occurrence (optional)
+    - **description**: Description of this occurrence (optional)
+    - **date_time**: New date and time of this occurrence (optional)
+    - **cancelled**: Remove this occurrence from the series
+    """
+    event = _get_event(db, event_id, current_user, "modify")
+    rule = recurrence_service.get_rule(db, event_id)
+    if rule is None:
+        raise HTTPException(status_code=404, detail="Health event is not recurring")
+    try:
+        override = recurrence_service.override(
+            db,
+            rule,
+            occurrence_at,
+            title=override_in.title,
+            description=override_in.description,
+            date_time=override_in.date_time,
+            cancelled=override_in.cancelled,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    change_feed.publish(db, current_user.id, HEALTH_EVENT, event.id, "updated")
+    db.commit()
+    response_cache.invalidate_user(current_user.id)
+    return override
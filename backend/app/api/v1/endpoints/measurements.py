@@ -0,0 +1,205 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import get_db
+from app.models.family_member import FamilyMember
+from app.models.measurement import METRIC_UNITS, Metric
+from app.models.user import User
+from app.schemas.measurement import (
+    MeasurementIngest,
+    MeasurementIngestResponse,
+    MeasurementSeriesResponse,
+)
+from app.services.ingest_buffer import IngestBufferFullError, ingest_buffer
+from app.services.measurement_service import measurement_service
+from app.utils.decompression import UnsupportedEncodingError, decompress
+from app.utils.http_cache import json_response
+from app.utils.serialization import render_json
+from app.api.v1.endpoints.auth import get_current_user
+
+router = APIRouter()
+
+
+def _check_member(db: Session, family_member_id: UUID, user: User) -> None:
+    """Fail with 404 unless the family member is managed by the user."""
+    managed = db.scalar(
+        select(FamilyMember.id).where(
+            FamilyMember.id == family_member_id,
+            FamilyMember.manager_id == user.id,
+        )
+    )
+    if managed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Family member not found"
+        )
+
+
+async def _read_body(request: Request, max_size: int) -> bytes:
+    """Read the raw request body, failing with 413 past ``max_size`` bytes."""
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Body larger than {max_size} bytes",
+    )
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size:
+        raise too_large
+    # Content-Length may be missing (chunked) or wrong, so count as we read
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_size:
+            raise too_large
+    return bytes(body)
+
+
+@router.post(
+    "/",
+    response_model=MeasurementIngestResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Store measurement readings",
+)
+def ingest_measurements(
+    measurements_in: MeasurementIngest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Store a batch of vital readings of one family member.
+
+    Readings are written with a single upsert; sending a reading again for
+    the same metric and time replaces its value.
+
+    - **family_member_id**: UUID of the family member
+    - **readings**: Readings with `metric`, `ts` and `value`, in the unit of
+      the metric (kg, mmHg, mmol/L, bpm, °C or %)
+    """
+    if len(measurements_in.readings) > settings.MEASUREMENTS_MAX_READINGS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Too many readings, at most "
+            f"{settings.MEASUREMENTS_MAX_READINGS} per request",
+        )
+    _check_member(db, measurements_in.family_member_id, current_user)
+
+    stored = measurement_service.ingest(
+        db, measurements_in.family_member_id, measurements_in.readings
+    )
+    db.commit()
+    return MeasurementIngestResponse(stored=stored)
+
+
+@router.post(
+    "/ingest",
+    response_model=MeasurementIngestResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Ingest device readings through the group commit buffer",
+)
+async def ingest_device_measurements(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    content_encoding: Optional[str] = Header(None),
+):
+    """
+    Ingest a batch of high-frequency device readings of one family member.
+
+    Takes the same body as `POST /measurements/`, optionally compressed
+    with `Content-Encoding: gzip` (or `zstd`/`br` when the server supports
+    them). Batches from all clients are buffered and written together; the
+    response is only sent once the batch is committed. When the buffer
+    stays full the server answers 503 with `Retry-After`. Bodies larger
+    than INGEST_MAX_BODY_BYTES, before or after decoding, are rejected.
+    """
+    raw = await _read_body(request, settings.INGEST_MAX_BODY_BYTES)
+    try:
+        body = decompress(raw, content_encoding, settings.INGEST_MAX_BODY_BYTES)
+    except UnsupportedEncodingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    try:
+        measurements_in = MeasurementIngest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    if len(measurements_in.readings) > settings.MEASUREMENTS_MAX_READINGS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Too many readings, at most "
+            f"{settings.MEASUREMENTS_MAX_READINGS} per request",
+        )
+    await run_in_threadpool(
+        _check_member, db, measurements_in.family_member_id, current_user
+    )
+    # Don't hold a pooled database connection while waiting for the flush
+    db.close()
+
+    rows = measurement_service.rows(
+        measurements_in.family_member_id, measurements_in.readings
+    )
+    try:
+        stored = await ingest_buffer.submit(rows)
+    except IngestBufferFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+    return MeasurementIngestResponse(stored=stored)
+
+
+@router.get(
+    "/",
+    response_model=MeasurementSeriesResponse,
+    summary="Get a downsampled measurement series",
+)
+def get_measurements(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    family_member_id: UUID = Query(..., description="Family member UUID"),
+    metric: Metric = Query(..., description="Metric to read"),
+    start: Optional[datetime] = Query(None, description="Start of the range"),
+    end: Optional[datetime] = Query(None, description="End of the range"),
+    points: int = Query(
+        300,
+        ge=1,
+        le=settings.MEASUREMENTS_MAX_POINTS,
+        description="Maximum number of points to return",
+    ),
+):
+    """
+    Get the readings of a metric, downsampled for charting.
+
+    The range is cut into `points` equal time buckets, and each non-empty
+    bucket is returned with the min, max and average of its readings, so
+    years of readings come back as a few hundred points.
+
+    - **family_member_id**: UUID of the family member
+    - **metric**: Metric to read
+    - **start**: Start of the range (defaults to the first reading)
+    - **end**: End of the range (defaults to the last reading)
+    - **points**: Maximum number of buckets to return
+    """
+    _check_member(db, family_member_id, current_user)
+
+    buckets = measurement_service.downsample(
+        db, family_member_id, metric.value, points, start, end
+    )
+    body = render_json(
+        MeasurementSeriesResponse,
+        {
+            "family_member_id": family_member_id,
+            "metric": metric,
+            "unit": METRIC_UNITS[metric],
+            "points": buckets,
+        },
+    )
+    return json_response(body, {})
@@ -0,0 +1,52 @@
+from datetime import timedelta
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.session import get_db
+from app.models.user import User
+from app.schemas.metrics import CacheStatsResponse, JobStatsResponse
+from app.services.job_queue import job_queue
+from app.services.response_cache import response_cache
+from app.api.v1.endpoints.auth import get_current_user
+
+router = APIRouter()
+
+
+def get_metrics_user(current_user: User = Depends(get_current_user)) -> User:
+    """Only users listed in METRICS_ADMIN_EMAILS may read server metrics."""
+    if current_user.email not in settings.METRICS_ADMIN_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to read metrics"
+        )
+    return current_user
+
+
+@router.get("/cache", response_model=CacheStatsResponse, summary="Cache statistics")
+def get_cache_stats(current_user: User = Depends(get_metrics_user)):
+    """
+    Get response cache statistics of this API process.
+
+    Hit and miss counters are per process; entries and memory are reported by
+    the configured backend. Restricted to METRICS_ADMIN_EMAILS.
+    """
+    return response_cache.stats()
+
+
+@router.get("/jobs", response_model=JobStatsResponse, summary="Job queue statistics")
+def get_job_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_metrics_user),
+):
+    """
+    Get background job queue depth and latency, per job kind.
+
+    Depth counts the jobs queued, due, running and failed right now. Latency
+    covers the jobs that finished within the last `window_seconds`: the wait
+    from being due to being started, and the run time. Restricted to
+    METRICS_ADMIN_EMAILS.
+    """
+    window = settings.JOB_METRICS_WINDOW_SECONDS
+    return JobStatsResponse(
+        window_seconds=window,
+        kinds=job_queue.stats(db, timedelta(seconds=window)),
+    )
@@ -0,0 +1,96 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.session import get_db
+from app.models.user import User
+from app.schemas.sync import SyncChangesResponse
+from app.services.change_feed import TooManyConnectionsError, change_feed
+from app.services.sync_service import (
+    ChangeCursor,
+    CursorExpiredError,
+    sync_service,
+)
+from app.utils.serialization import render_json
+from app.utils.http_cache import json_response
+from app.api.v1.endpoints.auth import get_current_user
+
+router = APIRouter()
+
+
+@router.get("/changes", response_model=SyncChangesResponse)
+def get_changes(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Cursor of the previous sync"),
+    limit: int = Query(500, ge=1, le=settings.SYNC_MAX_PAGE_SIZE),
+):
+    """
+    Get the family members and health events that changed since a cursor.
+
+    Start without a cursor to receive everything, then pass back the returned
+    `cursor` on the next call. Keep calling while `has_more` is true. When the
+    cursor is older than the tombstone retention period the server answers
+    410 and the client must discard its local copy and sync from scratch.
+
+    - **cursor**: Opaque cursor returned by the previous call
+    - **limit**: Maximum number of changes to return
+    """
+    try:
+        position = ChangeCursor.decode(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+    try:
+        changes = sync_service.get_changes(db, current_user.id, position, limit)
+    except CursorExpiredError:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Cursor expired, a full resync is required",
+        )
+
+    body = render_json(
+        SyncChangesResponse,
+        {
+            "family_members": changes.family_members,
+            "health_events": changes.health_events,
+            "cursor": changes.cursor.encode(),
+            "has_more": changes.has_more,
+        },
+    )
+    return json_response(body, {"Cache-Control": "no-store"})
+
+
+@router.get("/events")
+async def stream_changes(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream change notifications of the current user as server-sent events.
+
+    Every committed write to a family member or health event of the user is
+    sent as a `change` event with `entity_type`, `entity_id` and `action`.
+    An `action` of `resync` means notifications may have been missed; the
+    client should then catch up through `/sync/changes`. Comment lines are
+    sent as heartbeats while idle.
+    """
+    user_id = current_user.id
+    # Don't hold a pooled database connection for the life of the stream
+    db.close()
+
+    try:
+        subscription = await change_feed.subscribe(user_id)
+    except TooManyConnectionsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e)
+        )
+
+    return StreamingResponse(
+        change_feed.stream(subscription, settings.REALTIME_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
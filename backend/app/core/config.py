@@ -28,6 +28,95 @@ class Settings(BaseSettings):
     ALLOWED_IMAGE_TYPES: list = ["image/jpeg", "image/png"]
     ALLOWED_DOC_TYPES: list = ["application/pdf"]
 
+    # API worker processes; uvicorn and gunicorn read the same variable
+    WEB_CONCURRENCY: int = 1
+
+    # Response cache settings
+    CACHE_BACKEND: str = "memory"  # "memory" (single worker only), "redis" or "none"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB
+
+    # Users allowed to read the /metrics endpoints
+    METRICS_ADMIN_EMAILS: list = []
+
+    # Response compression settings
+    COMPRESSION_MINIMUM_SIZE: int = 500  # bytes
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Delta sync settings
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 90
+    SYNC_MAX_PAGE_SIZE: int = 1000
+
+    # Health event partitioning settings
+    HEALTH_EVENTS_MANAGE_PARTITIONS: bool = True  # create partitions at startup
+    HEALTH_EVENTS_PARTITIONS_AHEAD: int = 1  # years
+
+    # Health score settings
+    HEALTH_SCORE_BATCH_SIZE: int = 1000  # members scored per query
+
+    # Event trend analysis settings
+    TRENDS_BATCH_SIZE: int = 1000  # members analyzed per query
+    TRENDS_MAX_SECONDS: int = 1800  # a run stops after this and resumes next time
+
+    # Measurement settings
+    MEASUREMENTS_MAX_READINGS: int = 10000  # readings per ingest request
+    MEASUREMENTS_MAX_POINTS: int = 2000  # points per downsampled series
+
+    # Device ingestion settings
+    INGEST_FLUSH_READINGS: int = 5000  # group commit once this many are pending
+    INGEST_FLUSH_INTERVAL_MS: int = 20  # or once the oldest batch waited this long
+    INGEST_MAX_PENDING_READINGS: int = 100000  # buffered and in flight, per node
+    INGEST_SUBMIT_TIMEOUT_SECONDS: float = 2.0  # wait for buffer room, then 503
+    INGEST_MAX_BODY_BYTES: int = 8 * 1024 * 1024  # as sent and once decompressed
+
+    # Assessment settings
+    ASSESSMENT_MAX_SUBMISSIONS: int = 500  # answer sets per submit request
+
+    # Recurring event settings
+    RECURRENCE_HORIZON_DAYS: int = 365  # occurrences listed ahead without end_date
+
+    # Medication reminder settings
+    REMINDER_WINDOW_SECONDS: int = 900  # pending reminders held in memory
+    REMINDER_REFRESH_SECONDS: int = 60  # reload of the window, i.e. max lateness
+    REMINDER_BATCH_SIZE: int = 500  # reminders claimed and sent together
+    REMINDER_RETRY_SECONDS: int = 30  # after a failed delivery
+
+    # Background job settings
+    JOB_LEASE_SECONDS: int = 600  # a running job is requeued after this long
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_BACKOFF_BASE_SECONDS: int = 10  # doubled after every failed attempt
+    JOB_BACKOFF_MAX_SECONDS: int = 3600
+    JOB_POLL_SECONDS: float = 1.0  # idle workers look for jobs this often
+    JOB_MAINTENANCE_SECONDS: int = 60  # expired lease and purge checks
+    JOB_RETENTION_SECONDS: int = 86400  # finished jobs kept for metrics
+    JOB_METRICS_WINDOW_SECONDS: int = 300  # latency of jobs finished this recently
+
+    # Outbox relay settings
+    OUTBOX_BATCH_SIZE: int = 500  # messages delivered to a consumer at once
+    OUTBOX_POLL_SECONDS: float = 0.5  # idle relays look for messages this often
+    OUTBOX_RETRY_BASE_SECONDS: int = 5  # doubled after every failed delivery
+    OUTBOX_RETRY_MAX_SECONDS: int = 300
+    OUTBOX_PURGE_SECONDS: int = 300  # delivered messages are deleted this often
+    OUTBOX_RETENTION_SECONDS: int = 86400  # kept this long without consumers
+    OUTBOX_WEBHOOK_URLS: list = []  # each receives every change, in batches
+    OUTBOX_WEBHOOK_SECRET: str = ""  # signs webhook bodies when set
+    OUTBOX_WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+
+    # Batch endpoint settings
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_MAX_CONCURRENCY: int = 4  # concurrent reads per batch
+
+    # Real-time change push settings
+    REALTIME_CHANNEL: str = "sesame_changes"
+    REALTIME_MAX_CONNECTIONS: int = 1000  # per API node
+    REALTIME_MAX_CONNECTIONS_PER_USER: int = 5
+    REALTIME_HEARTBEAT_SECONDS: int = 15
+    REALTIME_QUEUE_SIZE: int = 100  # pending messages per connection
+
     @property
     def get_database_url(self) -> str:
         if self.SQLALCHEMY_DATABASE_URI:
@@ -0,0 +1,72 @@
+"""Detection of implicit relationship loads and N+1 query patterns.
+
+Relationships are configured with ``lazy="raise"``, so every query states
+the loader options it needs. The guard installed by :func:`install` fails
+loudly on the remaining ways of issuing queries per row: lazy loads of
+relationships configured otherwise, and the same SELECT repeated within one
+request. It is meant for tests, where every request runs through it.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+GUARD_KEY = "query_guard"
+
+# Identical SELECTs allowed per request before it counts as an N+1 pattern
+DEFAULT_THRESHOLD = 3
+
+
+class QueryPatternError(AssertionError):
+    """A request issued queries per row instead of loading them up front."""
+
+
+def install(session: Session, threshold: int = DEFAULT_THRESHOLD) -> None:
+    """Start checking the ORM queries executed by ``session``."""
+    session.info[GUARD_KEY] = (threshold, Counter())
+    event.listen(session, "do_orm_execute", _check)
+
+
+def reset(session: Session) -> None:
+    """Forget the queries seen so far, e.g. at the start of a request."""
+    guard = session.info.get(GUARD_KEY)
+    if guard is not None:
+        guard[1].clear()
+
+
+def _check(state: ORMExecuteState) -> None:
+    if not state.is_select:
+        return
+    if state.lazy_loaded_from is not None:
+        raise QueryPatternError(
+            f"Lazy load issued for {state.lazy_loaded_from.class_.__name__}; "
+            "add a loader option to the query"
+        )
+
+    threshold, counts = state.session.info[GUARD_KEY]
+    statement = str(state.statement)
+    counts[statement] += 1
+    if counts[statement] > threshold:
+        raise QueryPatternError(
+            f"Statement executed {counts[statement]} times in one request, "
+            f"likely an N+1 pattern:\n{statement}"
+        )
+
+
+@contextmanager
+def record_statements(engine: Engine) -> Iterator[List[str]]:
+    """Collect the SQL statements sent through ``engine`` in the block."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
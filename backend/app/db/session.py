@@ -1,3 +1,4 @@
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -6,8 +7,18 @@ engine = create_engine(settings.get_database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# Scope key under which a batch request hands its session to sub-requests
+BATCH_SESSION_KEY = "sesame.db_session"
+
+
 # Dependency
-def get_db():
+def get_db(request: Request):
+    shared = request.scope.get(BATCH_SESSION_KEY)
+    if shared is not None:
+        # Closed by the batch request that owns it
+        yield shared
+        return
+
     db = SessionLocal()
     try:
         yield db
@@ -4,16 +4,54 @@ from pathlib import Path
 # Add the parent directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from app.api.v1 import api_router
+from app.middleware.compression import CompressionMiddleware
 from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.change_feed import change_feed
+from app.services.ingest_buffer import ingest_buffer
+from app.services.partition_service import partition_service
+from app.utils.serialization import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+def create_partitions():
+    db = SessionLocal()
+    try:
+        created = partition_service.ensure_partitions(db)
+        db.commit()
+        if created:
+            logger.info("Created health event partitions: %s", ", ".join(created))
+    except Exception:
+        # Rows still land in the default partition, so keep serving
+        logger.exception("Could not create health event partitions")
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.HEALTH_EVENTS_MANAGE_PARTITIONS:
+        await run_in_threadpool(create_partitions)
+    yield
+    await ingest_buffer.stop()
+    await change_feed.stop()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     version="1.0.0",
     description="Sesame Health API - Version 1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Set up CORS middleware
@@ -25,6 +63,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses according to Accept-Encoding (zstd/brotli/gzip)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+)
+
 # Include API router with version prefix
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
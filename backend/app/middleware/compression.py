@@ -0,0 +1,246 @@
+import zlib
+from typing import Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Content types whose payload is already compressed; compressing them again
+# only burns CPU
+INCOMPRESSIBLE_TYPES = {
+    "application/gzip",
+    "application/pdf",
+    "application/zip",
+    "application/zstd",
+    "application/x-brotli",
+    "application/octet-stream",
+}
+INCOMPRESSIBLE_PREFIXES = ("image/", "audio/", "video/", "font/woff")
+COMPRESSIBLE_IMAGE_TYPES = {"image/svg+xml"}
+
+
+class Encoder:
+    """Incremental encoder for one response body."""
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def flush(self) -> bytes:
+        """Emit everything compressed so far so a streamed chunk is decodable."""
+        raise NotImplementedError
+
+    def finish(self) -> bytes:
+        raise NotImplementedError
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into ``{coding: qvalue}``."""
+    codings: Dict[str, float] = {}
+    for item in value.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, param_value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def negotiate_encoding(accept_encoding: str, available: List[str]) -> Optional[str]:
+    """Pick the best coding in ``available`` (listed by server preference)."""
+    codings = parse_accept_encoding(accept_encoding)
+    wildcard = codings.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = codings.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    if not media_type or media_type in INCOMPRESSIBLE_TYPES:
+        return False
+    if media_type in COMPRESSIBLE_IMAGE_TYPES:
+        return True
+    return not media_type.startswith(INCOMPRESSIBLE_PREFIXES)
+
+
+class CompressionMiddleware:
+    """Compress responses with the best coding the client accepts.
+
+    Supports zstd and brotli when the optional ``zstandard``/``brotli``
+    packages are installed, and gzip always. Bodies smaller than
+    ``minimum_size`` and already-compressed media types are sent as-is;
+    streaming responses are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders: Dict[str, Callable[[], Encoder]] = {}
+        if brotli is not None:
+            self.encoders["br"] = lambda: BrotliEncoder(brotli_quality)
+        if zstandard is not None:
+            self.encoders["zstd"] = lambda: ZstdEncoder(zstd_level)
+        self.encoders["gzip"] = lambda: GzipEncoder(gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        coding = negotiate_encoding(accept_encoding, list(self.encoders))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send, coding, self.encoders[coding], self.minimum_size
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        send: Send,
+        coding: str,
+        encoder_factory: Callable[[], Encoder],
+        minimum_size: int,
+    ):
+        self._send = send
+        self.coding = coding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.encoder: Optional[Encoder] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Hold the start message until the first body chunk tells us
+            # whether the response is worth compressing
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            )
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.passthrough:
+            await self._send_start()
+            await self._send(message)
+            return
+
+        if self.encoder is None:
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self._send_start()
+                await self._send(message)
+                return
+
+            self.encoder = self.encoder_factory()
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.coding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.encoder.compress(body) + self.encoder.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send_start()
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            await self._send_start()
+
+        if more_body:
+            # Flush per chunk so streamed data reaches the client promptly
+            chunk = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            chunk = self.encoder.compress(body) + self.encoder.finish()
+        await self._send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
+
+    async def _send_start(self) -> None:
+        if self.start_message is not None:
+            await self._send(self.start_message)
+            self.start_message = None
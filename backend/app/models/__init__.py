@@ -1,5 +1,39 @@
 from app.models.health_event import HealthEvent, EventType
 from app.models.family_member import FamilyMember
+from app.models.user import User
+from app.models.attachment import Attachment
+from app.models.assessment import AssessmentResult, TestScale
+from app.models.event_stats import MemberEventTypeStats, MemberMonthlyEventStats
+from app.models.event_trends import MemberEventTrend
+from app.models.health_score import StaleHealthScore
+from app.models.job import Job
+from app.models.measurement import Measurement, Metric
+from app.models.outbox import OutboxMessage
+from app.models.recurrence import EventRecurrence, OccurrenceOverride
+from app.models.reminder import MedicationReminder
+from app.models.sync import Tombstone
+from app.models.watermark import Watermark
 
 # Import all models here to ensure they are registered with SQLAlchemy
-__all__ = ["HealthEvent", "EventType", "FamilyMember"]
+__all__ = [
+    "HealthEvent",
+    "EventType",
+    "FamilyMember",
+    "User",
+    "Attachment",
+    "TestScale",
+    "AssessmentResult",
+    "MemberEventTypeStats",
+    "MemberMonthlyEventStats",
+    "MemberEventTrend",
+    "StaleHealthScore",
+    "Job",
+    "Measurement",
+    "Metric",
+    "OutboxMessage",
+    "EventRecurrence",
+    "OccurrenceOverride",
+    "MedicationReminder",
+    "Tombstone",
+    "Watermark",
+]
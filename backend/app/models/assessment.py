@@ -0,0 +1,77 @@
+from datetime import datetime, UTC
+from typing import Any, Dict, Optional
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+import uuid
+
+from app.db.base_class import Base
+
+
+class TestScale(Base):
+    """A questionnaire or health assessment, defined as data.
+
+    ``definition`` holds the items, their answer options and scores, the
+    subscales and the interpretation bands (see
+    ``app.schemas.assessment.TestScaleDefinition``). Every change of the
+    definition bumps ``version``, so results keep pointing at the version
+    they were scored with.
+    """
+
+    __tablename__ = "test_scales"
+    __test__ = False  # not a pytest test class
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    key: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    definition: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC)
+    )
+
+
+class AssessmentResult(Base):
+    """A family member's scored answers to a test scale."""
+
+    __tablename__ = "assessment_results"
+    __table_args__ = (
+        Index(
+            "ix_assessment_results_member_scale",
+            "family_member_id",
+            "test_scale_id",
+            "completed_at",
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    test_scale_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("test_scales.id"), nullable=False
+    )
+    scale_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    submitted_by_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+    )
+    answers: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    total_score: Mapped[float] = mapped_column(Float, nullable=False)
+    subscale_scores: Mapped[Dict[str, float]] = mapped_column(JSONB, nullable=False)
+    band: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC)
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
@@ -0,0 +1,64 @@
+from datetime import datetime, UTC
+from pathlib import PurePath
+from typing import Optional
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKeyConstraint,
+    Index,
+    String,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+
+from app.db.base_class import Base
+
+
+def file_url(storage_path: str) -> str:
+    """Public URL of a stored file, served by the files endpoint."""
+    return f"/files/{PurePath(storage_path).name}"
+
+
+class Attachment(Base):
+    """A file attached to a health event.
+
+    Files are stored under their SHA-256 hash, so identical uploads share one
+    file on disk. ``hash`` and ``size`` are empty for legacy files that were
+    not readable when they were migrated. Attachments are only reached
+    through ``HealthEvent.attachments``; there is no way back to the event,
+    whose composite key does not match the mapper's primary key.
+    """
+
+    __tablename__ = "attachments"
+    # health_events is partitioned, so its unique key includes date_time.
+    # Moving an event to another year moves it to another partition, which
+    # before PostgreSQL 15 fired the ON DELETE action instead of ON UPDATE.
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["event_id", "event_date_time"],
+            ["health_events.id", "health_events.date_time"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        Index("ix_attachments_event_id", "event_id"),
+        Index("ix_attachments_hash", "hash"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    event_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    event_date_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    mime: Mapped[str] = mapped_column(String(255), nullable=False)
+    filename: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    storage_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
+
+    @property
+    def url(self) -> str:
+        return file_url(self.storage_path)
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+
+class MemberEventTypeStats(Base):
+    """Per member, per event type rollup of health events.
+
+    Maintained incrementally by ``app.services.stats_service`` in the same
+    transaction as every health event write.
+    """
+
+    __tablename__ = "member_event_type_stats"
+
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    event_type: Mapped[str] = mapped_column(String(255), primary_key=True)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    first_event_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_event_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class MemberMonthlyEventStats(Base):
+    """Per member, per calendar month count of health events."""
+
+    __tablename__ = "member_monthly_event_stats"
+
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,44 @@
+from datetime import date, datetime, UTC
+from typing import List, Optional
+from sqlalchemy import Boolean, Date, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from app.db.base_class import Base
+
+
+class MemberEventTrend(Base):
+    """Weekly event series of a member and event type, with its analysis.
+
+    Recomputed for the whole population by the nightly batch of
+    ``app.services.trend_service``; only series with events are stored.
+    """
+
+    __tablename__ = "member_event_trends"
+
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    event_type: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # Monday of the first week of the series, one element per week
+    week_start: Mapped[date] = mapped_column(Date, nullable=False)
+    weekly_counts: Mapped[List[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    rolling_mean: Mapped[List[float]] = mapped_column(ARRAY(Float), nullable=False)
+    # Latest week against the weeks before it
+    baseline_mean: Mapped[float] = mapped_column(Float, nullable=False)
+    baseline_std: Mapped[float] = mapped_column(Float, nullable=False)
+    zscore: Mapped[float] = mapped_column(Float, nullable=False)
+    is_anomaly: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Least squares slope of the series, in events per week per week
+    slope: Mapped[float] = mapped_column(Float, nullable=False)
+    # Strongest shift of the mean within the series
+    change_week: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    change_score: Mapped[float] = mapped_column(Float, nullable=False)
+    is_change_point: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False
+    )
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC)
+    )
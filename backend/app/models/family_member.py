@@ -1,12 +1,23 @@
 from datetime import datetime, UTC
-from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import Dict, List, Optional, TYPE_CHECKING
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    Text,
+    Enum,
+    Index,
+)
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 import uuid
 
 from app.db.base_class import Base
+from app.models.sync import change_sequence, current_xid
 
 if TYPE_CHECKING:
     from app.models.health_event import HealthEvent
@@ -20,6 +31,11 @@ class MemberType(str, enum.Enum):
 
 class FamilyMember(Base):
     __tablename__ = "family_members"
+    __table_args__ = (
+        Index(
+            "ix_family_members_manager_change", "manager_id", "change_xid", "change_seq"
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -42,8 +58,36 @@ class FamilyMember(Base):
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
 
+    # Change tracking for delta sync, see app.services.sync_service
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=current_xid(), onupdate=current_xid()
+    )
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=change_sequence.next_value(),
+        onupdate=change_sequence.next_value(),
+    )
+    created_xid: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=current_xid()
+    )
+    created_seq: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=change_sequence.next_value()
+    )
+
+    # Event summary, only loaded on request through
+    # StatsService.with_member_summary
+    event_count: Mapped[Optional[int]] = query_expression()
+    last_event_at: Mapped[Optional[datetime]] = query_expression()
+    counts_by_type: Mapped[Optional[Dict[str, int]]] = query_expression()
+
     # Relationships
     health_events: Mapped[List["HealthEvent"]] = relationship(
-        "HealthEvent", back_populates="family_member", lazy="selectin"
+        "HealthEvent",
+        back_populates="family_member",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    manager: Mapped["User"] = relationship(
+        "User", back_populates="family_members", lazy="raise"
     )
-    manager: Mapped["User"] = relationship("User", back_populates="family_members")
@@ -1,14 +1,28 @@
 from datetime import datetime, UTC
 from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Text
-from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    String,
+    DateTime,
+    ForeignKey,
+    Enum,
+    Text,
+    Index,
+    PrimaryKeyConstraint,
+    DDL,
+    event,
+)
+from sqlalchemy.orm import backref, relationship, Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
 import enum
 import uuid
 
 from app.db.base_class import Base
+from app.models.sync import change_sequence, current_xid
 
 if TYPE_CHECKING:
+    from app.models.attachment import Attachment
     from app.models.family_member import FamilyMember
     from app.models.user import User
 
@@ -21,10 +35,23 @@ class EventType(str, enum.Enum):
 
 class HealthEvent(Base):
     __tablename__ = "health_events"
-
-    id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    # Range partitioned by date_time, one partition per year (see
+    # app.services.partition_service). The partition key has to be part of
+    # the primary key, while the ORM keeps identifying events by id alone.
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "date_time"),
+        Index(
+            "ix_health_events_member_type_date",
+            "family_member_id",
+            "event_type",
+            "date_time",
+        ),
+        Index("ix_health_events_change", "change_xid", "change_seq"),
+        {"postgresql_partition_by": "RANGE (date_time)"},
     )
+    __mapper_args__ = {"primary_key": ["id"]}
+
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     event_type: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -35,17 +62,58 @@ class HealthEvent(Base):
     created_by_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now(UTC))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(UTC), onupdate=datetime.now(UTC)
+        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC)
     )
 
-    # File attachments
-    file_paths: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=True)
-    file_types: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=True)
+    # Change tracking for delta sync, see app.services.sync_service
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=current_xid(), onupdate=current_xid()
+    )
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=change_sequence.next_value(),
+        onupdate=change_sequence.next_value(),
+    )
+    created_xid: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=current_xid()
+    )
+    created_seq: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=change_sequence.next_value()
+    )
 
     # Relationships
     family_member: Mapped["FamilyMember"] = relationship(
-        "FamilyMember", back_populates="health_events", lazy="selectin"
+        "FamilyMember", back_populates="health_events", lazy="raise"
     )
-    created_by: Mapped["User"] = relationship("User", backref="created_health_events")
+    created_by: Mapped["User"] = relationship(
+        "User", backref=backref("created_health_events", lazy="raise"), lazy="raise"
+    )
+    attachments: Mapped[List["Attachment"]] = relationship(
+        "Attachment",
+        lazy="raise",
+        order_by="Attachment.created_at",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # Kept for clients written against the former array columns
+    @property
+    def file_paths(self) -> List[str]:
+        return [attachment.storage_path for attachment in self.attachments]
+
+    @property
+    def file_types(self) -> List[str]:
+        return [attachment.mime for attachment in self.attachments]
+
+
+# Rows outside every yearly partition land here until their partition exists
+event.listen(
+    HealthEvent.__table__,
+    "after_create",
+    DDL("CREATE TABLE health_events_default PARTITION OF health_events DEFAULT"),
+)
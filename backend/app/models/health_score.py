@@ -0,0 +1,25 @@
+from datetime import datetime, UTC
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+
+class StaleHealthScore(Base):
+    """Family member whose events changed since their score was computed.
+
+    Rows are added in the same transaction as every health event write and
+    consumed by ``app.services.health_score_service``.
+    """
+
+    __tablename__ = "stale_health_scores"
+
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    marked_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC)
+    )
@@ -0,0 +1,70 @@
+from datetime import datetime, UTC
+from typing import Any, Dict, Optional
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+import enum
+
+from app.db.base_class import Base
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(Base):
+    """A unit of background work, run by ``app.services.job_queue`` workers.
+
+    Queued jobs are claimed lowest ``priority`` first, then by ``run_at``;
+    a claimed job is ``running`` until its worker finishes it or its lease
+    runs out, and failed attempts are queued again with a later ``run_at``
+    until ``max_attempts`` is reached.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Workers only ever read queued jobs in claim order
+        Index(
+            "ix_jobs_queued",
+            "priority",
+            "run_at",
+            "id",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        # At most one queued job per dedup key; running jobs don't count, so
+        # work that arrives while a job runs is picked up by the next one
+        Index(
+            "ux_jobs_dedup_key",
+            "dedup_key",
+            unique=True,
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "ix_jobs_running",
+            "locked_at",
+            postgresql_where=text("status = 'running'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=100)
+    dedup_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=JobStatus.QUEUED.value
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    run_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    locked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,49 @@
+from datetime import datetime
+from sqlalchemy import DateTime, Float, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+
+from app.db.base_class import Base
+
+
+class Metric(str, enum.Enum):
+    WEIGHT = "weight"
+    BLOOD_PRESSURE_SYSTOLIC = "blood_pressure_systolic"
+    BLOOD_PRESSURE_DIASTOLIC = "blood_pressure_diastolic"
+    GLUCOSE = "glucose"
+    HEART_RATE = "heart_rate"
+    TEMPERATURE = "temperature"
+    OXYGEN_SATURATION = "oxygen_saturation"
+
+
+# Values are stored in these units
+METRIC_UNITS = {
+    Metric.WEIGHT: "kg",
+    Metric.BLOOD_PRESSURE_SYSTOLIC: "mmHg",
+    Metric.BLOOD_PRESSURE_DIASTOLIC: "mmHg",
+    Metric.GLUCOSE: "mmol/L",
+    Metric.HEART_RATE: "bpm",
+    Metric.TEMPERATURE: "°C",
+    Metric.OXYGEN_SATURATION: "%",
+}
+
+
+class Measurement(Base):
+    """A numeric vital reading of a family member.
+
+    The primary key doubles as the only index: range queries of one
+    member's metric are a contiguous scan of it, and a repeated reading
+    (same member, metric and time) replaces the stored value.
+    """
+
+    __tablename__ = "measurements"
+
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    metric: Mapped[str] = mapped_column(String(50), primary_key=True)
+    ts: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    value: Mapped[float] = mapped_column(Float, nullable=False)
@@ -0,0 +1,35 @@
+from datetime import datetime, UTC
+from sqlalchemy import BigInteger, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+from app.models.sync import change_sequence, current_xid
+
+
+class OutboxMessage(Base):
+    """A change of a synced row, appended in the transaction of the write.
+
+    Messages are ordered like the delta sync stream, by writing transaction
+    and change sequence, and relayed to consumers by
+    ``app.services.outbox``; each consumer tracks its position in a
+    watermark. Messages every consumer has passed are purged.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (Index("ix_outbox_change", "change_xid", "change_seq"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    action: Mapped[str] = mapped_column(String(20), nullable=False)
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=current_xid()
+    )
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=change_sequence.next_value()
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC)
+    )
@@ -0,0 +1,73 @@
+from datetime import datetime, UTC
+from typing import Optional
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+
+from app.db.base_class import Base
+
+
+class RecurrenceFrequency(str, enum.Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+
+
+class EventRecurrence(Base):
+    """Recurrence rule of a health event.
+
+    The event itself is the first occurrence; the following ones are never
+    stored but expanded on read, for the requested date window only, by
+    ``app.services.recurrence_service``.
+    """
+
+    __tablename__ = "event_recurrences"
+
+    # No foreign key: events are identified by (id, date_time) in the
+    # partitioned table, and the rule is removed with its event
+    health_event_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    frequency: Mapped[str] = mapped_column(String(20), nullable=False)
+    interval: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Date and time of the event, and of its last occurrence (None when the
+    # series never ends), so expansion doesn't need to read the event
+    starts_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    ends_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC)
+    )
+
+
+class OccurrenceOverride(Base):
+    """Changes to a single occurrence of a recurring event.
+
+    ``occurrence_at`` is the date and time the rule gives the occurrence;
+    ``date_time`` moves it, and ``cancelled`` removes it from the series.
+    """
+
+    __tablename__ = "occurrence_overrides"
+
+    health_event_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("event_recurrences.health_event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    occurrence_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    date_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    cancelled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC)
+    )
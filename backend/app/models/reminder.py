@@ -0,0 +1,47 @@
+from datetime import datetime, UTC
+from typing import Optional
+from sqlalchemy import DateTime, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+
+from app.db.base_class import Base
+
+
+class MedicationReminder(Base):
+    """A reminder of an upcoming medication event.
+
+    Rows are kept in sync with MEDICATION events by
+    ``app.services.reminder_service`` and fired by
+    ``app.services.reminder_scheduler``, which sets ``sent_at``.
+    """
+
+    __tablename__ = "medication_reminders"
+    __table_args__ = (
+        # The scheduler only ever reads pending reminders by due time
+        Index(
+            "ix_medication_reminders_pending",
+            "due_at",
+            postgresql_where=text("sent_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    # No foreign key: events are identified by (id, date_time) in the
+    # partitioned table, and the reminder is removed with its event
+    health_event_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), unique=True, nullable=False
+    )
+    family_member_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("family_members.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    due_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
@@ -0,0 +1,41 @@
+from datetime import datetime, UTC
+from sqlalchemy import BigInteger, DateTime, Index, Sequence, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+# Monotonic sequence stamped on every change of a synced row
+change_sequence = Sequence("change_seq", metadata=Base.metadata)
+
+
+def current_xid():
+    """SQL expression for the id of the writing transaction (64-bit xid8)."""
+    return func.pg_current_xact_id().cast(Text).cast(BigInteger)
+
+
+class Tombstone(Base):
+    """Record of a deleted synced row, kept so clients can learn about removals.
+
+    Tombstones are purged after ``SYNC_TOMBSTONE_RETENTION_DAYS``; clients
+    with an older cursor must perform a full resync.
+    """
+
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_user_change", "user_id", "change_xid", "change_seq"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=current_xid()
+    )
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=change_sequence.next_value()
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC), index=True
+    )
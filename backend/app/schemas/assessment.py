@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class ScaleOption(BaseModel):
+    value: str
+    label: Optional[str] = None
+    score: float
+
+
+class ScaleItem(BaseModel):
+    id: str
+    text: str
+    options: List[ScaleOption] = Field(..., min_length=1)
+    weight: float = 1.0
+    required: bool = True
+
+
+class ScaleBand(BaseModel):
+    """Interpretation of totals from ``min_score`` up to the next band."""
+
+    min_score: float
+    label: str
+
+
+class TestScaleDefinition(BaseModel):
+    __test__ = False  # not a pytest test class
+
+    items: List[ScaleItem] = Field(..., min_length=1)
+    subscales: Dict[str, List[str]] = Field(default_factory=dict)
+    bands: List[ScaleBand] = Field(default_factory=list)
+
+
+class TestScaleResponse(BaseModel):
+    __test__ = False
+
+    id: UUID
+    key: str
+    name: str
+    description: Optional[str] = None
+    version: int
+    definition: TestScaleDefinition
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AssessmentSubmission(BaseModel):
+    test_scale_id: UUID
+    family_member_id: UUID
+    answers: Dict[str, str]
+    completed_at: Optional[datetime] = None
+
+
+class AssessmentSubmit(BaseModel):
+    submissions: List[AssessmentSubmission] = Field(..., min_length=1)
+
+
+class AssessmentResultResponse(BaseModel):
+    id: UUID
+    test_scale_id: UUID
+    scale_version: int
+    family_member_id: UUID
+    answers: Dict[str, str]
+    total_score: float
+    subscale_scores: Dict[str, float]
+    band: Optional[str] = None
+    completed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AssessmentResultsResponse(BaseModel):
+    results: List[AssessmentResultResponse]
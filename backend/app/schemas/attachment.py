@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class AttachmentResponse(BaseModel):
+    id: UUID
+    event_id: UUID
+    hash: Optional[str] = None
+    size: Optional[int] = None
+    mime: str
+    filename: Optional[str] = None
+    url: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,26 @@
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class BatchRequestItem(BaseModel):
+    id: Optional[str] = None
+    method: str = "GET"
+    path: str = Field(..., description="Path relative to the API prefix")
+    query: Dict[str, Any] = Field(default_factory=dict)
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem] = Field(..., min_length=1)
+
+
+class BatchResponseItem(BaseModel):
+    id: Optional[str] = None
+    status: int
+    headers: Dict[str, str]
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchResponseItem]
@@ -0,0 +1,72 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from pydantic import BaseModel
+from app.models.family_member import MemberType
+from app.models.health_event import EventType
+
+
+class MonthlyEventCount(BaseModel):
+    month: date
+    event_count: int
+
+
+class MemberStatsResponse(BaseModel):
+    family_member_id: UUID
+    name: str
+    total_events: int
+    counts_by_type: Dict[str, int]
+    last_event_at: Optional[datetime] = None
+    last_checkup_at: Optional[datetime] = None
+    monthly: List[MonthlyEventCount]
+
+
+class DashboardStatsResponse(BaseModel):
+    members: List[MemberStatsResponse]
+
+
+class DashboardEvent(BaseModel):
+    id: UUID
+    title: str
+    event_type: EventType
+    description: Optional[str] = None
+    date_time: datetime
+
+
+class MemberOverview(BaseModel):
+    id: UUID
+    name: str
+    member_type: MemberType
+    relation_type: str
+    date_of_birth: Optional[date] = None
+    health_score: Optional[int] = None
+    latest_events: Dict[str, List[DashboardEvent]]
+    next_event: Optional[DashboardEvent] = None
+
+
+class DashboardHomeResponse(BaseModel):
+    members: List[MemberOverview]
+
+
+class EventTrendResponse(BaseModel):
+    family_member_id: UUID
+    event_type: EventType
+    week_start: date
+    weekly_counts: List[int]
+    rolling_mean: List[float]
+    baseline_mean: float
+    baseline_std: float
+    zscore: float
+    is_anomaly: bool
+    slope: float
+    change_week: Optional[date] = None
+    change_score: float
+    is_change_point: bool
+    computed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class EventTrendsResponse(BaseModel):
+    trends: List[EventTrendResponse]
@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from pydantic import BaseModel
 from app.models.family_member import MemberType
@@ -10,7 +10,6 @@ class FamilyMemberBase(BaseModel):
     member_type: MemberType
     relation_type: str
     date_of_birth: Optional[date] = None
-    health_score: Optional[int] = None
     notes: Optional[str] = None
 
 
@@ -23,12 +22,13 @@ class FamilyMemberUpdate(BaseModel):
     member_type: Optional[MemberType] = None
     relation_type: Optional[str] = None
     date_of_birth: Optional[date] = None
-    health_score: Optional[int] = None
     notes: Optional[str] = None
 
 
 class FamilyMemberResponse(FamilyMemberBase):
     id: UUID
+    # Derived from the member's events; a score sent by a client is ignored
+    health_score: Optional[int] = None
     manager_id: UUID
     created_at: datetime
     updated_at: datetime
@@ -37,8 +37,14 @@ class FamilyMemberResponse(FamilyMemberBase):
         from_attributes = True
 
 
+class FamilyMemberSummary(FamilyMemberResponse):
+    event_count: int
+    last_event_at: Optional[datetime] = None
+    counts_by_type: Dict[str, int]
+
+
 class PaginatedResponse(BaseModel):
-    items: List[FamilyMemberResponse]
+    items: List[FamilyMemberSummary]
     total: int
     page: int
     size: int
@@ -1,7 +1,11 @@
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import FrozenSet, Optional, List, Type
+from functools import lru_cache
+from pydantic import BaseModel, Field, create_model
 from app.models.health_event import EventType
+from app.models.recurrence import RecurrenceFrequency
+from app.schemas.attachment import AttachmentResponse
+from app.utils.fieldsets import sparse_model
 from uuid import UUID
 
 
@@ -29,8 +33,12 @@ class HealthEventInDB(HealthEventBase):
     id: UUID
     file_paths: Optional[List[str]] = None
     file_types: Optional[List[str]] = None
+    attachments: List[AttachmentResponse] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
+    # Set in event lists on recurring events and their occurrences
+    series_id: Optional[UUID] = None
+    occurrence_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -40,6 +48,38 @@ class HealthEventResponse(HealthEventInDB):
     file_urls: Optional[List[str]] = None
 
 
+class RecurrenceRule(BaseModel):
+    frequency: RecurrenceFrequency
+    interval: int = Field(1, ge=1, le=366)
+    count: Optional[int] = Field(None, ge=1)
+    until: Optional[datetime] = None
+
+
+class RecurrenceResponse(RecurrenceRule):
+    health_event_id: UUID
+    starts_at: datetime
+    ends_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class OccurrenceOverrideUpdate(BaseModel):
+    title: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    date_time: Optional[datetime] = None
+    cancelled: bool = False
+
+
+class OccurrenceOverrideResponse(OccurrenceOverrideUpdate):
+    health_event_id: UUID
+    occurrence_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class HealthEventFilter(BaseModel):
     event_type: Optional[EventType] = None
     family_member_id: Optional[UUID] = None
@@ -54,3 +94,20 @@ class PaginatedResponse(BaseModel):
     page: int
     size: int
     pages: int
+
+
+def sparse_page_model(fields: FrozenSet[str]) -> Type[BaseModel]:
+    """Page model whose items only carry ``fields`` of HealthEventResponse."""
+    return _sparse_page_model(sparse_model(HealthEventResponse, fields))
+
+
+@lru_cache(maxsize=256)
+def _sparse_page_model(item: Type[BaseModel]) -> Type[BaseModel]:
+    return create_model(
+        "PaginatedEventFields",
+        items=(List[item], ...),
+        total=(int, ...),
+        page=(int, ...),
+        size=(int, ...),
+        pages=(int, ...),
+    )
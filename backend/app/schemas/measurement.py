@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel, Field
+from app.models.measurement import Metric
+
+
+class MeasurementReading(BaseModel):
+    metric: Metric
+    ts: datetime
+    value: float
+
+
+class MeasurementIngest(BaseModel):
+    family_member_id: UUID
+    readings: List[MeasurementReading] = Field(..., min_length=1)
+
+
+class MeasurementIngestResponse(BaseModel):
+    stored: int
+
+
+class MeasurementBucket(BaseModel):
+    """Readings of one time bucket; a single reading has min = max = avg."""
+
+    start: datetime
+    end: datetime
+    min: float
+    max: float
+    avg: float
+    count: int
+
+
+class MeasurementSeriesResponse(BaseModel):
+    family_member_id: UUID
+    metric: Metric
+    unit: str
+    points: List[MeasurementBucket]
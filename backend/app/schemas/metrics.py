@@ -0,0 +1,29 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    backend: str
+    hits: int
+    misses: int
+    hit_ratio: float
+    entries: int
+    memory_bytes: int
+
+
+class JobKindStats(BaseModel):
+    kind: str
+    queued: int
+    due: int
+    running: int
+    failed: int
+    oldest_due_seconds: float
+    completed: int
+    avg_wait_seconds: float
+    p95_wait_seconds: float
+    avg_run_seconds: float
+
+
+class JobStatsResponse(BaseModel):
+    window_seconds: int
+    kinds: List[JobKindStats]
@@ -0,0 +1,24 @@
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel, Field
+from app.schemas.family_member import FamilyMemberResponse
+from app.schemas.health_event import HealthEventResponse
+
+
+class FamilyMemberChanges(BaseModel):
+    created: List[FamilyMemberResponse] = Field(default_factory=list)
+    updated: List[FamilyMemberResponse] = Field(default_factory=list)
+    deleted: List[UUID] = Field(default_factory=list)
+
+
+class HealthEventChanges(BaseModel):
+    created: List[HealthEventResponse] = Field(default_factory=list)
+    updated: List[HealthEventResponse] = Field(default_factory=list)
+    deleted: List[UUID] = Field(default_factory=list)
+
+
+class SyncChangesResponse(BaseModel):
+    family_members: FamilyMemberChanges
+    health_events: HealthEventChanges
+    cursor: str
+    has_more: bool
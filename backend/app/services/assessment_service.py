@@ -0,0 +1,260 @@
+from collections import defaultdict
+from datetime import datetime, UTC
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import UUID
+import uuid
+
+import numpy as np
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.assessment import AssessmentResult, TestScale
+from app.schemas.assessment import AssessmentSubmission, TestScaleDefinition
+
+
+class ScaleDefinitionError(ValueError):
+    """A test scale definition that cannot be compiled."""
+
+
+class AnswerError(ValueError):
+    """Answers that don't fit the scale they were submitted for."""
+
+    def __init__(self, index: int, message: str):
+        super().__init__(f"Submission {index}: {message}")
+        self.index = index
+        self.message = message
+
+
+class ScaleScores(NamedTuple):
+    """Scores of a batch of answer sets, one row per answer set."""
+
+    totals: np.ndarray
+    subscales: np.ndarray  # (answer sets, subscales)
+    bands: List[Optional[str]]
+
+
+class CompiledScale:
+    """A test scale definition compiled into lookup tables.
+
+    Every item becomes a dict from option value to weighted score, and the
+    subscales a 0/1 membership matrix of items by subscales. A batch of
+    answer sets is scored by filling a matrix of item scores with dict
+    lookups; totals, subscale scores and bands are then array operations.
+    """
+
+    def __init__(self, definition: Mapping[str, Any]):
+        try:
+            parsed = TestScaleDefinition.model_validate(definition)
+        except ValidationError as e:
+            raise ScaleDefinitionError(str(e))
+
+        self.item_ids = [item.id for item in parsed.items]
+        self.item_index = {item_id: i for i, item_id in enumerate(self.item_ids)}
+        if len(self.item_index) != len(self.item_ids):
+            raise ScaleDefinitionError("Item ids must be unique")
+        self.item_scores: List[Dict[str, float]] = []
+        for item in parsed.items:
+            scores = {
+                option.value: option.score * item.weight for option in item.options
+            }
+            if len(scores) != len(item.options):
+                raise ScaleDefinitionError(
+                    f"Duplicate option values in item {item.id}"
+                )
+            self.item_scores.append(scores)
+        self.required = [i for i, item in enumerate(parsed.items) if item.required]
+
+        self.subscale_names = sorted(parsed.subscales)
+        self.membership = np.zeros((len(self.item_ids), len(self.subscale_names)))
+        for s, name in enumerate(self.subscale_names):
+            for item_id in parsed.subscales[name]:
+                if item_id not in self.item_index:
+                    raise ScaleDefinitionError(
+                        f"Subscale {name} refers to unknown item {item_id}"
+                    )
+                self.membership[self.item_index[item_id], s] = 1.0
+
+        bands = sorted(parsed.bands, key=lambda band: band.min_score)
+        self.band_floors = np.array([band.min_score for band in bands])
+        self.band_labels = [band.label for band in bands]
+
+    def score(self, answer_sets: Sequence[Mapping[str, str]]) -> ScaleScores:
+        """Score many answer sets at once.
+
+        Unanswered optional items score 0. Raises ``AnswerError`` for an
+        unknown item or option, or a missing required item.
+        """
+        scores = np.zeros((len(answer_sets), len(self.item_ids)))
+        for row, answers in enumerate(answer_sets):
+            for item_id, value in answers.items():
+                i = self.item_index.get(item_id)
+                if i is None:
+                    raise AnswerError(row, f"unknown item {item_id}")
+                try:
+                    scores[row, i] = self.item_scores[i][value]
+                except KeyError:
+                    raise AnswerError(row, f"invalid answer {value!r} to {item_id}")
+            if len(answers) < len(self.item_ids):
+                for i in self.required:
+                    if self.item_ids[i] not in answers:
+                        raise AnswerError(row, f"missing answer to {self.item_ids[i]}")
+
+        totals = scores.sum(axis=1)
+        # Index of the last band whose floor is at or below the total
+        band_index = np.searchsorted(self.band_floors, totals, side="right") - 1
+        return ScaleScores(
+            totals=totals,
+            subscales=scores @ self.membership,
+            bands=[
+                self.band_labels[b] if b >= 0 else None for b in band_index.tolist()
+            ],
+        )
+
+
+class AssessmentService:
+    """Scoring and storage of test scale results.
+
+    Definitions are compiled once per scale version and kept in memory, so
+    scoring a submission costs a few dict lookups per answer and doesn't
+    read the definition again. Changing a scale bumps its version, which
+    makes every process compile the new definition on next use.
+    """
+
+    def __init__(self):
+        self._compiled: Dict[UUID, Tuple[int, CompiledScale]] = {}
+
+    def compiled(
+        self, db: Session, scale_ids: Iterable[UUID]
+    ) -> Dict[UUID, Tuple[int, CompiledScale]]:
+        """Return the current version and compiled form of the given scales.
+
+        Unknown scale ids are left out of the result.
+        """
+        versions = dict(
+            db.execute(
+                select(TestScale.id, TestScale.version).where(
+                    TestScale.id.in_(list(scale_ids))
+                )
+            ).all()
+        )
+        stale = [
+            scale_id
+            for scale_id, version in versions.items()
+            if self._compiled.get(scale_id, (None,))[0] != version
+        ]
+        if stale:
+            rows = db.execute(
+                select(TestScale.id, TestScale.version, TestScale.definition).where(
+                    TestScale.id.in_(stale)
+                )
+            ).all()
+            for scale_id, version, definition in rows:
+                self._compiled[scale_id] = (version, CompiledScale(definition))
+                versions[scale_id] = version
+        return {scale_id: self._compiled[scale_id] for scale_id in versions}
+
+    def save_scale(
+        self,
+        db: Session,
+        key: str,
+        name: str,
+        definition: Dict[str, Any],
+        description: Optional[str] = None,
+    ) -> TestScale:
+        """Create or update the scale ``key``; changed definitions bump its version.
+
+        The definition is compiled first, so an invalid one is never stored.
+        """
+        CompiledScale(definition)
+        scale = db.scalar(select(TestScale).where(TestScale.key == key))
+        if scale is None:
+            scale = TestScale(key=key, version=1, definition=definition)
+            db.add(scale)
+        elif scale.definition != definition:
+            scale.definition = definition
+            scale.version += 1
+        scale.name = name
+        scale.description = description
+        db.flush()
+        return scale
+
+    def submit(
+        self,
+        db: Session,
+        submissions: Sequence[AssessmentSubmission],
+        submitted_by_id: UUID,
+    ) -> List[Dict[str, Any]]:
+        """Score and store submissions; return the stored rows in order.
+
+        Submissions are grouped by scale and every group is scored in one
+        pass, then all results are written with a single insert. Raises
+        ``AnswerError`` for invalid answers and ``LookupError`` for unknown
+        scales.
+        """
+        scales = self.compiled(db, {s.test_scale_id for s in submissions})
+        groups: Dict[UUID, List[int]] = defaultdict(list)
+        for i, submission in enumerate(submissions):
+            if submission.test_scale_id not in scales:
+                raise LookupError(f"Test scale {submission.test_scale_id} not found")
+            groups[submission.test_scale_id].append(i)
+
+        now = datetime.now(UTC).replace(tzinfo=None)
+        rows: List[Optional[Dict[str, Any]]] = [None] * len(submissions)
+        for scale_id, positions in groups.items():
+            version, scale = scales[scale_id]
+            try:
+                scored = scale.score([submissions[i].answers for i in positions])
+            except AnswerError as e:
+                # Report the position in the request, not in the group
+                raise AnswerError(positions[e.index], e.message)
+            for row, i in enumerate(positions):
+                submission = submissions[i]
+                rows[i] = {
+                    "id": uuid.uuid4(),
+                    "test_scale_id": scale_id,
+                    "scale_version": version,
+                    "family_member_id": submission.family_member_id,
+                    "submitted_by_id": submitted_by_id,
+                    "answers": submission.answers,
+                    "total_score": float(scored.totals[row]),
+                    "subscale_scores": dict(
+                        zip(scale.subscale_names, scored.subscales[row].tolist())
+                    ),
+                    "band": scored.bands[row],
+                    "completed_at": submission.completed_at or now,
+                    "created_at": now,
+                }
+        db.execute(insert(AssessmentResult), rows)
+        return rows
+
+    def get_results(
+        self,
+        db: Session,
+        family_member_id: UUID,
+        test_scale_id: Optional[UUID] = None,
+        limit: int = 100,
+    ) -> List[AssessmentResult]:
+        """Return the latest results of a member, newest first."""
+        query = (
+            select(AssessmentResult)
+            .where(AssessmentResult.family_member_id == family_member_id)
+            .order_by(AssessmentResult.completed_at.desc())
+            .limit(limit)
+        )
+        if test_scale_id:
+            query = query.where(AssessmentResult.test_scale_id == test_scale_id)
+        return db.scalars(query).all()
+
+
+assessment_service = AssessmentService()
@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+from fastapi import UploadFile
+from sqlalchemy import Text, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.models.attachment import Attachment
+from app.models.health_event import HealthEvent
+from app.services.file_service import file_service
+from app.services.job_queue import job_queue
+
+PURGE_JOB = "attachments.purge_files"
+
+
+class AttachmentService:
+    """Attach and detach files of health events.
+
+    Files are content addressed and may be shared by several attachments, so
+    a file is only deleted once no attachment refers to it any more. Storing
+    a file and checking its references both take a transaction-level
+    advisory lock on the content hash, so an upload that reuses a stored
+    file and a delete of that file are serialized. Files detached in a
+    transaction are deleted by a background job queued with
+    :meth:`delete_later`, which checks their references again.
+    """
+
+    async def add_files(
+        self, db: Session, event: HealthEvent, files: Iterable[UploadFile]
+    ) -> List[Attachment]:
+        """Store uploads and attach them to an event.
+
+        All uploads are received and hashed before their content is locked,
+        so the locks are taken at once and in order. If any upload is
+        rejected, none is stored and the ``ValueError`` is re-raised.
+        """
+        files = list(files)
+        received = []
+        try:
+            for file in files:
+                received.append(await file_service.receive_file(file))
+            self._lock_content(db, [r.hash for r in received])
+            stored = [file_service.keep_file(r) for r in received]
+        except BaseException:
+            for r in received:
+                file_service.discard_file(r)
+            raise
+
+        attachments = []
+        for file, stored_file in zip(files, stored):
+            attachment = Attachment(
+                hash=stored_file.hash,
+                size=stored_file.size,
+                mime=file.content_type or "application/octet-stream",
+                filename=file.filename,
+                storage_path=stored_file.path,
+            )
+            event.attachments.append(attachment)
+            attachments.append(attachment)
+        return attachments
+
+    def remove(
+        self, db: Session, event: HealthEvent, attachments: Iterable[Attachment]
+    ) -> List[str]:
+        """Detach attachments and return the files that are no longer used."""
+        paths = []
+        for attachment in list(attachments):
+            event.attachments.remove(attachment)
+            paths.append(attachment.storage_path)
+        db.flush()
+        return self.unreferenced(db, paths)
+
+    def unreferenced(self, db: Session, paths: Iterable[str]) -> List[str]:
+        """Return the given file paths that no attachment refers to.
+
+        The content of the paths stays locked until the transaction ends.
+        """
+        paths = set(paths)
+        if not paths:
+            return []
+        self._lock_content(db, [Path(path).stem for path in paths])
+        # Pending attachments are not in the database yet, flush them first
+        db.flush()
+        referenced = set(
+            db.scalars(
+                select(Attachment.storage_path).where(
+                    Attachment.storage_path.in_(paths)
+                )
+            )
+        )
+        return sorted(paths - referenced)
+
+    def delete_later(self, db: Session, paths: Iterable[str]) -> None:
+        """Queue the deletion of files; call in the transaction detaching them.
+
+        The job only exists once that transaction committed, so a rollback
+        keeps the files.
+        """
+        paths = sorted(set(paths))
+        if paths:
+            job_queue.enqueue(db, PURGE_JOB, {"paths": paths})
+
+    def purge_files(self, db: Session, paths: Iterable[str]) -> None:
+        """Delete the files still unreferenced, then commit to release them.
+
+        Runs in a new transaction after the one that detached the files
+        committed: the references are checked again under the lock, so an
+        upload of the same content meanwhile keeps its file.
+        """
+        for path in self.unreferenced(db, paths):
+            file_service.delete_file(path)
+        db.commit()
+
+    def _lock_content(self, db: Session, hashes: Iterable[str]) -> None:
+        # Always lock in the same order, so two writers can't deadlock
+        hashes = sorted(set(hashes))
+        if not hashes:
+            return
+        content = func.unnest(
+            bindparam("hashes", hashes, type_=ARRAY(Text))
+        ).table_valued("hash", with_ordinality="position").render_derived()
+        db.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(content.c.hash)))
+            .order_by(content.c.position)
+        ).all()
+
+
+attachment_service = AttachmentService()
+
+
+@job_queue.handler(PURGE_JOB)
+def purge_files_job(db: Session, payload: Dict[str, Any]) -> None:
+    attachment_service.purge_files(db, payload["paths"])
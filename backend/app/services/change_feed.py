@@ -0,0 +1,227 @@
+import asyncio
+import json
+import logging
+from typing import Dict, Optional, Set
+from uuid import UUID
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.outbox import outbox
+
+logger = logging.getLogger(__name__)
+
+# Sent to a subscriber when notifications may have been lost; the client
+# should catch up through the delta sync API
+RESYNC = json.dumps({"action": "resync"})
+
+
+class TooManyConnectionsError(Exception):
+    pass
+
+
+class Subscription:
+    def __init__(self, user_id: str, queue_size: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(queue_size)
+
+    def deliver(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A slow client gets a single resync marker instead of a backlog
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class ChangeFeed:
+    """Push change notifications to the clients connected to this node.
+
+    Writers publish with ``pg_notify`` inside their transaction, so a
+    notification is only sent when the write commits and reaches every API
+    node listening on the channel. Each node keeps one dedicated ``LISTEN``
+    connection, read from the event loop, and fans messages out to the
+    subscriptions of the affected user.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        channel: str,
+        max_connections: int,
+        max_connections_per_user: int,
+        queue_size: int = 100,
+    ):
+        self.database_url = database_url
+        self.channel = channel
+        self.max_connections = max_connections
+        self.max_connections_per_user = max_connections_per_user
+        self.queue_size = queue_size
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._connection = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._connected_before = False
+
+    def publish(
+        self,
+        db: Session,
+        user_id: UUID,
+        entity_type: str,
+        entity_id: UUID,
+        action: str,
+    ) -> None:
+        """Queue a notification that is sent when ``db`` commits.
+
+        The change is also appended to the outbox, for consumers that must
+        not miss it.
+        """
+        outbox.append(db, user_id, entity_type, entity_id, action)
+        payload = json.dumps(
+            {
+                "user_id": str(user_id),
+                "entity_type": entity_type,
+                "entity_id": str(entity_id),
+                "action": action,
+            }
+        )
+        db.execute(select(func.pg_notify(self.channel, payload)))
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    async def subscribe(self, user_id: UUID) -> Subscription:
+        key = str(user_id)
+        if self.connection_count >= self.max_connections:
+            raise TooManyConnectionsError("Server connection limit reached")
+        if len(self._subscriptions.get(key, ())) >= self.max_connections_per_user:
+            raise TooManyConnectionsError("Too many open connections for this user")
+
+        subscription = Subscription(key, self.queue_size)
+        self._subscriptions.setdefault(key, set()).add(subscription)
+        try:
+            await self.ensure_listening()
+        except Exception:
+            self.unsubscribe(subscription)
+            raise
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subs = self._subscriptions.get(subscription.user_id)
+        if subs is not None:
+            subs.discard(subscription)
+            if not subs:
+                del self._subscriptions[subscription.user_id]
+
+    def dispatch(self, payload: str) -> None:
+        """Route a raw notification payload to the subscriptions of its user."""
+        try:
+            message = json.loads(payload)
+            user_id = message.pop("user_id")
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed change notification: %r", payload)
+            return
+        subs = self._subscriptions.get(user_id)
+        if subs:
+            data = json.dumps(message)
+            for subscription in subs:
+                subscription.deliver(data)
+
+    async def stream(self, subscription: Subscription, heartbeat_interval: float):
+        """Yield server-sent events for a subscription until the client leaves.
+
+        Comment lines are sent while idle so proxies keep the connection
+        open; each heartbeat also re-establishes a lost listener connection.
+        """
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(
+                        subscription.queue.get(), heartbeat_interval
+                    )
+                except asyncio.TimeoutError:
+                    try:
+                        await self.ensure_listening()
+                    except Exception:
+                        logger.exception("Could not re-establish change listener")
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"event: change\ndata: {message}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    async def ensure_listening(self) -> None:
+        """Open the LISTEN connection on the running loop if it is not open."""
+        loop = asyncio.get_running_loop()
+        if self._connection is not None and self._loop is loop:
+            return
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._connection is not None and self._loop is loop:
+                return
+            self._close()
+            connection = await loop.run_in_executor(None, self._connect)
+            self._connection, self._loop = connection, loop
+            loop.add_reader(connection.fileno(), self._on_readable)
+
+            if self._connected_before:
+                # Notifications sent while we were not listening are lost
+                for subs in self._subscriptions.values():
+                    for subscription in subs:
+                        subscription.deliver(RESYNC)
+            self._connected_before = True
+
+    async def stop(self) -> None:
+        self._close()
+
+    def _connect(self):
+        # Connect like the engine would, with the query options of the URL
+        # (sslmode, host of a unix socket, ...)
+        url = make_url(self.database_url)
+        args, kwargs = url.get_dialect()().create_connect_args(url)
+        connection = psycopg2.connect(*args, **kwargs)
+        connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return connection
+
+    def _on_readable(self) -> None:
+        try:
+            self._connection.poll()
+        except psycopg2.Error:
+            logger.exception("Change listener connection lost")
+            self._close()
+            return
+        while self._connection.notifies:
+            self.dispatch(self._connection.notifies.pop(0).payload)
+
+    def _close(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.remove_reader(self._connection.fileno())
+        except (ValueError, psycopg2.Error):
+            pass
+        try:
+            self._connection.close()
+        except psycopg2.Error:
+            pass
+        self._connection = None
+
+
+change_feed = ChangeFeed(
+    settings.get_database_url,
+    settings.REALTIME_CHANNEL,
+    settings.REALTIME_MAX_CONNECTIONS,
+    settings.REALTIME_MAX_CONNECTIONS_PER_USER,
+    settings.REALTIME_QUEUE_SIZE,
+)
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from uuid import UUID
+from sqlalchemy import literal, select, true, union_all, func
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.family_member import FamilyMember
+from app.models.health_event import EventType
+from app.services.recurrence_service import recurrence_service
+
+EVENT_COLUMNS = ("id", "title", "event_type", "description", "date_time")
+MEMBER_COLUMNS = (
+    FamilyMember.id,
+    FamilyMember.name,
+    FamilyMember.member_type,
+    FamilyMember.relation_type,
+    FamilyMember.date_of_birth,
+    FamilyMember.health_score,
+)
+
+
+class DashboardService:
+    def get_home(
+        self, db: Session, manager_id: UUID, per_type: int, now: datetime
+    ) -> List[Dict[str, Any]]:
+        """Return every member with its latest events per type and next event.
+
+        Runs as a single statement: for each member and event type a LATERAL
+        subquery reads the ``per_type`` latest past events and the earliest
+        upcoming one, each a short scan of ix_health_events_member_type_date.
+        Occurrences of recurring events count as events, within
+        RECURRENCE_HORIZON_DAYS of ``now``.
+        """
+        horizon = timedelta(days=settings.RECURRENCE_HORIZON_DAYS)
+        timeline = recurrence_service.timeline(now - horizon, now + horizon, manager_id)
+        columns = [timeline.c[name] for name in EVENT_COLUMNS]
+        event_types = (
+            func.unnest(array([event_type.value for event_type in EventType]))
+            .table_valued("event_type")
+            .render_derived(name="types")
+        )
+        same_bucket = (
+            timeline.c.family_member_id == FamilyMember.id,
+            timeline.c.event_type == event_types.c.event_type,
+        )
+        latest = (
+            select(*columns, literal(False).label("upcoming"))
+            .where(*same_bucket, timeline.c.date_time <= now)
+            .order_by(timeline.c.date_time.desc(), timeline.c.id)
+            .limit(per_type)
+        )
+        upcoming = (
+            select(*columns, literal(True).label("upcoming"))
+            .where(*same_bucket, timeline.c.date_time > now)
+            .order_by(timeline.c.date_time, timeline.c.id)
+            .limit(1)
+        )
+        events = union_all(latest, upcoming).subquery().lateral("events")
+
+        rows = db.execute(
+            select(
+                *(column.label(f"member_{column.key}") for column in MEMBER_COLUMNS),
+                events,
+            )
+            .select_from(FamilyMember)
+            .join(event_types, true())
+            .outerjoin(events, true())
+            .where(FamilyMember.manager_id == manager_id)
+            .order_by(
+                FamilyMember.created_at,
+                FamilyMember.id,
+                events.c.date_time.desc(),
+            )
+        ).mappings()
+
+        members: Dict[UUID, Dict[str, Any]] = {}
+        for row in rows:
+            member = members.get(row["member_id"])
+            if member is None:
+                member = members[row["member_id"]] = {
+                    **{
+                        column.key: row[f"member_{column.key}"]
+                        for column in MEMBER_COLUMNS
+                    },
+                    "latest_events": {event_type.value: [] for event_type in EventType},
+                    "next_event": None,
+                }
+            if row["id"] is None:
+                continue
+            event = {name: row[name] for name in EVENT_COLUMNS}
+            if not row["upcoming"]:
+                member["latest_events"][row["event_type"]].append(event)
+            elif (
+                member["next_event"] is None
+                or event["date_time"] < member["next_event"]["date_time"]
+            ):
+                member["next_event"] = event
+        return list(members.values())
+
+
+dashboard_service = DashboardService()
@@ -0,0 +1,227 @@
+from collections import defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import Select, Text, cast, func, literal_column, null, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql.base import ReadOnlyColumnCollection
+from sqlalchemy.orm import Session
+
+from app.models.attachment import Attachment, file_url
+from app.models.health_event import HealthEvent
+
+
+class AttachmentRow(NamedTuple):
+    """Read-only attachment, shaped like ``Attachment`` for serialization."""
+
+    id: UUID
+    event_id: UUID
+    hash: Optional[str]
+    size: Optional[int]
+    mime: str
+    filename: Optional[str]
+    storage_path: str
+    created_at: datetime
+
+    @property
+    def url(self) -> str:
+        return file_url(self.storage_path)
+
+
+class EventRow(NamedTuple):
+    """Read-only health event, shaped like ``HealthEvent`` for serialization.
+
+    Columns that were not selected are left as None.
+    """
+
+    id: UUID
+    title: Optional[str] = None
+    event_type: Optional[str] = None
+    description: Optional[str] = None
+    date_time: Optional[datetime] = None
+    family_member_id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    # Set on recurring events and their occurrences, see recurrence_service
+    series_id: Optional[UUID] = None
+    occurrence_at: Optional[datetime] = None
+    attachments: Tuple[AttachmentRow, ...] = ()
+
+    @property
+    def file_paths(self) -> List[str]:
+        return [attachment.storage_path for attachment in self.attachments]
+
+    @property
+    def file_types(self) -> List[str]:
+        return [attachment.mime for attachment in self.attachments]
+
+
+EVENT_COLUMNS = tuple(
+    getattr(HealthEvent, name)
+    for name in EventRow._fields
+    if name not in ("series_id", "occurrence_at", "attachments")
+)
+ATTACHMENT_COLUMNS = tuple(getattr(Attachment, name) for name in AttachmentRow._fields)
+
+# Event lists are shown newest first
+EVENT_ORDER = (HealthEvent.date_time.desc(), HealthEvent.id)
+
+_EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def _json_object(fields: Dict[str, Any]):
+    return func.json_build_object(*chain.from_iterable(fields.items()))
+
+
+def _attachments_json(expression, event_id):
+    """Correlated subquery aggregating ``expression`` over an event's attachments."""
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(expression, Attachment.created_at)),
+                _EMPTY_JSON_ARRAY,
+            )
+        )
+        .where(Attachment.event_id == event_id)
+        .scalar_subquery()
+    )
+
+
+def event_json_fields(columns: ReadOnlyColumnCollection) -> Dict[str, Any]:
+    """SQL rendering of each field of HealthEventResponse, for page_json.
+
+    ``columns`` are those of the health events table or of a subquery with
+    the same column names, such as the recurrence timeline. A subquery may
+    leave out the columns of fields that are not rendered; those map to
+    None.
+    """
+    return {
+        "id": columns.id,
+        "title": columns.get("title"),
+        "event_type": columns.get("event_type"),
+        "description": columns.get("description"),
+        "date_time": columns.date_time,
+        "family_member_id": columns.get("family_member_id"),
+        "created_at": columns.get("created_at"),
+        "updated_at": columns.get("updated_at"),
+        "series_id": columns.get("series_id", null()),
+        "occurrence_at": columns.get("occurrence_at", null()),
+        "file_paths": _attachments_json(Attachment.storage_path, columns.id),
+        "file_types": _attachments_json(Attachment.mime, columns.id),
+        "attachments": _attachments_json(
+            _json_object(
+                {
+                    "id": Attachment.id,
+                    "event_id": Attachment.event_id,
+                    "hash": Attachment.hash,
+                    "size": Attachment.size,
+                    "mime": Attachment.mime,
+                    "filename": Attachment.filename,
+                    "url": func.concat(
+                        "/files/",
+                        func.regexp_replace(Attachment.storage_path, "^.*/", ""),
+                    ),
+                    "created_at": Attachment.created_at,
+                }
+            ),
+            columns.id,
+        ),
+        "file_urls": null(),
+    }
+
+
+EVENT_JSON_FIELDS = event_json_fields(HealthEvent.__table__.c)
+
+
+class EventReader:
+    """Read path for high-volume event listings.
+
+    Statements run on the session's connection, so rows never become ORM
+    objects: no identity map entries, no change tracking, no loader
+    strategies. Use for responses that are serialized and thrown away.
+    """
+
+    def fetch(
+        self, db: Session, statement: Select, with_attachments: bool = True
+    ) -> List[EventRow]:
+        """Run a select of ``EVENT_COLUMNS`` (or a subset including ``id``)."""
+        connection = db.connection()
+        events = [EventRow(**row._mapping) for row in connection.execute(statement)]
+        if not with_attachments or not events:
+            return events
+
+        attachments = self.attachments_by_event(db, [event.id for event in events])
+        return [
+            event._replace(attachments=tuple(attachments.get(event.id, ())))
+            for event in events
+        ]
+
+    def attachments_by_event(
+        self, db: Session, event_ids: Sequence[UUID]
+    ) -> Dict[UUID, List[AttachmentRow]]:
+        """Attachments of several events in one query, by event id."""
+        rows = db.connection().execute(
+            select(*ATTACHMENT_COLUMNS)
+            .where(Attachment.event_id.in_(event_ids))
+            .order_by(Attachment.created_at)
+        )
+        attachments: Dict[UUID, List[AttachmentRow]] = defaultdict(list)
+        for row in rows:
+            attachment = AttachmentRow._make(row)
+            attachments[attachment.event_id].append(attachment)
+        return attachments
+
+    def page_json(
+        self,
+        db: Session,
+        statement: Select,
+        fields: Iterable[str],
+        offset: int,
+        limit: int,
+        columns: Optional[ReadOnlyColumnCollection] = None,
+        **envelope: Any,
+    ) -> bytes:
+        """Render a page of events as a JSON body entirely in Postgres.
+
+        ``statement`` selects the matching events; its columns are replaced
+        by one JSON object per event with ``fields`` (keys of
+        ``EVENT_JSON_FIELDS``), in ``EVENT_ORDER``. The page is wrapped in an
+        object with ``items`` and the ``envelope`` values, and comes back as
+        text, so nothing is parsed or built in Python.
+
+        Pass the ``columns`` of the subquery that ``statement`` selects from
+        when it doesn't read the health events table directly.
+        """
+        if columns is None:
+            columns, json_fields = HealthEvent.__table__.c, EVENT_JSON_FIELDS
+        else:
+            json_fields = event_json_fields(columns)
+        item = _json_object({field: json_fields[field] for field in fields})
+        page = (
+            statement.with_only_columns(
+                item.label("item"),
+                columns.date_time,
+                columns.id,
+                maintain_column_froms=True,
+            )
+            .order_by(columns.date_time.desc(), columns.id)
+            .offset(offset)
+            .limit(limit)
+            .subquery()
+        )
+        items = func.json_agg(
+            aggregate_order_by(page.c.item, page.c.date_time.desc(), page.c.id)
+        )
+        body = select(
+            cast(
+                _json_object(
+                    {"items": func.coalesce(items, _EMPTY_JSON_ARRAY), **envelope}
+                ),
+                Text,
+            )
+        ).select_from(page)
+        return db.connection().execute(body).scalar_one().encode()
+
+
+event_reader = EventReader()
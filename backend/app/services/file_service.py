@@ -1,14 +1,29 @@
+import hashlib
 import os
-import shutil
-from datetime import datetime
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import NamedTuple
 from fastapi import UploadFile
 
 from app.core.config import settings
 
 
+class StoredFile(NamedTuple):
+    path: str
+    hash: str
+    size: int
+
+
+class ReceivedFile(NamedTuple):
+    temp_path: str
+    path: str
+    hash: str
+    size: int
+
+
 class FileService:
+    CHUNK_SIZE = 1024 * 1024
+
     def __init__(self):
         self.base_path = Path(settings.ROOT_DIR) / "storage" / "uploads"
         self.image_path = self.base_path / "images"
@@ -38,26 +53,66 @@ class FileService:
             return self.pdf_path
         raise ValueError(f"Unsupported file type: {file_type}")
 
-    async def save_file(self, file: UploadFile, event_id: str) -> str:
-        """Save uploaded file and return the file path."""
+    async def receive_file(self, file: UploadFile) -> ReceivedFile:
+        """Write an upload to a temporary file and hash its content.
+
+        The temporary file is moved under its hash by :meth:`keep_file`, or
+        removed by :meth:`discard_file`.
+        """
         file_extension = self._get_file_extension(file.filename)
 
         if not self._is_valid_file_type(file_extension):
             raise ValueError(f"Invalid file type: {file_extension}")
 
         storage_path = self._get_storage_path(file_extension)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{event_id}_{timestamp}{file_extension}"
-        file_path = storage_path / filename
-
+        digest = hashlib.sha256()
+        size = 0
+        temp = tempfile.NamedTemporaryFile(
+            dir=storage_path, suffix=".part", delete=False
+        )
         try:
-            with file_path.open("wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            return str(file_path)
+            with temp:
+                while chunk := file.file.read(self.CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > settings.MAX_FILE_SIZE:
+                        raise ValueError(
+                            f"File too large: {file.filename} exceeds "
+                            f"{settings.MAX_FILE_SIZE} bytes"
+                        )
+                    digest.update(chunk)
+                    temp.write(chunk)
+        except BaseException:
+            os.remove(temp.name)
+            raise
         finally:
             file.file.close()
 
-    async def delete_file(self, file_path: str) -> bool:
+        file_hash = digest.hexdigest()
+        file_path = storage_path / f"{file_hash}{file_extension}"
+        return ReceivedFile(temp.name, str(file_path), file_hash, size)
+
+    def keep_file(self, received: ReceivedFile) -> StoredFile:
+        """Store a received file under its content hash.
+
+        Identical content is kept once: when a file with the same hash already
+        exists the received copy is discarded instead. Hold the caller's lock
+        on the hash, so the file can't be deleted until its reference is
+        committed.
+        """
+        if os.path.exists(received.path):
+            os.remove(received.temp_path)
+        else:
+            os.replace(received.temp_path, received.path)
+        return StoredFile(received.path, received.hash, received.size)
+
+    def discard_file(self, received: ReceivedFile) -> None:
+        """Remove a received file that won't be kept."""
+        try:
+            os.remove(received.temp_path)
+        except FileNotFoundError:
+            pass
+
+    def delete_file(self, file_path: str) -> bool:
         """Delete file from storage."""
         try:
             os.remove(file_path)
@@ -70,4 +125,4 @@ class FileService:
         return f"/files/{os.path.basename(file_path)}"
 
 
-file_service = FileService()
\ No newline at end of file
+file_service = FileService()
@@ -0,0 +1,218 @@
+from datetime import datetime, timedelta, UTC
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import delete, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.family_member import FamilyMember
+from app.models.health_event import EventType, HealthEvent
+from app.models.health_score import StaleHealthScore
+from app.services.change_feed import change_feed
+from app.services.job_queue import job_queue
+from app.services.response_cache import response_cache
+from app.services.sync_service import FAMILY_MEMBER
+
+# Penalty of one event of each type on the day it happens; it halves every
+# HALF_LIFE_DAYS, so a member's burden reflects both frequency and recency
+EVENT_TYPE_PENALTIES = {
+    EventType.SYMPTOM.value: 10.0,
+    EventType.MEDICATION.value: 4.0,
+    EventType.CHECKUP.value: 0.0,
+}
+HALF_LIFE_DAYS = 90.0
+# A checkup is due every CHECKUP_INTERVAL_DAYS; the penalty grows linearly
+# to CHECKUP_OVERDUE_PENALTY over the following interval
+CHECKUP_INTERVAL_DAYS = 365.0
+CHECKUP_OVERDUE_PENALTY = 20.0
+# Older events no longer move the score noticeably and are not read
+WINDOW_DAYS = 2 * CHECKUP_INTERVAL_DAYS
+
+RECOMPUTE_JOB = "health_scores.recompute_stale"
+
+
+class EventArrays(NamedTuple):
+    """Events of a batch of members, one array element per event."""
+
+    member_index: np.ndarray  # position of the event's member in the batch
+    event_type: np.ndarray
+    age_days: np.ndarray
+
+
+def compute_scores(events: EventArrays, member_count: int) -> np.ndarray:
+    """Score ``member_count`` members from their events, all at once.
+
+    Returns a float array of scores between 0 and 100, NaN for members
+    without any event.
+    """
+    decay = 0.5 ** (events.age_days / HALF_LIFE_DAYS)
+    penalty = np.zeros(len(events.event_type))
+    for event_type, weight in EVENT_TYPE_PENALTIES.items():
+        penalty[events.event_type == event_type] = weight
+    burden = np.bincount(
+        events.member_index, weights=penalty * decay, minlength=member_count
+    )
+
+    checkups = events.event_type == EventType.CHECKUP.value
+    days_since_checkup = np.full(member_count, np.inf)
+    np.minimum.at(
+        days_since_checkup, events.member_index[checkups], events.age_days[checkups]
+    )
+    overdue = np.clip(
+        (days_since_checkup - CHECKUP_INTERVAL_DAYS) / CHECKUP_INTERVAL_DAYS, 0, 1
+    )
+
+    scores = np.clip(100.0 - burden - CHECKUP_OVERDUE_PENALTY * overdue, 0, 100)
+    has_events = np.bincount(events.member_index, minlength=member_count) > 0
+    return np.where(has_events, scores, np.nan)
+
+
+class MemberScore(NamedTuple):
+    id: UUID
+    manager_id: UUID
+    health_score: Optional[int]
+
+
+class HealthScoreService:
+    """Batch computation of ``FamilyMember.health_score`` from event history.
+
+    Scores are computed for many members per query: their recent events are
+    fetched in bulk and reduced with NumPy. Event writes mark the member as
+    stale and queue a background job, deduplicated while it waits, that
+    runs ``recompute_stale`` to score only those; ``recompute_all`` also
+    lets the recency decay of quiet members catch up.
+    """
+
+    def mark_stale(self, db: Session, family_member_id: UUID) -> None:
+        """Queue a member for rescoring; call in the transaction of the write.
+
+        A member already queued gets a new ``marked_at``, so a recompute that
+        read the previous one leaves the member queued.
+        """
+        stale = insert(StaleHealthScore).values(family_member_id=family_member_id)
+        db.execute(
+            stale.on_conflict_do_update(
+                index_elements=[StaleHealthScore.family_member_id],
+                set_={"marked_at": stale.excluded.marked_at},
+            )
+        )
+        job_queue.enqueue(db, RECOMPUTE_JOB, dedup_key=RECOMPUTE_JOB)
+
+    def recompute_stale(self, db: Session, now: Optional[datetime] = None) -> int:
+        """Rescore one batch of stale members, commit, and return its size.
+
+        The queue rows are locked with SKIP LOCKED so concurrent runs work on
+        different members. Call until it returns 0.
+        """
+        stale = db.execute(
+            select(StaleHealthScore.family_member_id, StaleHealthScore.marked_at)
+            .order_by(StaleHealthScore.marked_at)
+            .limit(settings.HEALTH_SCORE_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not stale:
+            return 0
+        member_ids = [member_id for member_id, _ in stale]
+        members = db.execute(
+            select(FamilyMember.id, FamilyMember.manager_id, FamilyMember.health_score)
+            .where(FamilyMember.id.in_(member_ids))
+        ).all()
+        managers = self._score(db, [MemberScore(*member) for member in members], now)
+        # Members marked again while being scored stay queued
+        db.execute(
+            delete(StaleHealthScore).where(
+                tuple_(
+                    StaleHealthScore.family_member_id, StaleHealthScore.marked_at
+                ).in_([tuple(row) for row in stale])
+            )
+        )
+        db.commit()
+        self._invalidate(managers)
+        return len(member_ids)
+
+    def recompute_all(self, db: Session, now: Optional[datetime] = None) -> int:
+        """Rescore every member in batches, committing after each one."""
+        scored = 0
+        last_id = None
+        while True:
+            query = (
+                select(
+                    FamilyMember.id, FamilyMember.manager_id, FamilyMember.health_score
+                )
+                .order_by(FamilyMember.id)
+                .limit(settings.HEALTH_SCORE_BATCH_SIZE)
+            )
+            if last_id is not None:
+                query = query.where(FamilyMember.id > last_id)
+            members = [MemberScore(*member) for member in db.execute(query)]
+            if not members:
+                return scored
+            managers = self._score(db, members, now)
+            db.commit()
+            self._invalidate(managers)
+            scored += len(members)
+            last_id = members[-1].id
+
+    def _score(
+        self,
+        db: Session,
+        members: Sequence[MemberScore],
+        now: Optional[datetime] = None,
+    ) -> Set[UUID]:
+        """Store the new scores of ``members``; return the affected managers."""
+        if now is None:
+            now = datetime.now(UTC).replace(tzinfo=None)
+        index = {member.id: i for i, member in enumerate(members)}
+        rows = db.execute(
+            select(
+                HealthEvent.family_member_id,
+                HealthEvent.event_type,
+                HealthEvent.date_time,
+            ).where(
+                HealthEvent.family_member_id.in_(list(index)),
+                HealthEvent.date_time > now - timedelta(days=WINDOW_DAYS),
+                HealthEvent.date_time <= now,
+            )
+        ).all()
+        member_ids, event_types, dates = zip(*rows) if rows else ((), (), ())
+        ages = np.datetime64(now, "us") - np.array(dates, dtype="datetime64[us]")
+        events = EventArrays(
+            member_index=np.fromiter(
+                (index[member_id] for member_id in member_ids),
+                dtype=np.intp,
+                count=len(rows),
+            ),
+            event_type=np.array(event_types, dtype=str),
+            age_days=ages / np.timedelta64(1, "D"),
+        )
+        scores = compute_scores(events, len(members))
+
+        changed: List[Dict] = []
+        managers: Set[UUID] = set()
+        for member, score in zip(members, scores.tolist()):
+            health_score = None if np.isnan(score) else round(score)
+            if health_score != member.health_score:
+                changed.append({"id": member.id, "health_score": health_score})
+                managers.add(member.manager_id)
+                change_feed.publish(
+                    db, member.manager_id, FAMILY_MEMBER, member.id, "updated"
+                )
+        if changed:
+            db.execute(update(FamilyMember), changed)
+        return managers
+
+    def _invalidate(self, managers: Set[UUID]) -> None:
+        for manager_id in managers:
+            response_cache.invalidate_user(manager_id)
+
+
+health_score_service = HealthScoreService()
+
+
+@job_queue.handler(RECOMPUTE_JOB)
+def recompute_stale_job(db: Session, payload: Dict) -> None:
+    while health_score_service.recompute_stale(db):
+        pass
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.measurement_service import measurement_service
+
+logger = logging.getLogger(__name__)
+
+Rows = List[Dict[str, Any]]
+
+
+class IngestBufferFullError(Exception):
+    """No room freed up in the buffer before the submit timeout."""
+
+
+class IngestBuffer:
+    """Group commit of the measurement batches received by this node.
+
+    Batches wait in memory until ``flush_readings`` readings are pending or
+    the oldest one has waited ``flush_interval`` seconds. They are then
+    written with one upsert and one commit, and every submitter is answered
+    once that commit succeeded. Buffered and in-flight readings are bounded
+    by ``max_pending``; submitters wait for room up to ``submit_timeout``
+    and then fail, which the endpoint turns into a 503.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        flush_readings: int,
+        flush_interval: float,
+        max_pending: int,
+        submit_timeout: float,
+    ):
+        self.session_factory = session_factory
+        self.flush_readings = flush_readings
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.submit_timeout = submit_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bind_loop(None)
+
+    @property
+    def pending_readings(self) -> int:
+        """Readings buffered or being flushed."""
+        return self._pending_readings
+
+    async def submit(self, rows: Rows) -> int:
+        """Buffer rows and wait until they are committed; return their count."""
+        if len(rows) > self.max_pending:
+            raise ValueError(f"At most {self.max_pending} readings per batch")
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._bind_loop(loop)
+
+        async with self._space:
+            try:
+                await asyncio.wait_for(
+                    self._space.wait_for(
+                        lambda: self._pending_readings + len(rows) <= self.max_pending
+                    ),
+                    self.submit_timeout,
+                )
+            except asyncio.TimeoutError:
+                raise IngestBufferFullError("Ingestion buffer is full, retry later")
+            future = loop.create_future()
+            self._pending.append((rows, future))
+            self._pending_readings += len(rows)
+            self._buffered_readings += len(rows)
+            if self._buffered_readings >= self.flush_readings:
+                self._start_flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.flush_interval, self._start_flush)
+        return await future
+
+    async def stop(self) -> None:
+        """Flush what is buffered and wait for every flush in progress."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _bind_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        # Batches of a previous loop can no longer be answered
+        self._loop = loop
+        self._pending: List[Tuple[Rows, asyncio.Future]] = []
+        self._pending_readings = 0
+        self._buffered_readings = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+        self._space = asyncio.Condition() if loop is not None else None
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batches, self._pending = self._pending, []
+        self._buffered_readings = 0
+        task = self._loop.create_task(self._flush(batches))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batches: List[Tuple[Rows, asyncio.Future]]) -> None:
+        try:
+            try:
+                await run_in_threadpool(self._write, [rows for rows, _ in batches])
+            except Exception:
+                # One bad batch (e.g. of a member deleted meanwhile) must not
+                # fail the others, so retry them one by one
+                logger.warning("Group commit of %d batches failed", len(batches))
+                for rows, future in batches:
+                    try:
+                        await run_in_threadpool(self._write, [rows])
+                    except Exception as e:
+                        _resolve(future, exception=e)
+                    else:
+                        _resolve(future, len(rows))
+            else:
+                for rows, future in batches:
+                    _resolve(future, len(rows))
+        finally:
+            async with self._space:
+                self._pending_readings -= sum(len(rows) for rows, _ in batches)
+                self._space.notify_all()
+
+    def _write(self, batches: List[Rows]) -> None:
+        db = self.session_factory()
+        try:
+            measurement_service.upsert(db, (row for rows in batches for row in rows))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+def _resolve(
+    future: asyncio.Future, result: Any = None, exception: Optional[Exception] = None
+) -> None:
+    # The submitter may have gone away (e.g. client disconnect)
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+ingest_buffer = IngestBuffer(
+    SessionLocal,
+    settings.INGEST_FLUSH_READINGS,
+    settings.INGEST_FLUSH_INTERVAL_MS / 1000,
+    settings.INGEST_MAX_PENDING_READINGS,
+    settings.INGEST_SUBMIT_TIMEOUT_SECONDS,
+)
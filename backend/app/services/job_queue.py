@@ -0,0 +1,374 @@
+import logging
+import os
+import random
+import socket
+import threading
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import and_, case, delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Session, Dict[str, Any]], None]
+
+QUEUED = JobStatus.QUEUED.value
+RUNNING = JobStatus.RUNNING.value
+DONE = JobStatus.DONE.value
+FAILED = JobStatus.FAILED.value
+
+
+class ClaimedJob(NamedTuple):
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def default_worker_id(n: int = 0) -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{n}"
+
+
+class JobQueue:
+    """Durable background jobs stored in the ``jobs`` table.
+
+    ``enqueue`` inserts in the caller's transaction, so a job exists if and
+    only if the write that asked for it committed. Workers claim one job at
+    a time with UPDATE ... SKIP LOCKED on the queued index, so any number
+    of them can run side by side, and commit the claim before running the
+    handler: a slow job holds no lock, only a lease. Jobs whose worker died
+    are queued again once the lease ran out, so handlers run at least once
+    and must be idempotent.
+
+    A failed attempt is retried after an exponential backoff with jitter,
+    up to the job's ``max_attempts``; then it stays ``failed`` for
+    inspection until finished jobs are purged.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        lease: timedelta,
+        backoff_base: timedelta,
+        backoff_max: timedelta,
+        max_attempts: int,
+        poll_interval: timedelta,
+        maintenance_interval: timedelta,
+        retention: timedelta,
+    ):
+        self.session_factory = session_factory
+        self.lease = lease
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.maintenance_interval = maintenance_interval
+        self.retention = retention
+        self._handlers: Dict[str, JobHandler] = {}
+        self._stopped = threading.Event()
+
+    def handler(self, kind: str) -> Callable[[JobHandler], JobHandler]:
+        """Register the decorated function as the handler of ``kind`` jobs."""
+
+        def register(func: JobHandler) -> JobHandler:
+            self._handlers[kind] = func
+            return func
+
+        return register
+
+    def enqueue(
+        self,
+        db: Session,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        priority: int = 100,
+        dedup_key: Optional[str] = None,
+        run_at: Optional[datetime] = None,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        """Queue a job; call in the transaction of the write it belongs to.
+
+        Lower ``priority`` values run first. While a job with the same
+        ``dedup_key`` is still queued no other is added; once it runs, the
+        next enqueue queues a new one, so no work is lost.
+        """
+        db.execute(
+            insert(Job)
+            .values(
+                kind=kind,
+                payload=payload or {},
+                priority=priority,
+                dedup_key=dedup_key,
+                status=QUEUED,
+                attempts=0,
+                max_attempts=max_attempts or self.max_attempts,
+                run_at=run_at or _utcnow(),
+                created_at=_utcnow(),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Job.dedup_key],
+                index_where=Job.status == QUEUED,
+            )
+        )
+
+    def claim(self, worker_id: str, now: datetime) -> Optional[ClaimedJob]:
+        """Lease the next due job to ``worker_id``, or return None."""
+        db = self.session_factory()
+        try:
+            claimable = (
+                select(Job.id)
+                .where(Job.status == QUEUED, Job.run_at <= now)
+                .order_by(Job.priority, Job.run_at, Job.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            row = db.execute(
+                update(Job)
+                .where(Job.id.in_(claimable.scalar_subquery()))
+                .values(
+                    status=RUNNING,
+                    attempts=Job.attempts + 1,
+                    locked_at=now,
+                    locked_by=worker_id,
+                    started_at=now,
+                )
+                .returning(
+                    Job.id, Job.kind, Job.payload, Job.attempts, Job.max_attempts
+                )
+            ).first()
+            db.commit()
+        finally:
+            db.close()
+        return ClaimedJob(*row) if row else None
+
+    def run_once(self, worker_id: str, now: Optional[datetime] = None) -> bool:
+        """Claim and run one due job; return whether there was one."""
+        job = self.claim(worker_id, now or _utcnow())
+        if job is None:
+            return False
+
+        db = self.session_factory()
+        try:
+            handler = self._handlers.get(job.kind)
+            if handler is None:
+                raise LookupError(f"No handler for job kind {job.kind!r}")
+            handler(db, job.payload)
+            db.execute(
+                update(Job)
+                .where(Job.id == job.id, Job.locked_by == worker_id)
+                .values(
+                    status=DONE,
+                    locked_at=None,
+                    locked_by=None,
+                    finished_at=now or _utcnow(),
+                )
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.exception(
+                "Job %s (%s) failed on attempt %d", job.id, job.kind, job.attempts
+            )
+            failed_at = now or _utcnow()
+            self._release(
+                db,
+                and_(Job.id == job.id, Job.locked_by == worker_id),
+                failed_at,
+                retry_at=failed_at + self.backoff(job.attempts),
+                error=f"{type(e).__name__}: {e}",
+            )
+            db.commit()
+        finally:
+            db.close()
+        return True
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Delay before retrying a job that failed ``attempts`` times."""
+        delay = min(
+            self.backoff_base * 2 ** (attempts - 1), self.backoff_max
+        ).total_seconds()
+        # Jitter keeps jobs that failed together from retrying together
+        return timedelta(seconds=delay * random.uniform(0.75, 1.0))
+
+    def requeue_expired(self, now: datetime) -> int:
+        """Release the jobs of workers that outlived their lease."""
+        db = self.session_factory()
+        try:
+            released = self._release(
+                db,
+                and_(Job.status == RUNNING, Job.locked_at < now - self.lease),
+                now,
+                retry_at=now,
+                error="Lease expired",
+            )
+            db.commit()
+        finally:
+            db.close()
+        if released:
+            logger.warning("Requeued %d jobs with an expired lease", released)
+        return released
+
+    def purge(self, now: datetime) -> int:
+        """Delete jobs that finished longer than ``retention`` ago."""
+        db = self.session_factory()
+        try:
+            purged = db.execute(
+                delete(Job).where(
+                    Job.status.in_([DONE, FAILED]),
+                    Job.finished_at < now - self.retention,
+                )
+            ).rowcount
+            db.commit()
+        finally:
+            db.close()
+        return purged
+
+    def run(self, worker_id: Optional[str] = None) -> None:
+        """Run jobs until ``stop`` is called, polling while the queue is empty."""
+        worker_id = worker_id or default_worker_id()
+        next_maintenance = _utcnow()
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            now = _utcnow()
+            try:
+                if now >= next_maintenance:
+                    self.requeue_expired(now)
+                    self.purge(now)
+                    next_maintenance = now + self.maintenance_interval
+                ran = self.run_once(worker_id)
+            except Exception:
+                # The database is unreachable; the lease protects the job
+                logger.exception("Running the job queue failed")
+                ran = False
+            if not ran:
+                self._stopped.wait(self.poll_interval.total_seconds())
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def stats(
+        self, db: Session, window: timedelta, now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Queue depth and latency per job kind.
+
+        Depth counts the jobs currently queued, due, running and failed;
+        latency covers the jobs that finished within ``window``: the wait
+        from due to started, and the run time.
+        """
+        if now is None:
+            now = _utcnow()
+        due = and_(Job.status == QUEUED, Job.run_at <= now)
+        depth = db.execute(
+            select(
+                Job.kind,
+                func.count().filter(Job.status == QUEUED),
+                func.count().filter(due),
+                func.count().filter(Job.status == RUNNING),
+                func.count().filter(Job.status == FAILED),
+                func.min(Job.run_at).filter(due),
+            )
+            .where(Job.status != DONE)
+            .group_by(Job.kind)
+        ).all()
+
+        wait = func.extract("epoch", Job.started_at - Job.run_at)
+        run_time = func.extract("epoch", Job.finished_at - Job.started_at)
+        latency = db.execute(
+            select(
+                Job.kind,
+                func.count(),
+                func.avg(wait),
+                func.percentile_cont(0.95).within_group(wait),
+                func.avg(run_time),
+            )
+            .where(Job.status == DONE, Job.finished_at >= now - window)
+            .group_by(Job.kind)
+        ).all()
+
+        kinds: Dict[str, Dict[str, Any]] = {}
+        for kind, queued, ready, running, failed, oldest in depth:
+            kinds.setdefault(kind, _empty_stats(kind)).update(
+                queued=queued,
+                due=ready,
+                running=running,
+                failed=failed,
+                oldest_due_seconds=(now - oldest).total_seconds() if oldest else 0.0,
+            )
+        for kind, completed, avg_wait, p95_wait, avg_run in latency:
+            kinds.setdefault(kind, _empty_stats(kind)).update(
+                completed=completed,
+                avg_wait_seconds=float(avg_wait),
+                p95_wait_seconds=float(p95_wait),
+                avg_run_seconds=float(avg_run),
+            )
+        return [kinds[kind] for kind in sorted(kinds)]
+
+    def _release(
+        self,
+        db: Session,
+        where,
+        now: datetime,
+        retry_at: datetime,
+        error: str,
+    ) -> int:
+        """Queue running jobs again, or fail those out of attempts."""
+        other = aliased(Job)
+        # A retry must not break the dedup of a job queued meanwhile; that
+        # job does the same work, so this one is simply done
+        duplicate = exists().where(
+            other.dedup_key == Job.dedup_key,
+            other.status == QUEUED,
+            other.id != Job.id,
+        )
+        give_up = Job.attempts >= Job.max_attempts
+        return db.execute(
+            update(Job)
+            .where(where)
+            .values(
+                status=case((give_up, FAILED), (duplicate, DONE), else_=QUEUED),
+                run_at=retry_at,
+                locked_at=None,
+                locked_by=None,
+                last_error=error,
+                finished_at=case((give_up | duplicate, now), else_=None),
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+
+def _empty_stats(kind: str) -> Dict[str, Any]:
+    return {
+        "kind": kind,
+        "queued": 0,
+        "due": 0,
+        "running": 0,
+        "failed": 0,
+        "oldest_due_seconds": 0.0,
+        "completed": 0,
+        "avg_wait_seconds": 0.0,
+        "p95_wait_seconds": 0.0,
+        "avg_run_seconds": 0.0,
+    }
+
+
+job_queue = JobQueue(
+    SessionLocal,
+    lease=timedelta(seconds=settings.JOB_LEASE_SECONDS),
+    backoff_base=timedelta(seconds=settings.JOB_BACKOFF_BASE_SECONDS),
+    backoff_max=timedelta(seconds=settings.JOB_BACKOFF_MAX_SECONDS),
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    poll_interval=timedelta(seconds=settings.JOB_POLL_SECONDS),
+    maintenance_interval=timedelta(seconds=settings.JOB_MAINTENANCE_SECONDS),
+    retention=timedelta(seconds=settings.JOB_RETENTION_SECONDS),
+)
@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+from sqlalchemy import extract, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.measurement import Measurement
+from app.schemas.measurement import MeasurementReading
+from app.utils.datetimes import naive_utc
+
+
+class Bucket(NamedTuple):
+    start: datetime
+    end: datetime
+    min: float
+    max: float
+    avg: float
+    count: int
+
+
+class MeasurementService:
+    def rows(
+        self, family_member_id: UUID, readings: Iterable[MeasurementReading]
+    ) -> List[Dict[str, Any]]:
+        """Rows to store for a member's readings; the last of a (metric, ts) wins.
+
+        Times are stored as naive UTC, like the times of events.
+        """
+        rows = {
+            (reading.metric.value, naive_utc(reading.ts)): {
+                "family_member_id": family_member_id,
+                "metric": reading.metric.value,
+                "ts": naive_utc(reading.ts),
+                "value": reading.value,
+            }
+            for reading in readings
+        }
+        return list(rows.values())
+
+    def upsert(self, db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+        """Store rows in one multi-row upsert.
+
+        A row repeating a stored (member, metric, ts) replaces its value, so
+        clients can safely resend a batch. Rows are written in key order, so
+        concurrent upserts lock them in the same order and cannot deadlock.
+        """
+        unique = {
+            (row["family_member_id"], row["metric"], row["ts"]): row for row in rows
+        }
+        stmt = insert(Measurement)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    Measurement.family_member_id,
+                    Measurement.metric,
+                    Measurement.ts,
+                ],
+                set_={"value": stmt.excluded.value},
+            ),
+            [unique[key] for key in sorted(unique)],
+        )
+
+    def ingest(
+        self,
+        db: Session,
+        family_member_id: UUID,
+        readings: Iterable[MeasurementReading],
+    ) -> int:
+        """Store a member's readings; return how many were stored."""
+        rows = self.rows(family_member_id, readings)
+        self.upsert(db, rows)
+        return len(rows)
+
+    def downsample(
+        self,
+        db: Session,
+        family_member_id: UUID,
+        metric: str,
+        points: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Bucket]:
+        """Aggregate a metric's readings into at most ``points`` time buckets.
+
+        The range defaults to the first and last stored readings. Buckets
+        are equal slices of it, aggregated in Postgres with min/max/avg, so
+        only the buckets cross the wire whatever the number of readings;
+        empty buckets are left out.
+        """
+        start, end = naive_utc(start), naive_utc(end)
+        conditions = [
+            Measurement.family_member_id == family_member_id,
+            Measurement.metric == metric,
+        ]
+        if start:
+            conditions.append(Measurement.ts >= start)
+        if end:
+            conditions.append(Measurement.ts <= end)
+
+        first, last = db.execute(
+            select(func.min(Measurement.ts), func.max(Measurement.ts)).where(
+                *conditions
+            )
+        ).one()
+        if first is None:
+            return []
+        start = start or first
+        width = max(((end or last) - start).total_seconds(), 1) / points
+
+        offset = extract("epoch", Measurement.ts - start)
+        bucket = func.least(func.floor(offset / width), points - 1)
+        rows = db.execute(
+            select(
+                func.min(Measurement.ts),
+                func.max(Measurement.ts),
+                func.min(Measurement.value),
+                func.max(Measurement.value),
+                func.avg(Measurement.value),
+                func.count(),
+            )
+            .where(*conditions)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        return [Bucket(*row) for row in rows]
+
+
+measurement_service = MeasurementService()
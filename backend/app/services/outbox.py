@@ -0,0 +1,359 @@
+import hashlib
+import hmac
+import logging
+import threading
+import urllib.request
+from contextlib import contextmanager
+from datetime import datetime, timedelta, UTC
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy import delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.models.outbox import OutboxMessage
+from app.models.watermark import Watermark
+from app.services.sync_service import (
+    INITIAL_CURSOR,
+    ChangeCursor,
+    visibility_horizon,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxEvent(NamedTuple):
+    user_id: UUID
+    entity_type: str
+    entity_id: UUID
+    action: str
+    created_at: datetime
+
+
+OutboxConsumer = Callable[[Sequence[OutboxEvent]], None]
+
+
+def compact(events: Sequence[OutboxEvent]) -> List[OutboxEvent]:
+    """Merge the changes of each entity in a batch into one.
+
+    Consumers read the current state of an entity, so only its latest change
+    is kept, in the position of that change. An entity created within the
+    batch is still reported as created, and left out if it was deleted too.
+    """
+    merged: Dict[Tuple[str, UUID], OutboxEvent] = {}
+    for event in events:
+        key = (event.entity_type, event.entity_id)
+        previous = merged.pop(key, None)
+        if previous is not None and previous.action == "created":
+            if event.action == "deleted":
+                continue
+            event = event._replace(action="created")
+        merged[key] = event
+    return list(merged.values())
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class WebhookConsumer:
+    """Posts batches of events as JSON; any error response is a failure.
+
+    With a secret, the body is signed with HMAC-SHA256 in the
+    ``X-Sesame-Signature`` header.
+    """
+
+    def __init__(self, url: str, secret: str, timeout: float):
+        self.url = url
+        self.secret = secret
+        self.timeout = timeout
+
+    def __call__(self, events: Sequence[OutboxEvent]) -> None:
+        body = orjson.dumps({"events": [event._asdict() for event in events]})
+        headers = {"Content-Type": "application/json"}
+        if self.secret:
+            signature = hmac.new(self.secret.encode(), body, hashlib.sha256)
+            headers["X-Sesame-Signature"] = f"sha256={signature.hexdigest()}"
+        request = urllib.request.Request(
+            self.url, data=body, headers=headers, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class Outbox:
+    """Transactional outbox of changes to synced rows.
+
+    ``append`` writes a message in the transaction of the change, so
+    consumers learn about every committed write and nothing else, without
+    adding their work to the write. The relay delivers messages to each
+    registered consumer in batches, compacted per entity, and advances
+    the consumer's watermark only once it returned: delivery is at least
+    once, and a failing consumer is retried with backoff without holding
+    up the others.
+
+    Like the delta sync stream, messages are read in transaction order up
+    to the oldest running transaction, so a write that commits late can't
+    slip behind a watermark. A batch is delivered outside any transaction,
+    under a session advisory lock per consumer taken on a connection from
+    ``connect``, so relays can run side by side; the watermark is then
+    advanced only from the position it was read at.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        connect: Callable[[], Connection],
+        batch_size: int,
+        poll_interval: timedelta,
+        retry_base: timedelta,
+        retry_max: timedelta,
+        purge_interval: timedelta,
+        retention: timedelta,
+    ):
+        self.session_factory = session_factory
+        self.connect = connect
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.purge_interval = purge_interval
+        self.retention = retention
+        self._consumers: Dict[str, OutboxConsumer] = {}
+        self._failures: Dict[str, int] = {}
+        self._retry_at: Dict[str, datetime] = {}
+        self._stopped = threading.Event()
+
+    def append(
+        self,
+        db: Session,
+        user_id: UUID,
+        entity_type: str,
+        entity_id: UUID,
+        action: str,
+    ) -> None:
+        """Record a change; call in the transaction of the write."""
+        db.execute(
+            insert(OutboxMessage).values(
+                user_id=user_id,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                action=action,
+                created_at=_utcnow(),
+            )
+        )
+
+    def register(self, name: str, consumer: OutboxConsumer) -> None:
+        """Deliver every message from now on to ``consumer``.
+
+        The name identifies the consumer's position across restarts; a new
+        consumer starts with the oldest message not yet purged.
+        """
+        self._consumers[name] = consumer
+
+    def consumer(self, name: str) -> Callable[[OutboxConsumer], OutboxConsumer]:
+        """Register the decorated function as the consumer ``name``."""
+
+        def register(func: OutboxConsumer) -> OutboxConsumer:
+            self.register(name, func)
+            return func
+
+        return register
+
+    def relay(self, name: str) -> int:
+        """Deliver the next batch to consumer ``name``; return the batch size."""
+        key = _watermark_name(name)
+        db = self.session_factory()
+        try:
+            with _advisory_lock(self.connect, key) as locked:
+                if not locked:
+                    # Another relay is delivering to this consumer
+                    return 0
+                cursor, rows = self._read_batch(db, key)
+                # Deliver outside any transaction, so a slow consumer holds
+                # back neither the sync horizon nor the other consumers
+                db.commit()
+                if not rows:
+                    return 0
+                events = compact([OutboxEvent(*row[:5]) for row in rows])
+                if events:
+                    self._consumers[name](events)
+                advanced = db.execute(
+                    update(Watermark)
+                    .where(Watermark.name == key, Watermark.value == cursor.encode())
+                    .values(
+                        value=ChangeCursor(*rows[-1][5:]).encode(),
+                        updated_at=func.now(),
+                    )
+                ).rowcount
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if not advanced:
+            logger.warning("Outbox watermark of %s moved during delivery", name)
+            return 0
+        return len(rows)
+
+    def _read_batch(self, db: Session, key: str) -> Tuple[ChangeCursor, List]:
+        value = db.scalar(select(Watermark.value).where(Watermark.name == key))
+        if value is None:
+            value = INITIAL_CURSOR.encode()
+            db.execute(
+                insert(Watermark)
+                .values(name=key, value=value)
+                .on_conflict_do_nothing()
+            )
+        cursor = ChangeCursor.decode(value)
+        horizon, own_xid = visibility_horizon(db)
+        rows = db.execute(
+            select(
+                OutboxMessage.user_id,
+                OutboxMessage.entity_type,
+                OutboxMessage.entity_id,
+                OutboxMessage.action,
+                OutboxMessage.created_at,
+                OutboxMessage.change_xid,
+                OutboxMessage.change_seq,
+            )
+            .where(
+                tuple_(OutboxMessage.change_xid, OutboxMessage.change_seq)
+                > tuple_(*cursor),
+                or_(
+                    OutboxMessage.change_xid < horizon,
+                    OutboxMessage.change_xid == own_xid,
+                ),
+            )
+            .order_by(OutboxMessage.change_xid, OutboxMessage.change_seq)
+            .limit(self.batch_size)
+        ).all()
+        return cursor, rows
+
+    def relay_all(self, now: datetime) -> int:
+        """Deliver a batch to every consumer not waiting for a retry."""
+        relayed = 0
+        for name in list(self._consumers):
+            if self._retry_at.get(name, now) > now:
+                continue
+            try:
+                relayed += self.relay(name)
+            except Exception:
+                failures = self._failures.get(name, 0) + 1
+                delay = min(self.retry_base * 2 ** (failures - 1), self.retry_max)
+                logger.exception(
+                    "Outbox consumer %s failed %d times, retrying in %s",
+                    name,
+                    failures,
+                    delay,
+                )
+                self._failures[name] = failures
+                self._retry_at[name] = now + delay
+            else:
+                self._failures.pop(name, None)
+                self._retry_at.pop(name, None)
+        return relayed
+
+    def purge(self, now: datetime) -> int:
+        """Delete the messages that every registered consumer has received.
+
+        Without consumers, messages are kept for ``retention``, so one
+        registered later still finds the recent changes.
+        """
+        db = self.session_factory()
+        try:
+            names = [_watermark_name(name) for name in self._consumers]
+            if names:
+                values = db.scalars(
+                    select(Watermark.value).where(Watermark.name.in_(names))
+                ).all()
+                if len(values) < len(names):
+                    # A consumer that never ran still needs everything
+                    return 0
+                through = min(ChangeCursor.decode(value) for value in values)
+                received = tuple_(
+                    OutboxMessage.change_xid, OutboxMessage.change_seq
+                ) <= tuple_(*through)
+            else:
+                received = OutboxMessage.created_at < now - self.retention
+            purged = db.execute(delete(OutboxMessage).where(received)).rowcount
+            db.commit()
+        finally:
+            db.close()
+        return purged
+
+    def run(self) -> None:
+        """Relay until ``stop`` is called, polling while there is nothing new."""
+        next_purge = _utcnow()
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            now = _utcnow()
+            try:
+                relayed = self.relay_all(now)
+                if now >= next_purge:
+                    self.purge(now)
+                    next_purge = now + self.purge_interval
+            except Exception:
+                logger.exception("Relaying the outbox failed")
+                relayed = 0
+            if not relayed:
+                self._stopped.wait(self.poll_interval.total_seconds())
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+def _watermark_name(consumer: str) -> str:
+    return f"outbox.{consumer}"
+
+
+@contextmanager
+def _advisory_lock(connect: Callable[[], Connection], key: str) -> Iterator[bool]:
+    """Try to take a session advisory lock on ``key``; yield whether it did.
+
+    The lock is held by a connection of its own that stays outside any
+    transaction, so holding it pins no snapshot.
+    """
+    with connect() as connection:
+        lock_id = func.hashtext(key)
+        locked = connection.scalar(select(func.pg_try_advisory_lock(lock_id)))
+        connection.commit()
+        try:
+            yield locked
+        finally:
+            if locked:
+                try:
+                    connection.execute(select(func.pg_advisory_unlock(lock_id)))
+                    connection.commit()
+                except Exception:
+                    # Never return a connection still holding the lock
+                    connection.invalidate()
+                    raise
+
+
+outbox = Outbox(
+    SessionLocal,
+    engine.connect,
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=timedelta(seconds=settings.OUTBOX_POLL_SECONDS),
+    retry_base=timedelta(seconds=settings.OUTBOX_RETRY_BASE_SECONDS),
+    retry_max=timedelta(seconds=settings.OUTBOX_RETRY_MAX_SECONDS),
+    purge_interval=timedelta(seconds=settings.OUTBOX_PURGE_SECONDS),
+    retention=timedelta(seconds=settings.OUTBOX_RETENTION_SECONDS),
+)
+
+for url in settings.OUTBOX_WEBHOOK_URLS:
+    outbox.register(
+        f"webhook.{hashlib.sha256(url.encode()).hexdigest()[:16]}",
+        WebhookConsumer(
+            url,
+            settings.OUTBOX_WEBHOOK_SECRET,
+            settings.OUTBOX_WEBHOOK_TIMEOUT_SECONDS,
+        ),
+    )
@@ -0,0 +1,116 @@
+from datetime import datetime, UTC
+from typing import List, Optional, Set
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+PARENT_TABLE = "health_events"
+DEFAULT_PARTITION = "health_events_default"
+
+
+class PartitionService:
+    """Maintenance of the yearly ``date_time`` partitions of health_events.
+
+    Years are used rather than months because event dates span a family's
+    whole medical history while the volume per year stays modest, so
+    monthly partitions would mostly be tiny.
+    """
+
+    def partition_name(self, year: int) -> str:
+        return f"{PARENT_TABLE}_y{year}"
+
+    def get_partitions(self, db: Session) -> Set[str]:
+        """Return the names of the partitions attached to health_events."""
+        rows = db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :parent"
+            ),
+            {"parent": PARENT_TABLE},
+        )
+        return set(rows.scalars())
+
+    def create_partition(self, db: Session, year: int) -> str:
+        """Create the partition of one year.
+
+        Rows of that year already sitting in the default partition are moved
+        into the new partition before it is attached, since attaching a range
+        that the default partition still holds rows for is rejected. Deleting
+        them from the default partition cascades to their attachments, so
+        those are set aside and restored once the partition is attached.
+        """
+        name = self.partition_name(year)
+        bounds = {"start": datetime(year, 1, 1), "end": datetime(year + 1, 1, 1)}
+        in_range = "date_time >= :start AND date_time < :end"
+
+        db.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        db.execute(
+            text(
+                "CREATE TEMP TABLE moved_attachments AS SELECT * FROM attachments "
+                "WHERE event_date_time >= :start AND event_date_time < :end"
+            ),
+            bounds,
+        )
+        db.execute(
+            text(
+                f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} "
+                f"WHERE {in_range}"
+            ),
+            bounds,
+        )
+        db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds)
+        # Indexes and foreign keys of the parent are created on attach
+        db.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        )
+        db.execute(text("INSERT INTO attachments SELECT * FROM moved_attachments"))
+        db.execute(text("DROP TABLE moved_attachments"))
+        return name
+
+    def ensure_partitions(
+        self, db: Session, years_ahead: Optional[int] = None
+    ) -> List[str]:
+        """Create missing partitions and return the names of the new ones.
+
+        Covers the current year, ``years_ahead`` future years and every year
+        that has rows in the default partition, so rows written before their
+        partition existed are moved out of it.
+        """
+        if years_ahead is None:
+            years_ahead = settings.HEALTH_EVENTS_PARTITIONS_AHEAD
+
+        # Serialize concurrent runs, e.g. several API nodes starting up
+        db.execute(select(func.pg_advisory_xact_lock(func.hashtext(PARENT_TABLE))))
+
+        current_year = datetime.now(UTC).year
+        years = set(range(current_year, current_year + years_ahead + 1))
+        years.update(
+            int(year)
+            for year in db.execute(
+                text(
+                    "SELECT DISTINCT extract(year FROM date_time) "
+                    f"FROM {DEFAULT_PARTITION}"
+                )
+            ).scalars()
+        )
+
+        existing = self.get_partitions(db)
+        return [
+            self.create_partition(db, year)
+            for year in sorted(years)
+            if self.partition_name(year) not in existing
+        ]
+
+
+partition_service = PartitionService()
@@ -0,0 +1,462 @@
+import calendar
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    Integer,
+    Subquery,
+    Text,
+    and_,
+    case,
+    cast,
+    delete,
+    extract,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.orm import Session
+
+from app.models.family_member import FamilyMember
+from app.models.health_event import HealthEvent
+from app.models.recurrence import (
+    EventRecurrence,
+    OccurrenceOverride,
+    RecurrenceFrequency,
+)
+from app.utils.datetimes import naive_utc
+
+# Columns of the rows of ``RecurrenceService.timeline``
+TIMELINE_COLUMNS = (
+    "id",
+    "title",
+    "event_type",
+    "description",
+    "date_time",
+    "family_member_id",
+    "created_at",
+    "updated_at",
+    "series_id",
+    "occurrence_at",
+)
+
+
+def _step(frequency: str, interval: int) -> Tuple[int, int]:
+    """Months and days between two occurrences."""
+    if frequency == RecurrenceFrequency.MONTHLY:
+        return interval, 0
+    if frequency == RecurrenceFrequency.WEEKLY:
+        return 0, 7 * interval
+    return 0, interval
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    # Clamped to the end of shorter months, as Postgres does
+    year, month = divmod(value.year * 12 + value.month - 1 + months, 12)
+    day = min(value.day, calendar.monthrange(year, month + 1)[1])
+    return value.replace(year=year, month=month + 1, day=day)
+
+
+def occurrence(starts_at: datetime, frequency: str, interval: int, n: int) -> datetime:
+    """Date and time of the ``n``-th occurrence, the event itself being 0.
+
+    Always counted from the first occurrence, so monthly series on the 31st
+    come back to the 31st after shorter months.
+    """
+    months, days = _step(frequency, interval)
+    return _add_months(starts_at, n * months) + timedelta(days=n * days)
+
+
+def occurrence_index(
+    starts_at: datetime, frequency: str, interval: int, value: datetime
+) -> int:
+    """Index of the last occurrence at or before ``value``, -1 before the first."""
+    if value < starts_at:
+        return -1
+    months, days = _step(frequency, interval)
+    if months:
+        elapsed = (value.year - starts_at.year) * 12 + value.month - starts_at.month
+        n = elapsed // months
+        if occurrence(starts_at, frequency, interval, n) > value:
+            n -= 1
+        return n
+    return (value - starts_at) // timedelta(days=days)
+
+
+def last_occurrence(
+    starts_at: datetime,
+    frequency: str,
+    interval: int,
+    count: Optional[int] = None,
+    until: Optional[datetime] = None,
+) -> Optional[datetime]:
+    """Date and time of the last occurrence, None for endless series."""
+    last = None
+    if count is not None:
+        last = count - 1
+    if until is not None:
+        index = max(occurrence_index(starts_at, frequency, interval, until), 0)
+        last = index if last is None else min(last, index)
+    if last is None:
+        return None
+    return occurrence(starts_at, frequency, interval, last)
+
+
+def _sql_step():
+    frequency, interval = EventRecurrence.frequency, EventRecurrence.interval
+    months = case(
+        (frequency == RecurrenceFrequency.MONTHLY.value, interval),
+        else_=0,
+    )
+    days = case(
+        (frequency == RecurrenceFrequency.WEEKLY.value, 7 * interval),
+        (frequency == RecurrenceFrequency.DAILY.value, interval),
+        else_=0,
+    )
+    return months, days
+
+
+def _sql_index(value, days_per_month: int):
+    """Occurrence index of ``value`` if every month had ``days_per_month`` days."""
+    months, days = _sql_step()
+    return extract("epoch", value - EventRecurrence.starts_at) / (
+        86400 * (days + days_per_month * months)
+    )
+
+
+def _occurrence_id(series_id, occurrence_at):
+    # Stable id of an occurrence, so clients can track it across reads
+    return cast(
+        func.md5(func.concat(cast(series_id, Text), "/", cast(occurrence_at, Text))),
+        PG_UUID(as_uuid=True),
+    )
+
+
+class OccurrenceCount(NamedTuple):
+    family_member_id: UUID
+    event_type: str
+    month: date
+    event_count: int
+    last_event_at: datetime
+
+
+class RecurrenceService:
+    """Recurring health events, expanded lazily.
+
+    A recurring event is stored once, with its rule in
+    ``event_recurrences``. Its further occurrences are generated by Postgres
+    inside the read query, only for the date window being read, and merged
+    with stored events so filters, ordering, counts and pagination treat
+    both alike. Single occurrences can be changed or cancelled through
+    ``occurrence_overrides``.
+    """
+
+    def get_rule(self, db: Session, health_event_id: UUID) -> Optional[EventRecurrence]:
+        return db.get(EventRecurrence, health_event_id)
+
+    def set_rule(
+        self,
+        db: Session,
+        event: HealthEvent,
+        frequency: RecurrenceFrequency,
+        interval: int = 1,
+        count: Optional[int] = None,
+        until: Optional[datetime] = None,
+    ) -> EventRecurrence:
+        """Make an event recurring, or change its rule.
+
+        Overrides of occurrences that the new rule no longer produces are
+        dropped.
+        """
+        until = naive_utc(until)
+        if until is not None and until < event.date_time:
+            raise ValueError("The recurrence must end after the event")
+        frequency = RecurrenceFrequency(frequency).value
+        rule = db.get(EventRecurrence, event.id)
+        if rule is None:
+            rule = EventRecurrence(health_event_id=event.id)
+            db.add(rule)
+        rule.family_member_id = event.family_member_id
+        rule.frequency = frequency
+        rule.interval = interval
+        rule.count = count
+        rule.until = until
+        rule.starts_at = event.date_time
+        rule.ends_at = last_occurrence(
+            event.date_time, frequency, interval, count, until
+        )
+        db.flush()
+
+        overridden = db.scalars(
+            select(OccurrenceOverride.occurrence_at).where(
+                OccurrenceOverride.health_event_id == event.id
+            )
+        ).all()
+        dropped = [value for value in overridden if not self.is_occurrence(rule, value)]
+        if dropped:
+            db.execute(
+                delete(OccurrenceOverride).where(
+                    OccurrenceOverride.health_event_id == event.id,
+                    OccurrenceOverride.occurrence_at.in_(dropped),
+                )
+            )
+        return rule
+
+    def remove_rule(self, db: Session, health_event_id: UUID) -> None:
+        """Stop an event from recurring; its overrides go with the rule."""
+        db.execute(
+            delete(EventRecurrence).where(
+                EventRecurrence.health_event_id == health_event_id
+            )
+        )
+
+    def event_updated(self, db: Session, event: HealthEvent) -> None:
+        """Follow a recurring event moved to another family member."""
+        db.execute(
+            update(EventRecurrence)
+            .where(
+                EventRecurrence.health_event_id == event.id,
+                EventRecurrence.family_member_id != event.family_member_id,
+            )
+            .values(family_member_id=event.family_member_id)
+        )
+
+    def is_occurrence(self, rule: EventRecurrence, value: datetime) -> bool:
+        """Whether the rule produces an occurrence at ``value``, after the event."""
+        if rule.ends_at is not None and value > rule.ends_at:
+            return False
+        n = occurrence_index(rule.starts_at, rule.frequency, rule.interval, value)
+        return n >= 1 and occurrence(
+            rule.starts_at, rule.frequency, rule.interval, n
+        ) == value
+
+    def override(
+        self,
+        db: Session,
+        rule: EventRecurrence,
+        occurrence_at: datetime,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        date_time: Optional[datetime] = None,
+        cancelled: bool = False,
+    ) -> OccurrenceOverride:
+        """Change or cancel one occurrence, replacing its previous override."""
+        occurrence_at = naive_utc(occurrence_at)
+        if not self.is_occurrence(rule, occurrence_at):
+            raise ValueError("The event has no occurrence at this date and time")
+        values = {
+            "title": title,
+            "description": description,
+            "date_time": naive_utc(date_time),
+            "cancelled": cancelled,
+        }
+        stmt = insert(OccurrenceOverride).values(
+            health_event_id=rule.health_event_id,
+            occurrence_at=occurrence_at,
+            **values,
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    OccurrenceOverride.health_event_id,
+                    OccurrenceOverride.occurrence_at,
+                ],
+                set_={**values, "updated_at": func.now()},
+            )
+        )
+        return db.get(
+            OccurrenceOverride,
+            (rule.health_event_id, occurrence_at),
+            populate_existing=True,
+        )
+
+    def timeline(
+        self,
+        start: Optional[datetime],
+        end: datetime,
+        manager_id: Optional[UUID] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> Subquery:
+        """Stored events merged with the occurrences between ``start`` and ``end``.
+
+        Returns a subquery with ``TIMELINE_COLUMNS``, or only with the
+        ``columns`` given, which every branch of the union then narrows its
+        select list to (``id`` is always included). Stored events are all
+        included, so filter the date range on the result; ``series_id`` and
+        ``occurrence_at`` are set on the rows of recurring events.
+        Occurrences are generated from the rules of the members of
+        ``manager_id`` (of everybody when None), and only for the indexes
+        that can fall in the window.
+        """
+        rule = EventRecurrence
+        event = HealthEvent
+        changed = OccurrenceOverride
+        months, days = _sql_step()
+        names = [
+            name
+            for name in TIMELINE_COLUMNS
+            if columns is None or name == "id" or name in columns
+        ]
+
+        def project(**expressions):
+            return [expressions[name].label(name) for name in names]
+
+        stored = select(
+            *project(
+                id=event.id,
+                title=event.title,
+                event_type=event.event_type,
+                description=event.description,
+                date_time=event.date_time,
+                family_member_id=event.family_member_id,
+                created_at=event.created_at,
+                updated_at=event.updated_at,
+                series_id=rule.health_event_id,
+                occurrence_at=case(
+                    (rule.health_event_id.is_not(None), event.date_time), else_=null()
+                ),
+            )
+        ).outerjoin(rule, rule.health_event_id == event.id)
+
+        first = literal(1)
+        if start is not None:
+            first = func.greatest(
+                1, cast(func.floor(_sql_index(literal(start), 31)), Integer)
+            )
+        last = cast(
+            func.ceil(_sql_index(func.least(literal(end), rule.ends_at), 28)), Integer
+        )
+        indexes = func.generate_series(first, last).table_valued("n").lateral("n")
+        occurrence_at = rule.starts_at + func.make_interval(
+            0, indexes.c.n * months, 0, indexes.c.n * days
+        )
+        in_window = [occurrence_at <= end]
+        if start is not None:
+            in_window.append(occurrence_at >= start)
+        generated = (
+            select(
+                *project(
+                    id=_occurrence_id(rule.health_event_id, occurrence_at),
+                    title=event.title,
+                    event_type=event.event_type,
+                    description=event.description,
+                    date_time=occurrence_at,
+                    family_member_id=event.family_member_id,
+                    created_at=event.created_at,
+                    updated_at=func.greatest(event.updated_at, rule.updated_at),
+                    series_id=rule.health_event_id,
+                    occurrence_at=occurrence_at,
+                )
+            )
+            .select_from(rule)
+            .join(
+                event,
+                and_(
+                    event.id == rule.health_event_id,
+                    event.date_time == rule.starts_at,
+                ),
+            )
+            .join(indexes, true())
+            .outerjoin(
+                changed,
+                and_(
+                    changed.health_event_id == rule.health_event_id,
+                    changed.occurrence_at == occurrence_at,
+                ),
+            )
+            .where(
+                rule.starts_at <= end,
+                changed.health_event_id.is_(None),
+                or_(rule.ends_at.is_(None), occurrence_at <= rule.ends_at),
+                *in_window,
+            )
+        )
+        if start is not None:
+            generated = generated.where(
+                or_(rule.ends_at.is_(None), rule.ends_at >= start)
+            )
+
+        date_time = func.coalesce(changed.date_time, changed.occurrence_at)
+        overridden = (
+            select(
+                *project(
+                    id=_occurrence_id(rule.health_event_id, changed.occurrence_at),
+                    title=func.coalesce(changed.title, event.title),
+                    event_type=event.event_type,
+                    description=func.coalesce(changed.description, event.description),
+                    date_time=date_time,
+                    family_member_id=event.family_member_id,
+                    created_at=event.created_at,
+                    updated_at=func.greatest(
+                        event.updated_at, rule.updated_at, changed.updated_at
+                    ),
+                    series_id=rule.health_event_id,
+                    occurrence_at=changed.occurrence_at,
+                )
+            )
+            .select_from(changed)
+            .join(rule, rule.health_event_id == changed.health_event_id)
+            .join(
+                event,
+                and_(
+                    event.id == rule.health_event_id,
+                    event.date_time == rule.starts_at,
+                ),
+            )
+            .where(~changed.cancelled, date_time <= end)
+        )
+        if start is not None:
+            overridden = overridden.where(date_time >= start)
+
+        if manager_id is not None:
+            members = select(FamilyMember.id).where(
+                FamilyMember.manager_id == manager_id
+            )
+            generated = generated.where(rule.family_member_id.in_(members))
+            overridden = overridden.where(rule.family_member_id.in_(members))
+        return union_all(stored, generated, overridden).subquery("timeline")
+
+    def occurrence_counts(
+        self, db: Session, manager_id: UUID, now: datetime
+    ) -> List[OccurrenceCount]:
+        """Count the past generated occurrences of a manager's members by month.
+
+        Stored events are counted by the rollup tables already; this adds
+        what recurring events expanded to until ``now``.
+        """
+        events = self.timeline(None, now, manager_id)
+        month = func.date_trunc("month", events.c.date_time)
+        rows = db.execute(
+            select(
+                events.c.family_member_id,
+                events.c.event_type,
+                month,
+                func.count(),
+                func.max(events.c.date_time),
+            )
+            .where(
+                events.c.family_member_id.in_(
+                    select(FamilyMember.id).where(
+                        FamilyMember.manager_id == manager_id
+                    )
+                ),
+                events.c.series_id.is_not(None),
+                events.c.id != events.c.series_id,
+                events.c.date_time <= now,
+            )
+            .group_by(events.c.family_member_id, events.c.event_type, month)
+        ).all()
+        return [
+            OccurrenceCount(member_id, event_type, month.date(), count, last_at)
+            for member_id, event_type, month, count, last_at in rows
+        ]
+
+
+recurrence_service = RecurrenceService()
@@ -0,0 +1,231 @@
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, UTC
+from typing import (
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.family_member import FamilyMember
+from app.models.reminder import MedicationReminder
+
+logger = logging.getLogger(__name__)
+
+
+class DueReminder(NamedTuple):
+    id: UUID
+    family_member_id: UUID
+    manager_id: UUID
+    title: str
+    due_at: datetime
+
+
+class Notifier(Protocol):
+    def send(self, reminders: Sequence[DueReminder]) -> None:
+        """Deliver a batch of reminders; raise to have them retried."""
+
+
+class LogNotifier:
+    """Notifier that only logs, until push or email delivery exists."""
+
+    def send(self, reminders: Sequence[DueReminder]) -> None:
+        for reminder in reminders:
+            logger.info(
+                "Medication reminder for user %s: %s at %s",
+                reminder.manager_id,
+                reminder.title,
+                reminder.due_at.isoformat(),
+            )
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class ReminderScheduler:
+    """Fires medication reminders when they are due.
+
+    Only a sliding window of pending reminders, those due within ``window``,
+    is held in memory, in a heap ordered by due time. The window is loaded
+    with one range query on the pending index every ``refresh_interval``,
+    so the table can hold any number of future reminders without them
+    being polled, and a restart simply loads the window again, overdue
+    reminders included. Reminders added or moved less than
+    ``refresh_interval`` before they are due can fire that much late.
+
+    Due reminders are claimed in batches with one UPDATE ... SKIP LOCKED,
+    which also skips reminders cancelled or moved since the window was
+    loaded and lets several schedulers run side by side. The claim only
+    commits once the notifier returned, so delivery is at least once; a
+    failed batch is retried after ``retry_delay``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        notifier: Notifier,
+        window: timedelta,
+        refresh_interval: timedelta,
+        batch_size: int,
+        retry_delay: timedelta,
+    ):
+        self.session_factory = session_factory
+        self.notifier = notifier
+        self.window = window
+        self.refresh_interval = refresh_interval
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+        self._heap: List[Tuple[datetime, UUID]] = []
+        self._retry_at: Dict[UUID, datetime] = {}
+        self._next_refresh: Optional[datetime] = None
+        self._stopped = threading.Event()
+
+    @property
+    def pending(self) -> int:
+        """Reminders held in memory."""
+        return len(self._heap)
+
+    def refresh(self, now: datetime) -> None:
+        """Reload the pending reminders due before ``now + window``."""
+        db = self.session_factory()
+        try:
+            rows = db.execute(
+                select(MedicationReminder.due_at, MedicationReminder.id)
+                .where(
+                    MedicationReminder.sent_at.is_(None),
+                    MedicationReminder.due_at < now + self.window,
+                )
+                .order_by(MedicationReminder.due_at)
+            ).all()
+        finally:
+            db.close()
+        # Rows sorted by due time already form a heap
+        self._heap = [tuple(row) for row in rows]
+        retry_at, self._retry_at = self._retry_at, {}
+        for i, (due_at, reminder_id) in enumerate(self._heap):
+            if reminder_id in retry_at:
+                self._heap[i] = (max(due_at, retry_at[reminder_id]), reminder_id)
+                self._retry_at[reminder_id] = retry_at[reminder_id]
+        if self._retry_at:
+            heapq.heapify(self._heap)
+        self._next_refresh = now + self.refresh_interval
+
+    def tick(self, now: datetime) -> int:
+        """Fire every reminder due at ``now``; return how many were sent."""
+        if self._next_refresh is None or now >= self._next_refresh:
+            self.refresh(now)
+        sent = 0
+        while self._heap and self._heap[0][0] <= now:
+            batch = []
+            while (
+                self._heap
+                and self._heap[0][0] <= now
+                and len(batch) < self.batch_size
+            ):
+                batch.append(heapq.heappop(self._heap)[1])
+            sent += self._fire(batch, now)
+        return sent
+
+    def next_wakeup(self) -> Optional[datetime]:
+        """When ``tick`` has something to do next."""
+        if self._heap:
+            return min(self._heap[0][0], self._next_refresh)
+        return self._next_refresh
+
+    def run(self) -> None:
+        """Tick until ``stop`` is called, sleeping until the next wakeup."""
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            try:
+                self.tick(_utcnow())
+            except Exception:
+                # Reload the window once the database is back; reminders
+                # popped from the heap are still pending there
+                logger.exception("Sending reminders failed")
+                self._next_refresh = None
+                self._stopped.wait(self.retry_delay.total_seconds())
+                continue
+            delay = (self.next_wakeup() - _utcnow()).total_seconds()
+            self._stopped.wait(max(delay, 0))
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _fire(self, reminder_ids: List[UUID], now: datetime) -> int:
+        db = self.session_factory()
+        try:
+            claimable = (
+                select(MedicationReminder.id)
+                .where(
+                    MedicationReminder.id.in_(reminder_ids),
+                    MedicationReminder.sent_at.is_(None),
+                    MedicationReminder.due_at <= now,
+                )
+                .with_for_update(skip_locked=True)
+            )
+            claimed = (
+                update(MedicationReminder)
+                .where(MedicationReminder.id.in_(claimable.scalar_subquery()))
+                .values(sent_at=now)
+                .returning(
+                    MedicationReminder.id,
+                    MedicationReminder.family_member_id,
+                    MedicationReminder.title,
+                    MedicationReminder.due_at,
+                )
+                .cte("claimed")
+            )
+            # RETURNING has no order, so read the claimed rows back in due order
+            rows = db.execute(
+                select(
+                    claimed.c.id,
+                    claimed.c.family_member_id,
+                    FamilyMember.manager_id,
+                    claimed.c.title,
+                    claimed.c.due_at,
+                )
+                .join(FamilyMember, FamilyMember.id == claimed.c.family_member_id)
+                .order_by(claimed.c.due_at, claimed.c.id)
+            ).all()
+            reminders = [DueReminder(*row) for row in rows]
+            if reminders:
+                self.notifier.send(reminders)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception(
+                "Sending %d medication reminders failed", len(reminder_ids)
+            )
+            retry_at = now + self.retry_delay
+            for reminder_id in reminder_ids:
+                self._retry_at[reminder_id] = retry_at
+                heapq.heappush(self._heap, (retry_at, reminder_id))
+            return 0
+        finally:
+            db.close()
+        for reminder_id in reminder_ids:
+            self._retry_at.pop(reminder_id, None)
+        return len(reminders)
+
+
+reminder_scheduler = ReminderScheduler(
+    SessionLocal,
+    LogNotifier(),
+    window=timedelta(seconds=settings.REMINDER_WINDOW_SECONDS),
+    refresh_interval=timedelta(seconds=settings.REMINDER_REFRESH_SECONDS),
+    batch_size=settings.REMINDER_BATCH_SIZE,
+    retry_delay=timedelta(seconds=settings.REMINDER_RETRY_SECONDS),
+)
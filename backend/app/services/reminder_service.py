@@ -0,0 +1,65 @@
+from datetime import datetime, UTC
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import case, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.health_event import EventType, HealthEvent
+from app.models.reminder import MedicationReminder
+from app.utils.datetimes import naive_utc
+
+
+class ReminderService:
+    """Keeps medication reminders in step with MEDICATION events.
+
+    Call in the transaction of every event write; the scheduler picks the
+    reminders up from the table on its next window refresh.
+    """
+
+    def sync_event(
+        self, db: Session, event: HealthEvent, now: Optional[datetime] = None
+    ) -> None:
+        """Schedule the reminder of a future medication event, or cancel it."""
+        if now is None:
+            now = datetime.now(UTC).replace(tzinfo=None)
+        due_at = naive_utc(event.date_time)
+        if event.event_type != EventType.MEDICATION or due_at <= now:
+            self.cancel_event(db, event.id)
+            return
+
+        stmt = insert(MedicationReminder).values(
+            health_event_id=event.id,
+            family_member_id=event.family_member_id,
+            title=event.title,
+            due_at=due_at,
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[MedicationReminder.health_event_id],
+                set_={
+                    "family_member_id": stmt.excluded.family_member_id,
+                    "title": stmt.excluded.title,
+                    "due_at": stmt.excluded.due_at,
+                    # A moved reminder fires again, at its new time
+                    "sent_at": case(
+                        (
+                            MedicationReminder.due_at != stmt.excluded.due_at,
+                            None,
+                        ),
+                        else_=MedicationReminder.sent_at,
+                    ),
+                },
+            )
+        )
+
+    def cancel_event(self, db: Session, health_event_id: UUID) -> None:
+        db.execute(
+            delete(MedicationReminder).where(
+                MedicationReminder.health_event_id == health_event_id
+            )
+        )
+
+
+reminder_service = ReminderService()
@@ -0,0 +1,261 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+
+
+class CacheBackend:
+    """Storage interface used by :class:`ResponseCache`."""
+
+    name = "base"
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        raise NotImplementedError
+
+    def get_counter(self, key: str) -> int:
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    def entry_count(self) -> int:
+        raise NotImplementedError
+
+    def memory_usage(self) -> int:
+        raise NotImplementedError
+
+
+def _counter_seed() -> int:
+    # Counters start from the current time rather than zero, so a counter that
+    # is lost (eviction, restart) can never fall back to a previously used value
+    # and resurrect stale entries.
+    return time.time_ns() // 1000
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process LRU cache bounded by entry count and total payload bytes.
+
+    The version counters live in the process too, so a write only
+    invalidates the cache of the worker that handled it: use this backend
+    with a single API worker only, and ``redis`` with several.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        # Counters live outside the LRU so they are never evicted
+        self._counters: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.setdefault(key, _counter_seed())
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key, _counter_seed()) + 1
+            self._counters[key] = value
+            return value
+
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    def memory_usage(self) -> int:
+        return self._bytes
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(value)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache stored in any server speaking the Redis protocol.
+
+    ``client`` may be any object exposing the redis-py ``get``/``set``/``incr``
+    /``scan_iter``/``info`` methods; when omitted a client is created from
+    ``url``, which requires the optional ``redis`` package.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self, url: Optional[str] = None, client: Any = None, prefix: str = "sesame:"
+    ):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError(
+                    "CACHE_BACKEND=redis requires the 'redis' package"
+                ) from e
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(self.prefix + key, value, ex=ttl)
+
+    def get_counter(self, key: str) -> int:
+        key = self.prefix + key
+        value = self.client.get(key)
+        if value is None:
+            self.client.set(key, _counter_seed(), nx=True)
+            value = self.client.get(key)
+        return int(value)
+
+    def incr(self, key: str) -> int:
+        key = self.prefix + key
+        if self.client.get(key) is None:
+            self.client.set(key, _counter_seed(), nx=True)
+        return int(self.client.incr(key))
+
+    def entry_count(self) -> int:
+        # Only our keys, version counters included: the database may be shared
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + "*"))
+
+    def memory_usage(self) -> int:
+        return int(self.client.info("memory").get("used_memory", 0))
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+
+
+class ResponseCache:
+    """Per-user cache of serialized API responses.
+
+    Keys embed a per-user version counter; write endpoints bump the counter,
+    which makes every previously cached response of that user unreachable.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def key(
+        self, user_id: UUID, namespace: str, params: Mapping[str, Any]
+    ) -> Optional[str]:
+        """Build the cache key for a request, or None when caching is disabled.
+
+        The key captures the user's current version, so it must be computed
+        before the database is read: a concurrent write then bumps the version
+        and the (possibly stale) entry stored under the old key is never read.
+        """
+        if not self.enabled:
+            return None
+        normalized = "&".join(
+            f"{name}={_normalize(value)}"
+            for name, value in sorted(params.items())
+            if value is not None
+        )
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        version = self.backend.get_counter(f"version:{user_id}")
+        return f"resp:{user_id}:{version}:{namespace}:{digest}"
+
+    def get(self, key: Optional[str]) -> Optional[CachedResponse]:
+        if key is None:
+            return None
+        value = self.backend.get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is None:
+            return None
+        headers, _, body = value.partition(b"\n")
+        return CachedResponse(body, json.loads(headers))
+
+    def set(
+        self,
+        key: Optional[str],
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if key is not None:
+            value = json.dumps(headers or {}).encode() + b"\n" + body
+            self.backend.set(key, value, self.ttl)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Drop every cached response of a user. Call after the write commits."""
+        if self.enabled:
+            self.backend.incr(f"version:{user_id}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "backend": self.backend.name if self.enabled else "none",
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "entries": self.backend.entry_count() if self.enabled else 0,
+            "memory_bytes": self.backend.memory_usage() if self.enabled else 0,
+        }
+
+
+def _normalize(value: Any) -> str:
+    return str(getattr(value, "value", value))
+
+
+def create_backend() -> Optional[CacheBackend]:
+    if settings.CACHE_BACKEND == "memory":
+        if settings.WEB_CONCURRENCY > 1:
+            raise RuntimeError(
+                "CACHE_BACKEND=memory can't be shared by several workers; "
+                "use CACHE_BACKEND=redis or none"
+            )
+        return LRUCacheBackend(settings.CACHE_MAX_ENTRIES, settings.CACHE_MAX_BYTES)
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.CACHE_REDIS_URL)
+    return None
+
+
+response_cache = ResponseCache(create_backend(), settings.CACHE_TTL_SECONDS)
@@ -0,0 +1,263 @@
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional
+from uuid import UUID
+from sqlalchemy import and_, delete, func, or_, select, text, true, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import Query, Session, with_expression
+
+from app.models.event_stats import MemberEventTypeStats, MemberMonthlyEventStats
+from app.models.family_member import FamilyMember
+from app.models.health_event import HealthEvent
+
+
+class EventKey(NamedTuple):
+    """The attributes of a health event that the rollups depend on."""
+
+    family_member_id: UUID
+    event_type: str
+    date_time: datetime
+
+
+def _month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+class StatsService:
+    """Incremental maintenance of the health event rollup tables.
+
+    Every method only issues statements on the given session, so the rollups
+    are committed (or rolled back) together with the event write itself.
+    """
+
+    def event_key(self, event: HealthEvent) -> EventKey:
+        """Snapshot the rollup-relevant attributes of an event."""
+        event_type = getattr(event.event_type, "value", event.event_type)
+        return EventKey(event.family_member_id, event_type, event.date_time)
+
+    def event_added(self, db: Session, key: EventKey) -> None:
+        """Account for a newly created event."""
+        type_stmt = insert(MemberEventTypeStats).values(
+            family_member_id=key.family_member_id,
+            event_type=key.event_type,
+            event_count=1,
+            first_event_at=key.date_time,
+            last_event_at=key.date_time,
+        )
+        type_stmt = type_stmt.on_conflict_do_update(
+            index_elements=[
+                MemberEventTypeStats.family_member_id,
+                MemberEventTypeStats.event_type,
+            ],
+            set_={
+                "event_count": MemberEventTypeStats.event_count + 1,
+                "first_event_at": func.least(
+                    MemberEventTypeStats.first_event_at,
+                    type_stmt.excluded.first_event_at,
+                ),
+                "last_event_at": func.greatest(
+                    MemberEventTypeStats.last_event_at,
+                    type_stmt.excluded.last_event_at,
+                ),
+            },
+        )
+        db.execute(type_stmt)
+
+        month_stmt = insert(MemberMonthlyEventStats).values(
+            family_member_id=key.family_member_id,
+            month=_month_start(key.date_time),
+            event_count=1,
+        )
+        month_stmt = month_stmt.on_conflict_do_update(
+            index_elements=[
+                MemberMonthlyEventStats.family_member_id,
+                MemberMonthlyEventStats.month,
+            ],
+            set_={"event_count": MemberMonthlyEventStats.event_count + 1},
+        )
+        db.execute(month_stmt)
+
+    def event_removed(self, db: Session, key: EventKey) -> None:
+        """Account for a deleted event.
+
+        Must be called after the event row itself has been flushed away, since
+        the first/last bounds are recomputed from ``health_events`` when the
+        removed event was one of them.
+        """
+        type_filter = and_(
+            MemberEventTypeStats.family_member_id == key.family_member_id,
+            MemberEventTypeStats.event_type == key.event_type,
+        )
+        db.execute(
+            update(MemberEventTypeStats)
+            .where(type_filter)
+            .values(event_count=MemberEventTypeStats.event_count - 1)
+        )
+
+        # Only touch the bounds when the removed event defined one of them;
+        # the lookup is served by ix_health_events_member_type_date.
+        remaining = (
+            HealthEvent.family_member_id == key.family_member_id,
+            HealthEvent.event_type == key.event_type,
+        )
+        db.execute(
+            update(MemberEventTypeStats)
+            .where(
+                type_filter,
+                or_(
+                    MemberEventTypeStats.first_event_at == key.date_time,
+                    MemberEventTypeStats.last_event_at == key.date_time,
+                ),
+            )
+            .values(
+                first_event_at=select(func.min(HealthEvent.date_time))
+                .where(*remaining)
+                .scalar_subquery(),
+                last_event_at=select(func.max(HealthEvent.date_time))
+                .where(*remaining)
+                .scalar_subquery(),
+            )
+        )
+        db.execute(
+            delete(MemberEventTypeStats).where(
+                type_filter, MemberEventTypeStats.event_count <= 0
+            )
+        )
+
+        month_filter = and_(
+            MemberMonthlyEventStats.family_member_id == key.family_member_id,
+            MemberMonthlyEventStats.month == _month_start(key.date_time),
+        )
+        db.execute(
+            update(MemberMonthlyEventStats)
+            .where(month_filter)
+            .values(event_count=MemberMonthlyEventStats.event_count - 1)
+        )
+        db.execute(
+            delete(MemberMonthlyEventStats).where(
+                month_filter, MemberMonthlyEventStats.event_count <= 0
+            )
+        )
+
+    def event_changed(self, db: Session, before: EventKey, after: EventKey) -> None:
+        """Move an updated event between rollup buckets if needed."""
+        if before == after:
+            return
+        db.flush()
+        self.event_removed(db, before)
+        self.event_added(db, after)
+
+    def rebuild(self, db: Session) -> None:
+        """Recompute every rollup from scratch.
+
+        Writers are blocked for the duration of the rebuild so no increment
+        can slip in between the truncate and the re-aggregation.
+        """
+        db.execute(text("LOCK TABLE health_events IN SHARE MODE"))
+        db.execute(delete(MemberEventTypeStats))
+        db.execute(delete(MemberMonthlyEventStats))
+
+        db.execute(
+            insert(MemberEventTypeStats).from_select(
+                [
+                    "family_member_id",
+                    "event_type",
+                    "event_count",
+                    "first_event_at",
+                    "last_event_at",
+                ],
+                select(
+                    HealthEvent.family_member_id,
+                    HealthEvent.event_type,
+                    func.count(),
+                    func.min(HealthEvent.date_time),
+                    func.max(HealthEvent.date_time),
+                ).group_by(HealthEvent.family_member_id, HealthEvent.event_type),
+            )
+        )
+
+        month = func.date_trunc("month", HealthEvent.date_time).cast(
+            MemberMonthlyEventStats.month.type
+        )
+        db.execute(
+            insert(MemberMonthlyEventStats).from_select(
+                ["family_member_id", "month", "event_count"],
+                select(HealthEvent.family_member_id, month, func.count()).group_by(
+                    HealthEvent.family_member_id, month
+                ),
+            )
+        )
+
+    def with_member_summary(self, query: Query) -> Query:
+        """Load the event summary attributes of the members of ``query``.
+
+        The summary is aggregated from the per-type rollup in a LATERAL
+        subquery, a primary key range scan per member, so no event row is
+        read whatever the size of a member's history.
+        """
+        summary = (
+            select(
+                func.coalesce(func.sum(MemberEventTypeStats.event_count), 0).label(
+                    "event_count"
+                ),
+                func.max(MemberEventTypeStats.last_event_at).label("last_event_at"),
+                func.coalesce(
+                    func.jsonb_object_agg(
+                        MemberEventTypeStats.event_type,
+                        MemberEventTypeStats.event_count,
+                    ),
+                    text("'{}'::jsonb"),
+                ).label("counts_by_type"),
+            )
+            .where(MemberEventTypeStats.family_member_id == FamilyMember.id)
+            .lateral("summary")
+        )
+        # Members may already be in the session from an earlier query, and
+        # expressions are only applied when a row is loaded
+        query = query.execution_options(populate_existing=True)
+        return query.join(summary, true()).options(
+            with_expression(FamilyMember.event_count, summary.c.event_count),
+            with_expression(FamilyMember.last_event_at, summary.c.last_event_at),
+            with_expression(
+                FamilyMember.counts_by_type, summary.c.counts_by_type.cast(JSONB)
+            ),
+        )
+
+    def get_type_stats(
+        self, db: Session, manager_id: UUID
+    ) -> Dict[UUID, List[MemberEventTypeStats]]:
+        """Return the per-type rollup rows of every member of a manager."""
+        rows = db.scalars(
+            select(MemberEventTypeStats)
+            .join(
+                FamilyMember,
+                FamilyMember.id == MemberEventTypeStats.family_member_id,
+            )
+            .where(FamilyMember.manager_id == manager_id)
+        )
+        stats: Dict[UUID, List[MemberEventTypeStats]] = {}
+        for row in rows:
+            stats.setdefault(row.family_member_id, []).append(row)
+        return stats
+
+    def get_monthly_stats(
+        self, db: Session, manager_id: UUID, since: Optional[date] = None
+    ) -> Dict[UUID, List[MemberMonthlyEventStats]]:
+        """Return the monthly rollup rows of every member of a manager."""
+        query = (
+            select(MemberMonthlyEventStats)
+            .join(
+                FamilyMember,
+                FamilyMember.id == MemberMonthlyEventStats.family_member_id,
+            )
+            .where(FamilyMember.manager_id == manager_id)
+            .order_by(MemberMonthlyEventStats.month)
+        )
+        if since:
+            query = query.where(MemberMonthlyEventStats.month >= since)
+        stats: Dict[UUID, List[MemberMonthlyEventStats]] = {}
+        for row in db.scalars(query):
+            stats.setdefault(row.family_member_id, []).append(row)
+        return stats
+
+
+stats_service = StatsService()
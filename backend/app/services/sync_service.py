@@ -0,0 +1,206 @@
+from datetime import datetime, timedelta, UTC
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import delete, func, or_, select, tuple_, Text, BigInteger
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.models.family_member import FamilyMember
+from app.models.health_event import HealthEvent
+from app.models.sync import Tombstone
+from app.models.watermark import Watermark
+
+FAMILY_MEMBER = "family_member"
+HEALTH_EVENT = "health_event"
+
+TOMBSTONE_WATERMARK = "sync.tombstones_purged_through"
+
+
+class ChangeCursor(NamedTuple):
+    """Position in the change stream: ``(transaction id, change sequence)``.
+
+    Changes are ordered by the writing transaction first, so a transaction
+    that commits after a later-numbered one can never slip in behind a cursor
+    that was already handed out.
+    """
+
+    xid: int
+    seq: int
+
+    def encode(self) -> str:
+        return f"{self.xid}.{self.seq}"
+
+    @classmethod
+    def decode(cls, value: Optional[str]) -> "ChangeCursor":
+        if not value:
+            return INITIAL_CURSOR
+        xid, _, seq = value.partition(".")
+        return cls(int(xid), int(seq))
+
+
+INITIAL_CURSOR = ChangeCursor(0, 0)
+
+
+class CursorExpiredError(Exception):
+    """The cursor predates purged tombstones; the client must resync fully."""
+
+
+class ChangeSet(NamedTuple):
+    family_members: Dict[str, List[Any]]
+    health_events: Dict[str, List[Any]]
+    cursor: ChangeCursor
+    has_more: bool
+
+
+class SyncService:
+    """Delta sync over the change-tracking columns of synced tables."""
+
+    def record_deletion(
+        self, db: Session, entity_type: str, entity_id: UUID, user_id: UUID
+    ) -> None:
+        """Leave a tombstone for a deleted row in the current transaction."""
+        db.add(Tombstone(entity_type=entity_type, entity_id=entity_id, user_id=user_id))
+
+    def get_changes(
+        self, db: Session, user_id: UUID, cursor: ChangeCursor, limit: int
+    ) -> ChangeSet:
+        """Return up to ``limit`` changes of a user made after ``cursor``.
+
+        Only changes of finished transactions are returned: rows written by a
+        transaction that is still running stay invisible until a later call,
+        when they are still ahead of the returned cursor.
+        """
+        if cursor != INITIAL_CURSOR and cursor < self._purged_through(db):
+            raise CursorExpiredError()
+
+        horizon, own_xid = visibility_horizon(db)
+
+        def changed(model):
+            # Our own uncommitted writes are visible to us, so include them
+            return (
+                tuple_(model.change_xid, model.change_seq) > tuple_(*cursor),
+                or_(model.change_xid < horizon, model.change_xid == own_xid),
+            )
+
+        def fetch(query, model):
+            return db.scalars(
+                query.where(*changed(model))
+                .order_by(model.change_xid, model.change_seq)
+                .limit(limit + 1)
+            ).all()
+
+        members = fetch(
+            select(FamilyMember).where(FamilyMember.manager_id == user_id),
+            FamilyMember,
+        )
+        events = fetch(
+            select(HealthEvent)
+            .options(selectinload(HealthEvent.attachments))
+            .join(FamilyMember, FamilyMember.id == HealthEvent.family_member_id)
+            .where(FamilyMember.manager_id == user_id),
+            HealthEvent,
+        )
+        tombstones = fetch(
+            select(Tombstone).where(Tombstone.user_id == user_id), Tombstone
+        )
+
+        # Merge the three streams and cut the page at ``limit`` changes
+        changes: List[Tuple[ChangeCursor, str, Any]] = sorted(
+            [
+                (ChangeCursor(m.change_xid, m.change_seq), FAMILY_MEMBER, m)
+                for m in members
+            ]
+            + [
+                (ChangeCursor(e.change_xid, e.change_seq), HEALTH_EVENT, e)
+                for e in events
+            ]
+            + [
+                (ChangeCursor(t.change_xid, t.change_seq), t.entity_type, t)
+                for t in tombstones
+            ],
+            key=lambda change: change[0],
+        )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        result = {
+            FAMILY_MEMBER: {"created": [], "updated": [], "deleted": []},
+            HEALTH_EVENT: {"created": [], "updated": [], "deleted": []},
+        }
+        for _, entity_type, item in changes:
+            bucket = result[entity_type]
+            if isinstance(item, Tombstone):
+                bucket["deleted"].append(item.entity_id)
+            elif ChangeCursor(item.created_xid, item.created_seq) > cursor:
+                bucket["created"].append(item)
+            else:
+                bucket["updated"].append(item)
+
+        next_cursor = changes[-1][0] if changes else cursor
+        return ChangeSet(
+            result[FAMILY_MEMBER], result[HEALTH_EVENT], next_cursor, has_more
+        )
+
+    def purge_tombstones(
+        self, db: Session, retention_days: Optional[int] = None
+    ) -> int:
+        """Delete tombstones older than the retention period.
+
+        The position of the newest purged tombstone is recorded so that
+        clients holding an older cursor are told to resync instead of
+        silently missing deletions.
+        """
+        if retention_days is None:
+            retention_days = settings.SYNC_TOMBSTONE_RETENTION_DAYS
+        cutoff = datetime.now(UTC) - timedelta(days=retention_days)
+        purged = db.execute(
+            delete(Tombstone)
+            .where(Tombstone.deleted_at < cutoff)
+            .returning(Tombstone.change_xid, Tombstone.change_seq)
+        ).all()
+        if not purged:
+            return 0
+
+        through = max(
+            [ChangeCursor(*row) for row in purged] + [self._purged_through(db)]
+        )
+        stmt = insert(Watermark).values(
+            name=TOMBSTONE_WATERMARK, value=through.encode()
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Watermark.name],
+                set_={"value": stmt.excluded.value, "updated_at": func.now()},
+            )
+        )
+        return len(purged)
+
+    def _purged_through(self, db: Session) -> ChangeCursor:
+        value = db.scalar(
+            select(Watermark.value).where(Watermark.name == TOMBSTONE_WATERMARK)
+        )
+        return ChangeCursor.decode(value)
+
+
+def visibility_horizon(db: Session) -> Tuple[int, Optional[int]]:
+    """Return the oldest running transaction id and our own, if assigned.
+
+    Every change written by a transaction below the horizon has committed
+    or rolled back, so reading up to it never skips a late commit.
+    """
+    return tuple(
+        db.execute(
+            select(
+                _as_bigint(func.pg_snapshot_xmin(func.pg_current_snapshot())),
+                _as_bigint(func.pg_current_xact_id_if_assigned()),
+            )
+        ).one()
+    )
+
+
+def _as_bigint(expression):
+    return expression.cast(Text).cast(BigInteger)
+
+
+sync_service = SyncService()
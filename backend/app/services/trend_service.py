@@ -0,0 +1,288 @@
+import time
+from datetime import date, datetime, timedelta, UTC
+from typing import List, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import Date, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.event_trends import MemberEventTrend
+from app.models.family_member import FamilyMember
+from app.models.health_event import EventType, HealthEvent
+from app.models.watermark import Watermark
+
+# Completed weeks in a series; the latest one is last week
+SERIES_WEEKS = 26
+ROLLING_WEEKS = 4
+# The latest week is an anomaly when it is ANOMALY_ZSCORE standard
+# deviations above the BASELINE_WEEKS before it, and not a mere blip
+BASELINE_WEEKS = 12
+ANOMALY_ZSCORE = 3.0
+ANOMALY_MIN_COUNT = 3
+MIN_STD = 0.5
+# A change point splits the series into two segments of at least
+# CHANGE_MIN_WEEKS whose means differ by CHANGE_SCORE pooled standard errors
+CHANGE_MIN_WEEKS = 4
+CHANGE_SCORE = 4.0
+MIN_VARIANCE = 0.25
+
+EVENT_TYPES = np.array(sorted(event_type.value for event_type in EventType))
+# Member id after which an interrupted run resumes, empty once a run completes
+TRENDS_WATERMARK = "event_trends"
+
+
+class TrendArrays(NamedTuple):
+    """Analysis of weekly series, with the series axis removed."""
+
+    rolling_mean: np.ndarray  # same shape as the series
+    baseline_mean: np.ndarray
+    baseline_std: np.ndarray
+    zscore: np.ndarray
+    is_anomaly: np.ndarray
+    slope: np.ndarray
+    change_index: np.ndarray  # first week after the change
+    change_score: np.ndarray
+    is_change_point: np.ndarray
+
+
+def analyze(counts: np.ndarray) -> TrendArrays:
+    """Analyze many weekly series at once, along the last axis of ``counts``."""
+    counts = counts.astype(float)
+    weeks = counts.shape[-1]
+    totals = np.cumsum(counts, axis=-1)
+    squares = np.cumsum(counts**2, axis=-1)
+
+    padding = np.zeros(counts.shape[:-1] + (ROLLING_WEEKS,))
+    lagged = np.concatenate([padding, totals], axis=-1)[..., :weeks]
+    window = np.minimum(np.arange(1, weeks + 1), ROLLING_WEEKS)
+    rolling_mean = (totals - lagged) / window
+
+    latest = counts[..., -1]
+    baseline = counts[..., -1 - BASELINE_WEEKS : -1]
+    baseline_mean = baseline.mean(axis=-1)
+    baseline_std = baseline.std(axis=-1)
+    zscore = (latest - baseline_mean) / np.maximum(baseline_std, MIN_STD)
+    is_anomaly = (zscore >= ANOMALY_ZSCORE) & (latest >= ANOMALY_MIN_COUNT)
+
+    x = np.arange(weeks) - (weeks - 1) / 2
+    slope = counts @ x / (x @ x)
+
+    # Mean shift test at every split of the series, from prefix sums
+    splits = np.arange(CHANGE_MIN_WEEKS, weeks - CHANGE_MIN_WEEKS + 1)
+    left_n, right_n = splits, weeks - splits
+    left_sum = totals[..., splits - 1]
+    right_sum = totals[..., -1:] - left_sum
+    left_squares = squares[..., splits - 1]
+    right_squares = squares[..., -1:] - left_squares
+    within = (left_squares - left_sum**2 / left_n) + (
+        right_squares - right_sum**2 / right_n
+    )
+    variance = np.maximum(within / (weeks - 2), MIN_VARIANCE)
+    scores = np.abs(right_sum / right_n - left_sum / left_n) / np.sqrt(
+        variance * (1 / left_n + 1 / right_n)
+    )
+    best = np.argmax(scores, axis=-1)
+    change_score = np.take_along_axis(scores, best[..., None], axis=-1)[..., 0]
+
+    return TrendArrays(
+        rolling_mean=rolling_mean,
+        baseline_mean=baseline_mean,
+        baseline_std=baseline_std,
+        zscore=zscore,
+        is_anomaly=is_anomaly,
+        slope=slope,
+        change_index=splits[best],
+        change_score=change_score,
+        is_change_point=change_score >= CHANGE_SCORE,
+    )
+
+
+class TrendRun(NamedTuple):
+    analyzed: int
+    complete: bool
+
+
+class TrendService:
+    """Nightly trend and anomaly analysis of per-member event series.
+
+    Members are processed in batches: one grouped query returns the weekly
+    event counts of the batch, which are analyzed as a single array and
+    upserted into ``member_event_trends``. Reads then cost one primary key
+    lookup per series.
+    """
+
+    def weekly_counts(
+        self, db: Session, member_ids: Sequence[UUID], first_week: date
+    ) -> np.ndarray:
+        """Count events per member, event type and week since ``first_week``.
+
+        Returns an array of shape (members, event types, SERIES_WEEKS), in the
+        order of ``member_ids`` and ``EVENT_TYPES``.
+        """
+        index = {member_id: i for i, member_id in enumerate(member_ids)}
+        first_day = datetime.combine(first_week, datetime.min.time())
+        week = func.date_trunc("week", HealthEvent.date_time).cast(Date)
+        rows = db.execute(
+            select(
+                HealthEvent.family_member_id, HealthEvent.event_type, week, func.count()
+            )
+            .where(
+                HealthEvent.family_member_id.in_(list(index)),
+                HealthEvent.date_time >= first_day,
+                HealthEvent.date_time < first_day + timedelta(weeks=SERIES_WEEKS),
+            )
+            .group_by(HealthEvent.family_member_id, HealthEvent.event_type, week)
+        ).all()
+
+        counts = np.zeros(
+            (len(member_ids), len(EVENT_TYPES), SERIES_WEEKS), dtype=np.int64
+        )
+        if not rows:
+            return counts
+        members, event_types, weeks, numbers = zip(*rows)
+        counts[
+            np.fromiter((index[member] for member in members), np.intp, len(rows)),
+            np.searchsorted(EVENT_TYPES, np.array(event_types, dtype=str)),
+            (np.array(weeks, dtype="datetime64[D]") - np.datetime64(first_week, "D"))
+            // np.timedelta64(7, "D"),
+        ] = numbers
+        return counts
+
+    def analyze_members(
+        self, db: Session, member_ids: Sequence[UUID], now: datetime
+    ) -> None:
+        """Recompute and store the trends of ``member_ids`` as of ``now``."""
+        current_week = now.date() - timedelta(days=now.weekday())
+        first_week = current_week - timedelta(weeks=SERIES_WEEKS)
+        counts = self.weekly_counts(db, member_ids, first_week)
+        trends = analyze(counts)
+
+        rows = []
+        for m, t in np.argwhere(counts.sum(axis=-1) > 0).tolist():
+            rows.append(
+                {
+                    "family_member_id": member_ids[m],
+                    "event_type": str(EVENT_TYPES[t]),
+                    "week_start": first_week,
+                    "weekly_counts": counts[m, t].tolist(),
+                    "rolling_mean": trends.rolling_mean[m, t].round(3).tolist(),
+                    "baseline_mean": float(trends.baseline_mean[m, t]),
+                    "baseline_std": float(trends.baseline_std[m, t]),
+                    "zscore": float(trends.zscore[m, t]),
+                    "is_anomaly": bool(trends.is_anomaly[m, t]),
+                    "slope": float(trends.slope[m, t]),
+                    "change_week": first_week
+                    + timedelta(weeks=int(trends.change_index[m, t])),
+                    "change_score": float(trends.change_score[m, t]),
+                    "is_change_point": bool(trends.is_change_point[m, t]),
+                    "computed_at": now,
+                }
+            )
+        if rows:
+            stmt = insert(MemberEventTrend)
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        MemberEventTrend.family_member_id,
+                        MemberEventTrend.event_type,
+                    ],
+                    set_={
+                        name: stmt.excluded[name]
+                        for name in rows[0]
+                        if name not in ("family_member_id", "event_type")
+                    },
+                ),
+                rows,
+            )
+        # Series whose events all fell out of the window
+        db.execute(
+            delete(MemberEventTrend).where(
+                MemberEventTrend.family_member_id.in_(member_ids),
+                MemberEventTrend.computed_at != now,
+            )
+        )
+
+    def run(
+        self,
+        db: Session,
+        now: Optional[datetime] = None,
+        max_seconds: Optional[float] = None,
+    ) -> TrendRun:
+        """Analyze every member in batches, committing after each one.
+
+        Stops once ``max_seconds`` (TRENDS_MAX_SECONDS by default) have
+        passed; the next run then resumes after the last analyzed member.
+        """
+        if now is None:
+            now = datetime.now(UTC).replace(tzinfo=None)
+        if max_seconds is None:
+            max_seconds = settings.TRENDS_MAX_SECONDS
+        started = time.monotonic()
+        last_id = self._resume_after(db)
+        analyzed = 0
+        while True:
+            query = (
+                select(FamilyMember.id)
+                .order_by(FamilyMember.id)
+                .limit(settings.TRENDS_BATCH_SIZE)
+            )
+            if last_id is not None:
+                query = query.where(FamilyMember.id > last_id)
+            member_ids = db.scalars(query).all()
+            if not member_ids:
+                self._save_progress(db, None)
+                db.commit()
+                return TrendRun(analyzed, complete=True)
+
+            self.analyze_members(db, member_ids, now)
+            last_id = member_ids[-1]
+            self._save_progress(db, last_id)
+            db.commit()
+            analyzed += len(member_ids)
+            if time.monotonic() - started >= max_seconds:
+                return TrendRun(analyzed, complete=False)
+
+    def get_trends(
+        self,
+        db: Session,
+        manager_id: UUID,
+        family_member_id: Optional[UUID] = None,
+        flagged_only: bool = False,
+    ) -> List[MemberEventTrend]:
+        """Return the stored trends of the members of a manager."""
+        query = (
+            select(MemberEventTrend)
+            .join(FamilyMember, FamilyMember.id == MemberEventTrend.family_member_id)
+            .where(FamilyMember.manager_id == manager_id)
+            .order_by(MemberEventTrend.family_member_id, MemberEventTrend.event_type)
+        )
+        if family_member_id:
+            query = query.where(MemberEventTrend.family_member_id == family_member_id)
+        if flagged_only:
+            query = query.where(
+                MemberEventTrend.is_anomaly | MemberEventTrend.is_change_point
+            )
+        return db.scalars(query).all()
+
+    def _resume_after(self, db: Session) -> Optional[UUID]:
+        value = db.scalar(
+            select(Watermark.value).where(Watermark.name == TRENDS_WATERMARK)
+        )
+        return UUID(value) if value else None
+
+    def _save_progress(self, db: Session, last_id: Optional[UUID]) -> None:
+        stmt = insert(Watermark).values(
+            name=TRENDS_WATERMARK, value=str(last_id) if last_id else ""
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Watermark.name],
+                set_={"value": stmt.excluded.value, "updated_at": func.now()},
+            )
+        )
+
+
+trend_service = TrendService()
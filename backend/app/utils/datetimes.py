@@ -0,0 +1,12 @@
+from datetime import datetime, UTC
+from typing import Optional
+
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware datetime to naive UTC, the way times are stored.
+
+    Naive values are taken to be UTC already and returned unchanged.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
@@ -0,0 +1,70 @@
+import io
+import zlib
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Brotli input is fed in small chunks, since a few bytes can inflate to
+# megabytes and the decompressor has no output limit of its own
+BROTLI_CHUNK_SIZE = 1024
+
+
+class UnsupportedEncodingError(ValueError):
+    pass
+
+
+def decompress(data: bytes, encoding: Optional[str], max_size: int) -> bytes:
+    """Decode a request body sent with ``Content-Encoding``.
+
+    Raises ``UnsupportedEncodingError`` for an unknown encoding and
+    ``ValueError`` for a corrupt body or one that inflates past
+    ``max_size`` bytes.
+    """
+    encoding = (encoding or "identity").strip().lower()
+    if encoding == "identity":
+        decoded = data
+    elif encoding in ("gzip", "deflate"):
+        # wbits 47 detects the gzip or zlib header
+        decompressor = zlib.decompressobj(47)
+        try:
+            decoded = decompressor.decompress(data, max_size + 1)
+        except zlib.error as e:
+            raise ValueError(f"Invalid {encoding} body: {e}")
+    elif encoding == "zstd" and zstandard is not None:
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data))
+        try:
+            decoded = reader.read(max_size + 1)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd body: {e}")
+    elif encoding == "br" and brotli is not None:
+        decoded = _decompress_brotli(data, max_size)
+    else:
+        raise UnsupportedEncodingError(f"Unsupported content encoding: {encoding}")
+
+    if len(decoded) > max_size:
+        raise ValueError(f"Body larger than {max_size} bytes once decoded")
+    return decoded
+
+
+def _decompress_brotli(data: bytes, max_size: int) -> bytes:
+    decompressor = brotli.Decompressor()
+    decoded = bytearray()
+    try:
+        for start in range(0, len(data), BROTLI_CHUNK_SIZE):
+            decoded += decompressor.process(data[start : start + BROTLI_CHUNK_SIZE])
+            if len(decoded) > max_size:
+                raise ValueError(f"Body larger than {max_size} bytes once decoded")
+        if not decompressor.is_finished():
+            raise ValueError("Invalid br body: truncated")
+    except brotli.error as e:
+        raise ValueError(f"Invalid br body: {e}")
+    return bytes(decoded)
@@ -0,0 +1,36 @@
+from functools import lru_cache
+from typing import AbstractSet, FrozenSet, Iterable, Type
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+
+def parse_fields(
+    value: str, allowed: AbstractSet[str], always: Iterable[str] = ("id",)
+) -> FrozenSet[str]:
+    """Parse a comma-separated ``fields=`` value against a whitelist.
+
+    Fields in ``always`` are included whether requested or not. Raises
+    ``ValueError`` naming the fields that are not in ``allowed``.
+    """
+    requested = {field.strip() for field in value.split(",") if field.strip()}
+    unknown = requested - allowed
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(sorted(allowed))}"
+        )
+    return frozenset(requested | set(always))
+
+
+@lru_cache(maxsize=256)
+def sparse_model(model: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    """Build (once per field set) a copy of ``model`` with only ``fields``."""
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (info.annotation, info)
+            for name, info in model.model_fields.items()
+            if name in fields
+        },
+    )
@@ -0,0 +1,73 @@
+import hashlib
+from datetime import datetime, UTC
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from fastapi import Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak entity tag from the values a representation depends on."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a (naive UTC or aware) datetime as an HTTP date."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return format_datetime(value.astimezone(UTC), usegmt=True)
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[datetime] = None
+) -> Dict[str, str]:
+    """Headers sent with every cacheable representation.
+
+    ``no-cache`` lets clients keep the representation but makes them
+    revalidate it with ``If-None-Match`` before every reuse.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(
+    headers: Mapping[str, str],
+    if_none_match: Optional[str] = None,
+    if_modified_since: Optional[str] = None,
+) -> bool:
+    """Evaluate conditional request headers against a representation.
+
+    ``If-None-Match`` uses weak comparison and takes precedence over
+    ``If-Modified-Since``, as required by RFC 9110.
+    """
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        etag = _opaque_tag(headers["ETag"])
+        return any(_opaque_tag(tag) == etag for tag in if_none_match.split(","))
+
+    if if_modified_since and "Last-Modified" in headers:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return parsedate_to_datetime(headers["Last-Modified"]) <= since
+
+    return False
+
+
+def not_modified(headers: Mapping[str, str]) -> Response:
+    return Response(status_code=304, headers=dict(headers))
+
+
+def json_response(body: bytes, headers: Mapping[str, str]) -> Response:
+    return Response(content=body, media_type="application/json", headers=dict(headers))
@@ -0,0 +1,28 @@
+from functools import lru_cache
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def render_json(schema: Any, data: Any) -> bytes:
+    """Build a response body for ``schema`` straight from ORM objects.
+
+    ``data`` is validated once with ``from_attributes`` and the result is
+    dumped to JSON bytes by the pydantic-core serializer, skipping the
+    intermediate dicts and the second validation pass of ``response_model``.
+    """
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
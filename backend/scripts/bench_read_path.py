@@ -0,0 +1,135 @@
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, selectinload
+from app.core.config import settings
+from app.models import Attachment, EventType, FamilyMember, HealthEvent, User
+from app.models.family_member import MemberType
+from app.schemas.health_event import PaginatedResponse
+from app.services.event_reader import EVENT_COLUMNS, event_reader
+from app.utils.serialization import render_json
+
+PAGE_SIZE = 100
+ROUNDS = 50
+
+
+def seed(db: Session) -> uuid.UUID:
+    """Create one member with a page of events, each with an attachment."""
+    user = User(
+        email=f"bench-{uuid.uuid4()}@example.com",
+        hashed_password="not-a-hash",
+        full_name="Bench User",
+    )
+    db.add(user)
+    db.flush()
+    member = FamilyMember(
+        name="Bench Member",
+        member_type=MemberType.HUMAN,
+        relation_type="self",
+        manager_id=user.id,
+    )
+    db.add(member)
+    db.flush()
+    now = datetime(2024, 1, 1, 12, 0)
+    for i in range(PAGE_SIZE):
+        event = HealthEvent(
+            title=f"Event {i}",
+            event_type=EventType.CHECKUP.value,
+            description="Routine examination with a moderately long note " * 3,
+            date_time=now - timedelta(days=i),
+            family_member_id=member.id,
+            created_by_id=user.id,
+        )
+        event.attachments = [
+            Attachment(
+                hash="0" * 64,
+                size=1024,
+                mime="image/jpeg",
+                filename=f"{i}.jpg",
+                storage_path=f"/storage/uploads/images/{i}.jpg",
+            )
+        ]
+        db.add(event)
+    db.flush()
+    return member.id
+
+
+def page(statement, member_id):
+    return (
+        statement.where(HealthEvent.family_member_id == member_id)
+        .order_by(HealthEvent.date_time.desc(), HealthEvent.id)
+        .limit(PAGE_SIZE)
+    )
+
+
+def orm_path(db: Session, member_id) -> bytes:
+    events = db.scalars(
+        page(
+            select(HealthEvent).options(selectinload(HealthEvent.attachments)),
+            member_id,
+        )
+    ).all()
+    return render(events)
+
+
+def row_path(db: Session, member_id) -> bytes:
+    return render(event_reader.fetch(db, page(select(*EVENT_COLUMNS), member_id)))
+
+
+def render(items) -> bytes:
+    return render_json(
+        PaginatedResponse,
+        {"items": items, "total": len(items), "page": 1, "size": PAGE_SIZE, "pages": 1},
+    )
+
+
+def measure(connection, func, member_id):
+    """Best CPU time and peak allocation of one page, each in a fresh session."""
+    best_cpu, peak = float("inf"), 0
+    for _ in range(ROUNDS):
+        with Session(bind=connection) as db:
+            start = time.process_time()
+            func(db, member_id)
+            best_cpu = min(best_cpu, time.process_time() - start)
+        with Session(bind=connection) as db:
+            tracemalloc.start()
+            func(db, member_id)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    return best_cpu, peak
+
+
+def main():
+    engine = create_engine(settings.get_database_url)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            with Session(bind=connection) as db:
+                member_id = seed(db)
+            with Session(bind=connection) as db:
+                assert orm_path(db, member_id) == row_path(db, member_id)
+
+            print(f"Reading {PAGE_SIZE}-event pages, best of {ROUNDS} rounds")
+            for name, func in (
+                ("ORM objects", orm_path),
+                ("Core rows", row_path),
+            ):
+                cpu, peak = measure(connection, func, member_id)
+                print(
+                    f"{name:12s} {cpu / PAGE_SIZE * 1e6:8.1f} us CPU/row "
+                    f"{peak / PAGE_SIZE / 1024:8.2f} KiB peak/row"
+                )
+        finally:
+            # The benchmark data is never committed
+            transaction.rollback()
+
+
+if __name__ == "__main__":
+    main()
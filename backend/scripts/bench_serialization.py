@@ -0,0 +1,83 @@
+import sys
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from app.models import Attachment, HealthEvent, EventType
+from app.schemas.health_event import PaginatedResponse
+from app.utils.serialization import render_json
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+
+def build_page():
+    """Build a page of transient ORM objects shaped like a real list call."""
+    now = datetime(2024, 1, 1, 12, 0)
+    member_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    events = [
+        HealthEvent(
+            id=uuid.uuid4(),
+            title=f"Event {i}",
+            event_type=EventType.CHECKUP.value,
+            description="Routine examination with a moderately long note " * 3,
+            date_time=now - timedelta(days=i),
+            family_member_id=member_id,
+            created_by_id=user_id,
+            created_at=now,
+            updated_at=now,
+            attachments=[
+                Attachment(
+                    id=uuid.uuid4(),
+                    event_id=uuid.uuid4(),
+                    hash="0" * 64,
+                    size=1024,
+                    mime="image/jpeg",
+                    filename=f"{i}.jpg",
+                    storage_path=f"/storage/uploads/images/{i}.jpg",
+                    created_at=now,
+                )
+            ],
+        )
+        for i in range(PAGE_SIZE)
+    ]
+    return {"items": events, "total": 1000, "page": 1, "size": PAGE_SIZE, "pages": 10}
+
+
+def response_model_path(page) -> bytes:
+    """What FastAPI did before: validate the model, re-validate it against
+    response_model, convert it to primitives and encode with stdlib json."""
+    model = PaginatedResponse(**page)
+    revalidated = PaginatedResponse.model_validate(model.model_dump())
+    return json.dumps(jsonable_encoder(revalidated)).encode()
+
+
+def fast_path(page) -> bytes:
+    return render_json(PaginatedResponse, page)
+
+
+def main():
+    page = build_page()
+    assert json.loads(response_model_path(page)) == json.loads(fast_path(page))
+
+    print(f"Serializing {PAGE_SIZE}-item pages, best of 5 x {ROUNDS} rounds")
+    for name, func in (
+        ("response_model + json", response_model_path),
+        ("pydantic-core render_json", fast_path),
+    ):
+        best = min(timeit.repeat(lambda: func(page), number=ROUNDS, repeat=5))
+        per_page = best / ROUNDS
+        print(
+            f"{name:28s} {per_page * 1e3:8.3f} ms/page "
+            f"{per_page / PAGE_SIZE * 1e6:8.2f} us/item"
+        )
+
+
+if __name__ == "__main__":
+    main()
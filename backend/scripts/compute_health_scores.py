@@ -0,0 +1,43 @@
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.services.health_score_service import health_score_service
+
+
+def compute_health_scores(full: bool = False):
+    """Score members whose events changed, or every member with ``full``.
+
+    Members whose events changed are normally scored by the background
+    workers; schedule the full run once a day so that scores follow the
+    aging of past events.
+    """
+    engine = create_engine(settings.get_database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    try:
+        if full:
+            print("Computing health scores of all family members...")
+            scored = health_score_service.recompute_all(db)
+        else:
+            print("Computing health scores of family members with new events...")
+            scored = 0
+            while batch := health_score_service.recompute_stale(db):
+                scored += batch
+        print(f"Scored {scored} family members.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--full", action="store_true", help="rescore every family member"
+    )
+    compute_health_scores(parser.parse_args().full)
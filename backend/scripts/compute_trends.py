@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.services.trend_service import trend_service
+
+
+def compute_trends():
+    """Nightly analysis of the weekly event series of every family member."""
+    engine = create_engine(settings.get_database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    try:
+        print("Analyzing weekly event trends...")
+        run = trend_service.run(db)
+        print(f"Analyzed {run.analyzed} family members.")
+        if not run.complete:
+            print(
+                f"Stopped after {settings.TRENDS_MAX_SECONDS} seconds; "
+                "the next run resumes where this one stopped."
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    compute_trends()
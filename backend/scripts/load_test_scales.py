@@ -0,0 +1,43 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.services.assessment_service import assessment_service
+
+SCALES_DIR = Path(__file__).parent / "test_scales"
+
+
+def load_test_scales(paths):
+    """Create or update test scales from JSON definition files.
+
+    Each file holds ``key``, ``name``, an optional ``description`` and the
+    ``definition``. Definitions are compiled before being stored, and a
+    changed definition bumps the version of its scale.
+    """
+    engine = create_engine(settings.get_database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    try:
+        for path in paths:
+            data = json.loads(Path(path).read_text())
+            scale = assessment_service.save_scale(
+                db,
+                key=data["key"],
+                name=data["name"],
+                definition=data["definition"],
+                description=data.get("description"),
+            )
+            print(f"Loaded {scale.key} version {scale.version}.")
+        db.commit()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    load_test_scales(sys.argv[1:] or sorted(SCALES_DIR.glob("*.json")))
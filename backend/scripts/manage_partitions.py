@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.services.partition_service import partition_service
+
+
+def manage_partitions():
+    engine = create_engine(settings.get_database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    try:
+        print("Creating missing health event partitions...")
+        created = partition_service.ensure_partitions(db)
+        db.commit()
+        if created:
+            print(f"Created partitions: {', '.join(created)}")
+        else:
+            print("All partitions already exist.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    manage_partitions()
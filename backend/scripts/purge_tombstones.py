@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.services.sync_service import sync_service
+
+
+def purge_tombstones():
+    engine = create_engine(settings.get_database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    try:
+        print(
+            "Purging sync tombstones older than "
+            f"{settings.SYNC_TOMBSTONE_RETENTION_DAYS} days..."
+        )
+        purged = sync_service.purge_tombstones(db)
+        db.commit()
+        print(f"Purged {purged} tombstones.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    purge_tombstones()
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.services.stats_service import stats_service
+
+
+def rebuild_stats():
+    engine = create_engine(settings.get_database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    try:
+        print("Rebuilding event statistics rollups...")
+        stats_service.rebuild(db)
+        db.commit()
+        print("Event statistics rebuilt successfully!")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rebuild_stats()
@@ -0,0 +1,28 @@
+import logging
+import signal
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.outbox import outbox
+
+
+def run_outbox_relay():
+    """Deliver outbox messages to their consumers until interrupted.
+
+    Webhooks are configured with ``OUTBOX_WEBHOOK_URLS``. A second relay
+    can run for availability; each consumer is served by one at a time.
+    """
+    logging.basicConfig(level=logging.INFO)
+    signal.signal(signal.SIGTERM, lambda *_: outbox.stop())
+    print("Relaying outbox messages...")
+    try:
+        outbox.run()
+    except KeyboardInterrupt:
+        pass
+    print("Stopped.")
+
+
+if __name__ == "__main__":
+    run_outbox_relay()
@@ -0,0 +1,29 @@
+import logging
+import signal
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.reminder_scheduler import reminder_scheduler
+
+
+def run_reminders():
+    """Fire medication reminders until interrupted.
+
+    Run one or more of these workers next to the API; they share the
+    reminders through the database. Delivery is at least once: a reminder
+    whose batch failed, or whose worker died mid-send, is sent again.
+    """
+    logging.basicConfig(level=logging.INFO)
+    signal.signal(signal.SIGTERM, lambda *_: reminder_scheduler.stop())
+    print("Sending medication reminders...")
+    try:
+        reminder_scheduler.run()
+    except KeyboardInterrupt:
+        pass
+    print("Stopped.")
+
+
+if __name__ == "__main__":
+    run_reminders()
@@ -0,0 +1,47 @@
+import argparse
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.job_queue import default_worker_id, job_queue
+
+# Modules that register job handlers
+import app.services.attachment_service  # noqa: F401
+import app.services.health_score_service  # noqa: F401
+
+
+def run_worker(threads: int = 1):
+    """Run background jobs until interrupted.
+
+    Run as many of these processes as the load needs, next to the API; they
+    share the queue through the database. ``threads`` runs several jobs at
+    once in one process, for jobs that mostly wait on I/O.
+    """
+    logging.basicConfig(level=logging.INFO)
+    signal.signal(signal.SIGTERM, lambda *_: job_queue.stop())
+    workers = [
+        threading.Thread(target=job_queue.run, args=(default_worker_id(n),))
+        for n in range(1, threads)
+    ]
+    print(f"Running background jobs in {threads} threads...")
+    for worker in workers:
+        worker.start()
+    try:
+        job_queue.run(default_worker_id(0))
+    except KeyboardInterrupt:
+        job_queue.stop()
+    for worker in workers:
+        worker.join()
+    print("Stopped.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--threads", type=int, default=1, help="jobs run at once by this worker"
+    )
+    run_worker(parser.parse_args().threads)
@@ -7,6 +7,8 @@ from app.models.user import User
 from app.models.family_member import FamilyMember, MemberType
 from app.models.health_event import HealthEvent
 from app.api.v1.endpoints.auth import get_password_hash
+from app.services.health_score_service import health_score_service
+from app.services.stats_service import stats_service
 
 
 def create_fake_users(db: Session) -> List[User]:
@@ -48,7 +50,6 @@ def create_fake_family_members(db: Session, users: List[User]) -> List[FamilyMem
                 member_type=MemberType.HUMAN,
                 relation_type="Father",
                 date_of_birth=datetime(1980, 1, 1),
-                health_score=95,
                 notes="Loves hiking",
                 manager_id=users[0].id,
             ),
@@ -57,7 +58,6 @@ def create_fake_family_members(db: Session, users: List[User]) -> List[FamilyMem
                 member_type=MemberType.HUMAN,
                 relation_type="Mother",
                 date_of_birth=datetime(1982, 3, 15),
-                health_score=92,
                 notes="Enjoys cooking",
                 manager_id=users[0].id,
             ),
@@ -66,7 +66,6 @@ def create_fake_family_members(db: Session, users: List[User]) -> List[FamilyMem
                 member_type=MemberType.PET,
                 relation_type="Dog",
                 date_of_birth=datetime(2020, 5, 10),
-                health_score=88,
                 notes="Golden Retriever",
                 manager_id=users[0].id,
             ),
@@ -81,7 +80,6 @@ def create_fake_family_members(db: Session, users: List[User]) -> List[FamilyMem
                 member_type=MemberType.HUMAN,
                 relation_type="Mother",
                 date_of_birth=datetime(1985, 7, 20),
-                health_score=90,
                 notes="Works as a teacher",
                 manager_id=users[1].id,
             ),
@@ -90,7 +88,6 @@ def create_fake_family_members(db: Session, users: List[User]) -> List[FamilyMem
                 member_type=MemberType.PET,
                 relation_type="Cat",
                 date_of_birth=datetime(2021, 2, 28),
-                health_score=95,
                 notes="Persian cat",
                 manager_id=users[1].id,
             ),
@@ -105,7 +102,6 @@ def create_fake_family_members(db: Session, users: List[User]) -> List[FamilyMem
                 member_type=MemberType.HUMAN,
                 relation_type="Father",
                 date_of_birth=datetime(1978, 11, 5),
-                health_score=87,
                 notes="Retired military",
                 manager_id=users[2].id,
             ),
@@ -114,7 +110,6 @@ def create_fake_family_members(db: Session, users: List[User]) -> List[FamilyMem
                 member_type=MemberType.HUMAN,
                 relation_type="Daughter",
                 date_of_birth=datetime(2010, 4, 12),
-                health_score=98,
                 notes="Loves soccer",
                 manager_id=users[2].id,
             ),
@@ -165,8 +160,6 @@ def create_fake_health_events(
                 date_time=event_date,
                 family_member_id=member.id,
                 created_by_id=manager.id,
-                file_paths=[],
-                file_types=[],
             )
             events.append(event)
 
@@ -195,4 +188,11 @@ def seed_database(db: Session, if_append: bool = False):
     print("Creating fake health events...")
     events = create_fake_health_events(db, members, users)
 
+    print("Rebuilding event statistics...")
+    stats_service.rebuild(db)
+    db.commit()
+
+    print("Computing health scores...")
+    health_score_service.recompute_all(db)
+
     print("Database seeding completed successfully!")
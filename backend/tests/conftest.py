@@ -1,16 +1,34 @@
+import uuid
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
+from app.db import query_guard
 from app.db.base_class import Base
 from app.db.session import get_db
 from app.main import app
 from app.core.config import settings
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType, HealthEvent
+from app.models.user import User
+from app.services.file_service import file_service
 
 SQLALCHEMY_DATABASE_URL = settings.get_database_url
 
 
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    """Store uploads of every test in its own temporary directory."""
+    base_path = tmp_path / "uploads"
+    monkeypatch.setattr(file_service, "base_path", base_path)
+    monkeypatch.setattr(file_service, "image_path", base_path / "images")
+    monkeypatch.setattr(file_service, "pdf_path", base_path / "pdfs")
+    file_service._ensure_directories()
+    return base_path
+
+
 @pytest.fixture(scope="session")
 def engine():
     engine = create_engine(
@@ -24,10 +42,14 @@ def engine():
 
 @pytest.fixture(scope="function")
 def db_session(engine):
+    # The fixtures in tests/integration/test_base.py drop the schema on
+    # teardown, so make sure it exists for every test using this fixture.
+    Base.metadata.create_all(bind=engine)
     connection = engine.connect()
     transaction = connection.begin()
     TestingSessionLocal = sessionmaker(bind=connection)
     session = TestingSessionLocal()
+    query_guard.install(session)
     yield session
     session.close()
     transaction.rollback()
@@ -37,6 +59,8 @@ def db_session(engine):
 @pytest.fixture(scope="function")
 def client(db_session):
     def override_get_db():
+        # Every request starts with a clean slate for N+1 detection
+        query_guard.reset(db_session)
         try:
             yield db_session
         finally:
@@ -46,3 +70,61 @@ def client(db_session):
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="not-a-hash",
+        full_name="Test User",
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+@pytest.fixture
+def add_member(db_session, user):
+    """Factory of family members managed by ``user``."""
+
+    def add_member(**fields):
+        member = FamilyMember(
+            name="Test Member",
+            member_type=MemberType.HUMAN,
+            relation_type="self",
+            manager_id=user.id,
+            **fields,
+        )
+        db_session.add(member)
+        db_session.flush()
+        return member
+
+    return add_member
+
+
+@pytest.fixture
+def member(add_member):
+    return add_member()
+
+
+@pytest.fixture
+def add_event(db_session):
+    """Factory of health events created by the manager of their member."""
+
+    def add_event(
+        member, date_time, event_type=EventType.CHECKUP, title="Test event", **fields
+    ):
+        event = HealthEvent(
+            title=title,
+            event_type=event_type.value,
+            date_time=date_time,
+            family_member_id=member.id,
+            created_by_id=member.manager_id,
+            **fields,
+        )
+        db_session.add(event)
+        db_session.flush()
+        return event
+
+    return add_event
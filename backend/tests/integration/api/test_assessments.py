@@ -0,0 +1,125 @@
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.family_member import FamilyMember, MemberType
+from app.services.assessment_service import assessment_service
+from tests.integration.test_base import TestBase
+
+OPTIONS = [{"value": "0", "score": 0}, {"value": "1", "score": 1}]
+DEFINITION = {
+    "items": [
+        {"id": "q1", "text": "First", "options": OPTIONS},
+        {"id": "q2", "text": "Second", "options": OPTIONS, "weight": 2},
+    ],
+    "subscales": {"second": ["q2"]},
+    "bands": [{"min_score": 0, "label": "Low"}, {"min_score": 2, "label": "High"}],
+}
+
+
+class TestAssessments(TestBase):
+    def _create_member(self, db_session, headers):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name="Assessed Member",
+            member_type=MemberType.HUMAN,
+            relation_type="self",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _create_scale(self, db_session, definition=DEFINITION):
+        scale = assessment_service.save_scale(
+            db_session, key="sample", name="Sample", definition=definition
+        )
+        db_session.commit()
+        return scale
+
+    def _submit(self, headers, submissions):
+        return self.client.post(
+            f"{settings.API_V1_STR}/assessments/results",
+            json={"submissions": submissions},
+            headers=headers,
+        )
+
+    def test_submissions_are_scored_and_stored(self, db_session: Session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        scale = self._create_scale(db_session)
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/assessments/scales", headers=headers
+        )
+        assert response.status_code == 200
+        assert [s["key"] for s in response.json()] == ["sample"]
+
+        answer_sets = [{"q1": "1", "q2": "0"}, {"q1": "1", "q2": "1"}]
+        response = self._submit(
+            headers,
+            [
+                {
+                    "test_scale_id": str(scale.id),
+                    "family_member_id": str(member.id),
+                    "answers": answers,
+                }
+                for answers in answer_sets
+            ],
+        )
+        assert response.status_code == 201
+        results = response.json()["results"]
+        assert [r["total_score"] for r in results] == [1, 3]
+        assert [r["subscale_scores"] for r in results] == [
+            {"second": 0},
+            {"second": 2},
+        ]
+        assert [r["band"] for r in results] == ["Low", "High"]
+        assert {r["scale_version"] for r in results} == {1}
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/assessments/results",
+            params={"family_member_id": str(member.id)},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert sorted(r["total_score"] for r in response.json()["results"]) == [1, 3]
+
+    def test_new_version_of_a_scale_is_used_for_scoring(self, db_session: Session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        scale = self._create_scale(db_session)
+        submission = {
+            "test_scale_id": str(scale.id),
+            "family_member_id": str(member.id),
+            "answers": {"q1": "1", "q2": "1"},
+        }
+        result = self._submit(headers, [submission]).json()["results"][0]
+        assert result["total_score"] == 3
+
+        reweighted = dict(DEFINITION, items=[DEFINITION["items"][0]], subscales={})
+        scale = self._create_scale(db_session, reweighted)
+        assert scale.version == 2
+        submission["answers"] = {"q1": "1"}
+        result = self._submit(headers, [submission]).json()["results"][0]
+        assert result["scale_version"] == 2
+        assert result["total_score"] == 1
+
+    def test_invalid_answers_are_rejected(self, db_session: Session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        scale = self._create_scale(db_session)
+
+        response = self._submit(
+            headers,
+            [
+                {
+                    "test_scale_id": str(scale.id),
+                    "family_member_id": str(member.id),
+                    "answers": {"q1": "1"},
+                }
+            ],
+        )
+        assert response.status_code == 422
+        assert "missing answer to q2" in response.json()["detail"]
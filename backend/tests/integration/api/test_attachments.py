@@ -0,0 +1,219 @@
+import os
+from datetime import datetime
+from io import BytesIO
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.attachment import Attachment
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType, HealthEvent
+from app.services.attachment_service import attachment_service
+from app.services.job_queue import job_queue
+from app.services.partition_service import partition_service
+from tests.integration.test_base import TestBase
+
+
+class TestAttachments(TestBase):
+    def _create_member(self, db_session, headers):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name="Attachment Member",
+            member_type=MemberType.HUMAN,
+            relation_type="child",
+            date_of_birth="2015-01-01",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _create_event(self, headers, member, files=None):
+        response = self.client.post(
+            f"{settings.API_V1_STR}/health-events/",
+            data={
+                "title": "Lab results",
+                "event_type": EventType.CHECKUP.value,
+                "family_member_id": str(member.id),
+                "date_time": datetime(2024, 2, 1, 8, 0).isoformat(),
+            },
+            files=files,
+            headers=headers,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def _add(self, headers, event_id, name, content, mime="application/pdf"):
+        return self.client.post(
+            f"{settings.API_V1_STR}/health-events/{event_id}/attachments",
+            files=[("files", (name, BytesIO(content), mime))],
+            headers=headers,
+        )
+
+    def _get(self, headers, event_id):
+        return self.client.get(
+            f"{settings.API_V1_STR}/health-events/{event_id}", headers=headers
+        ).json()
+
+    @pytest.fixture(autouse=True)
+    def queue_in_test_transaction(self, db_session, monkeypatch):
+        # Jobs are enqueued in the test transaction, so run them in it too
+        monkeypatch.setattr(
+            job_queue,
+            "session_factory",
+            lambda: Session(
+                bind=db_session.connection(), join_transaction_mode="create_savepoint"
+            ),
+        )
+
+    def _run_jobs(self):
+        # Detached files are deleted by background jobs
+        while job_queue.run_once("test"):
+            pass
+
+    def test_add_and_remove_single_attachments(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(
+            headers,
+            member,
+            files=[("files", ("report.pdf", BytesIO(b"report"), "application/pdf"))],
+        )
+        assert len(event["attachments"]) == 1
+        original = event["attachments"][0]
+        assert original["size"] == len(b"report")
+        assert original["filename"] == "report.pdf"
+        assert event["file_paths"] == [event["file_paths"][0]]
+        first_path = event["file_paths"][0]
+        first_mtime = os.stat(first_path).st_mtime_ns
+
+        response = self._add(headers, event["id"], "xray.png", b"xray", "image/png")
+        assert response.status_code == 201
+        added = response.json()[0]
+        assert added["mime"] == "image/png"
+
+        # The existing file is left untouched
+        event = self._get(headers, event["id"])
+        assert [a["id"] for a in event["attachments"]] == [original["id"], added["id"]]
+        assert event["file_types"] == ["application/pdf", "image/png"]
+        assert os.stat(first_path).st_mtime_ns == first_mtime
+
+        response = self.client.delete(
+            f"{settings.API_V1_STR}/health-events/{event['id']}"
+            f"/attachments/{original['id']}",
+            headers=headers,
+        )
+        assert response.status_code == 204
+        event = self._get(headers, event["id"])
+        assert [a["id"] for a in event["attachments"]] == [added["id"]]
+        assert os.path.exists(first_path)
+        self._run_jobs()
+        assert not os.path.exists(first_path)
+
+    def test_identical_files_are_stored_once(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        first = self._create_event(headers, member)
+        second = self._create_event(headers, member)
+
+        a = self._add(headers, first["id"], "scan.pdf", b"same content").json()[0]
+        b = self._add(headers, second["id"], "copy.pdf", b"same content").json()[0]
+        assert a["hash"] == b["hash"]
+        assert a["url"] == b["url"]
+
+        # Deleting one event keeps the file still used by the other
+        path = self._get(headers, second["id"])["file_paths"][0]
+        self.client.delete(
+            f"{settings.API_V1_STR}/health-events/{first['id']}", headers=headers
+        )
+        self._run_jobs()
+        assert os.path.exists(path)
+
+        self.client.delete(
+            f"{settings.API_V1_STR}/health-events/{second['id']}", headers=headers
+        )
+        self._run_jobs()
+        assert not os.path.exists(path)
+
+    def test_purge_keeps_files_referenced_again(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        first = self._create_event(headers, member)
+        self._add(headers, first["id"], "scan.pdf", b"shared")
+        path = self._get(headers, first["id"])["file_paths"][0]
+
+        # A detached path that another upload attached meanwhile survives
+        attachment_service.purge_files(db_session, [path])
+        assert os.path.exists(path)
+
+    def test_invalid_attachment_is_rejected(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(headers, member)
+
+        response = self._add(headers, event["id"], "notes.txt", b"text", "text/plain")
+        assert response.status_code == 400
+        assert self._get(headers, event["id"])["attachments"] == []
+
+    def test_remove_unknown_attachment(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(headers, member)
+
+        response = self.client.delete(
+            f"{settings.API_V1_STR}/health-events/{event['id']}"
+            f"/attachments/00000000-0000-0000-0000-000000000000",
+            headers=headers,
+        )
+        assert response.status_code == 404
+
+    def test_update_with_files_replaces_attachments(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(
+            headers,
+            member,
+            files=[
+                ("files", ("keep.pdf", BytesIO(b"keep"), "application/pdf")),
+                ("files", ("drop.pdf", BytesIO(b"drop"), "application/pdf")),
+            ],
+        )
+        kept_path, dropped_path = event["file_paths"]
+
+        response = self.client.put(
+            f"{settings.API_V1_STR}/health-events/{event['id']}",
+            files=[("files", ("keep.pdf", BytesIO(b"keep"), "application/pdf"))],
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["file_paths"] == [kept_path]
+        self._run_jobs()
+        assert os.path.exists(kept_path)
+        assert not os.path.exists(dropped_path)
+
+    def test_moving_event_across_years_keeps_attachments(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(
+            headers,
+            member,
+            files=[("files", ("report.pdf", BytesIO(b"report"), "application/pdf"))],
+        )
+        # Creating the 2024 partition moves the event out of the default one
+        partition_service.ensure_partitions(db_session)
+        partition_service.create_partition(db_session, 2023)
+        assert db_session.scalar(select(func.count()).select_from(Attachment)) == 1
+
+        # Another year is another partition of health_events
+        stored = db_session.get(HealthEvent, event["id"])
+        stored.date_time = datetime(2023, 11, 1, 8, 0)
+        db_session.commit()
+
+        moved = self._get(headers, event["id"])
+        assert moved["date_time"].startswith("2023-11-01")
+        assert [a["id"] for a in moved["attachments"]] == [
+            a["id"] for a in event["attachments"]
+        ]
@@ -0,0 +1,202 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.api.v1.endpoints import batch
+from app.db import session
+from app.db.session import get_db
+from app.main import app
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType
+from app.models.user import User
+from tests.integration.test_base import TestBase
+
+
+class TestBatch(TestBase):
+    @pytest.fixture(autouse=True)
+    def session_per_request(self, client, db_session, monkeypatch):
+        # Use the application's get_db, so reads get their own session and
+        # writes the session of the batch; all of them join the test
+        # transaction
+        monkeypatch.delitem(app.dependency_overrides, get_db)
+        monkeypatch.setattr(
+            session,
+            "SessionLocal",
+            lambda: Session(
+                bind=db_session.connection(), join_transaction_mode="create_savepoint"
+            ),
+        )
+
+    @pytest.fixture(autouse=True)
+    def serial_reads(self, monkeypatch):
+        # The sessions share the connection of the test transaction, which
+        # must not be used from concurrent threads
+        monkeypatch.setattr(settings, "BATCH_MAX_CONCURRENCY", 1)
+
+    @pytest.fixture
+    def dispatched_users(self, monkeypatch):
+        users = []
+        dispatch = batch._dispatch
+
+        async def record(request, item, user, db):
+            state = inspect(user)
+            loaded = set(state.mapper.column_attrs.keys()) - state.unloaded
+            users.append((state.detached, loaded))
+            return await dispatch(request, item, user, db)
+
+        monkeypatch.setattr(batch, "_dispatch", record)
+        return users
+
+    def _create_member(self, db_session, headers):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name="Batch Member",
+            member_type=MemberType.HUMAN,
+            relation_type="child",
+            date_of_birth="2015-01-01",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _batch(self, headers, requests):
+        return self.client.post(
+            f"{settings.API_V1_STR}/batch/",
+            json={"requests": requests},
+            headers=headers,
+        )
+
+    def test_screen_loads_in_one_round_trip(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        self.client.post(
+            f"{settings.API_V1_STR}/health-events/",
+            data={
+                "title": "Batched event",
+                "event_type": EventType.CHECKUP.value,
+                "family_member_id": str(member.id),
+                "date_time": datetime(2024, 1, 5, 9, 0).isoformat(),
+            },
+            headers=headers,
+        )
+
+        response = self._batch(
+            headers,
+            [
+                {"id": "me", "path": "/auth/me"},
+                {"id": "members", "path": "/family-members/"},
+                {
+                    "id": "events",
+                    "path": "/health-events/",
+                    "query": {"family_member_id": str(member.id)},
+                },
+            ],
+        )
+
+        assert response.status_code == 200
+        me, members, events = response.json()["responses"]
+        assert me["id"] == "me" and me["status"] == 200
+        assert me["body"]["email"] == "test@example.com"
+        assert [m["id"] for m in members["body"]["items"]] == [str(member.id)]
+        assert [e["title"] for e in events["body"]["items"]] == ["Batched event"]
+        assert "etag" in events["headers"]
+
+    def test_writes_run_in_order(self, db_session):
+        headers = self.get_auth_headers()
+
+        response = self._batch(
+            headers,
+            [
+                {"path": "/family-members/"},
+                {
+                    "method": "POST",
+                    "path": "/family-members/",
+                    "body": {
+                        "name": "Created In Batch",
+                        "member_type": "human",
+                        "relation_type": "child",
+                    },
+                },
+                {"path": "/family-members/"},
+            ],
+        )
+
+        before, created, after = response.json()["responses"]
+        assert before["body"]["total"] == 0
+        assert created["status"] == 201
+        assert [m["name"] for m in after["body"]["items"]] == ["Created In Batch"]
+
+    def test_sub_requests_get_a_detached_user(self, db_session, dispatched_users):
+        headers = self.get_auth_headers()
+        reads = [{"path": "/auth/me"}, {"path": "/family-members/"}] * 2
+
+        response = self._batch(
+            headers,
+            [
+                {
+                    "method": "POST",
+                    "path": "/family-members/",
+                    "body": {
+                        "name": "Created In Batch",
+                        "member_type": "human",
+                        "relation_type": "child",
+                    },
+                },
+                *reads,
+            ],
+        )
+
+        created, *responses = response.json()["responses"]
+        assert created["status"] == 201
+        assert [r["status"] for r in responses] == [200] * len(reads)
+        assert {r["body"].get("email") for r in responses[::2]} == {
+            "test@example.com"
+        }
+        assert {r["body"].get("total") for r in responses[1::2]} == {1}
+        # Reads after the write's commit don't refresh it through the
+        # session of the batch
+        columns = set(inspect(User).column_attrs.keys())
+        assert dispatched_users == [(True, columns)] * (len(reads) + 1)
+
+    def test_sub_request_errors_are_reported_per_item(self, db_session):
+        headers = self.get_auth_headers()
+
+        response = self._batch(
+            headers,
+            [
+                {"path": "/family-members/00000000-0000-0000-0000-000000000000"},
+                {"path": "/sync/events"},
+                {"path": "/batch/"},
+                {"path": "/auth/me"},
+            ],
+        )
+
+        statuses = [r["status"] for r in response.json()["responses"]]
+        assert statuses == [404, 400, 400, 200]
+
+    def test_conditional_headers_are_forwarded(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        path = f"/family-members/{member.id}"
+
+        first = self._batch(headers, [{"path": path}]).json()["responses"][0]
+        etag = first["headers"]["etag"]
+        second = self._batch(
+            headers, [{"path": path, "headers": {"If-None-Match": etag}}]
+        ).json()["responses"][0]
+        assert second["status"] == 304
+        assert second["body"] is None
+
+    def test_batch_requires_authentication(self):
+        response = self._batch({}, [{"path": "/auth/me"}])
+        assert response.status_code == 401
+
+    def test_batch_size_is_limited(self):
+        headers = self.get_auth_headers()
+        requests = [{"path": "/auth/me"}] * (settings.BATCH_MAX_REQUESTS + 1)
+        assert self._batch(headers, requests).status_code == 400
@@ -0,0 +1,151 @@
+from datetime import datetime
+from app.core.config import settings
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType
+from tests.integration.test_base import TestBase
+
+
+class TestConditionalRequests(TestBase):
+    def _create_member(self, db_session, headers):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name="Polled Member",
+            member_type=MemberType.PET,
+            relation_type="dog",
+            date_of_birth="2019-06-01",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _create_event(self, headers, family_member_id, title="Vet Visit"):
+        response = self.client.post(
+            f"{settings.API_V1_STR}/health-events/",
+            data={
+                "title": title,
+                "event_type": EventType.CHECKUP.value,
+                "family_member_id": str(family_member_id),
+                "date_time": datetime(2024, 6, 1, 10, 0).isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_health_event_etag_roundtrip(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(headers, member.id)
+        url = f"{settings.API_V1_STR}/health-events/{event['id']}"
+
+        response = self.client.get(url, headers=headers)
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert "Last-Modified" in response.headers
+
+        # Both the cached and uncached paths honour the validator
+        for _ in range(2):
+            response = self.client.get(url, headers={**headers, "If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["ETag"] == etag
+
+        self.client.put(url, data={"title": "Vet Follow-up"}, headers=headers)
+
+        response = self.client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["title"] == "Vet Follow-up"
+
+    def test_health_event_if_modified_since(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(headers, member.id)
+        url = f"{settings.API_V1_STR}/health-events/{event['id']}"
+
+        last_modified = self.client.get(url, headers=headers).headers["Last-Modified"]
+        response = self.client.get(
+            url, headers={**headers, "If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 304
+
+    def test_health_event_list_collection_etag(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        self._create_event(headers, member.id)
+        url = f"{settings.API_V1_STR}/health-events/"
+
+        etag = self.client.get(url, headers=headers).headers["ETag"]
+        response = self.client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        other_page = self.client.get(f"{url}?size=5", headers=headers)
+        assert other_page.headers["ETag"] != etag
+
+        self._create_event(headers, member.id, title="Second Visit")
+        response = self.client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
+    def test_health_event_list_sees_deletes(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        self._create_event(headers, member.id)
+        deleted = self._create_event(headers, member.id, title="Old Visit")
+        url = f"{settings.API_V1_STR}/health-events/"
+
+        response = self.client.get(url, headers=headers)
+        etag = response.headers["ETag"]
+        # The newest change can't account for deletes, so it isn't offered
+        assert "Last-Modified" not in response.headers
+
+        self.client.delete(f"{url}{deleted['id']}", headers=headers)
+        for condition in (
+            {"If-None-Match": etag},
+            {"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"},
+        ):
+            response = self.client.get(url, headers={**headers, **condition})
+            assert response.status_code == 200
+            assert response.json()["total"] == 1
+
+    def test_family_member_etags(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        detail_url = f"{settings.API_V1_STR}/family-members/{member.id}"
+        list_url = f"{settings.API_V1_STR}/family-members/"
+
+        detail_etag = self.client.get(detail_url, headers=headers).headers["ETag"]
+        list_etag = self.client.get(list_url, headers=headers).headers["ETag"]
+        assert (
+            self.client.get(
+                detail_url, headers={**headers, "If-None-Match": detail_etag}
+            ).status_code
+            == 304
+        )
+        assert (
+            self.client.get(
+                list_url, headers={**headers, "If-None-Match": list_etag}
+            ).status_code
+            == 304
+        )
+
+        self.client.put(
+            detail_url, json={"notes": "Allergic to chicken"}, headers=headers
+        )
+
+        assert (
+            self.client.get(
+                detail_url, headers={**headers, "If-None-Match": detail_etag}
+            ).status_code
+            == 200
+        )
+        assert (
+            self.client.get(
+                list_url, headers={**headers, "If-None-Match": list_etag}
+            ).status_code
+            == 200
+        )
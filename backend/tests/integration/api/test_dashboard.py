@@ -0,0 +1,212 @@
+from datetime import datetime, timedelta
+from app.core.config import settings
+from app.db.query_guard import record_statements
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType
+from app.models.event_stats import MemberEventTypeStats
+from app.services.stats_service import stats_service
+from app.services.trend_service import trend_service
+from tests.integration.test_base import TestBase
+
+
+class TestDashboard(TestBase):
+    def _create_member(self, db_session, headers, name="Stats Member"):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name=name,
+            member_type=MemberType.HUMAN,
+            relation_type="parent",
+            date_of_birth="1970-01-01",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _create_event(self, headers, family_member_id, event_type, date_time):
+        response = self.client.post(
+            f"{settings.API_V1_STR}/health-events/",
+            data={
+                "title": f"{event_type} event",
+                "event_type": event_type,
+                "family_member_id": str(family_member_id),
+                "date_time": date_time.isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def _get_member_stats(self, headers, family_member_id):
+        response = self.client.get(
+            f"{settings.API_V1_STR}/dashboard/stats?months=120", headers=headers
+        )
+        assert response.status_code == 200
+        members = response.json()["members"]
+        return next(
+            m for m in members if m["family_member_id"] == str(family_member_id)
+        )
+
+    def test_stats_follow_event_writes(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+
+        self._create_event(
+            headers, member.id, EventType.CHECKUP.value, datetime(2024, 1, 5, 9, 0)
+        )
+        latest_checkup = self._create_event(
+            headers, member.id, EventType.CHECKUP.value, datetime(2024, 3, 5, 9, 0)
+        )
+        self._create_event(
+            headers, member.id, EventType.SYMPTOM.value, datetime(2024, 3, 7, 9, 0)
+        )
+
+        stats = self._get_member_stats(headers, member.id)
+        assert stats["total_events"] == 3
+        assert stats["counts_by_type"] == {"CHECKUP": 2, "SYMPTOM": 1}
+        assert stats["last_checkup_at"] == "2024-03-05T09:00:00"
+        assert stats["last_event_at"] == "2024-03-07T09:00:00"
+        assert [m["event_count"] for m in stats["monthly"]] == [1, 2]
+
+        # Removing the latest checkup moves the bound back to the earlier one
+        response = self.client.delete(
+            f"{settings.API_V1_STR}/health-events/{latest_checkup['id']}",
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+        stats = self._get_member_stats(headers, member.id)
+        assert stats["counts_by_type"] == {"CHECKUP": 1, "SYMPTOM": 1}
+        assert stats["last_checkup_at"] == "2024-01-05T09:00:00"
+        assert [m["event_count"] for m in stats["monthly"]] == [1, 1]
+
+    def test_stats_member_without_events(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers, name="Quiet Member")
+
+        stats = self._get_member_stats(headers, member.id)
+        assert stats["total_events"] == 0
+        assert stats["counts_by_type"] == {}
+        assert stats["last_checkup_at"] is None
+        assert stats["monthly"] == []
+
+    def test_rebuild_matches_incremental(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        for day in (1, 2, 3):
+            self._create_event(
+                headers,
+                member.id,
+                EventType.MEDICATION.value,
+                datetime(2024, 2, day, 8, 0),
+            )
+
+        def snapshot():
+            db_session.expire_all()
+            return sorted(
+                (row.event_type, row.event_count, row.first_event_at, row.last_event_at)
+                for row in db_session.query(MemberEventTypeStats).filter(
+                    MemberEventTypeStats.family_member_id == member.id
+                )
+            )
+
+        incremental = snapshot()
+        stats_service.rebuild(db_session)
+        db_session.commit()
+        assert snapshot() == incremental
+
+    def test_home_returns_latest_and_next_events(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        quiet = self._create_member(db_session, headers, name="Quiet Member")
+        for day in (1, 2, 3, 4):
+            self._create_event(
+                headers,
+                member.id,
+                EventType.CHECKUP.value,
+                datetime(2024, 1, day, 9, 0),
+            )
+        self._create_event(
+            headers, member.id, EventType.SYMPTOM.value, datetime(2024, 2, 1, 9, 0)
+        )
+        soon = datetime.now().replace(microsecond=0) + timedelta(days=7)
+        self._create_event(headers, member.id, EventType.MEDICATION.value, soon)
+        self._create_event(
+            headers, member.id, EventType.CHECKUP.value, soon + timedelta(days=30)
+        )
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/dashboard/home?per_type=2", headers=headers
+        )
+        assert response.status_code == 200
+
+        members = {m["id"]: m for m in response.json()["members"]}
+        overview = members[str(member.id)]
+        checkups = overview["latest_events"][EventType.CHECKUP.value]
+        assert [e["date_time"] for e in checkups] == [
+            "2024-01-04T09:00:00",
+            "2024-01-03T09:00:00",
+        ]
+        assert len(overview["latest_events"][EventType.SYMPTOM.value]) == 1
+        assert overview["latest_events"][EventType.MEDICATION.value] == []
+        assert overview["next_event"]["event_type"] == EventType.MEDICATION.value
+        assert overview["next_event"]["date_time"] == soon.isoformat()
+
+        assert members[str(quiet.id)]["next_event"] is None
+        assert all(
+            events == [] for events in members[str(quiet.id)]["latest_events"].values()
+        )
+
+    def test_home_reads_events_in_one_query(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        for event_type in EventType:
+            self._create_event(
+                headers, member.id, event_type.value, datetime(2024, 1, 1, 9, 0)
+            )
+
+        with record_statements(db_session.get_bind().engine) as statements:
+            response = self.client.get(
+                f"{settings.API_V1_STR}/dashboard/home", headers=headers
+            )
+        assert response.status_code == 200
+        assert len([s for s in statements if "health_events" in s]) == 1
+        members = response.json()["members"]
+        assert all(len(events) == 1 for events in members[0]["latest_events"].values())
+
+    def test_trends_flag_a_spike_of_symptoms(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        self._create_event(
+            headers, member.id, EventType.CHECKUP.value, datetime(2024, 3, 4, 9, 0)
+        )
+        for day in (24, 25, 26, 28):
+            self._create_event(
+                headers, member.id, EventType.SYMPTOM.value, datetime(2024, 6, day, 9)
+            )
+
+        # A Wednesday: the latest complete week starts on Monday June 24
+        run = trend_service.run(db_session, now=datetime(2024, 7, 3, 2, 0))
+        assert run.complete
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/dashboard/trends?family_member_id={member.id}",
+            headers=headers,
+        )
+        assert response.status_code == 200
+        trends = {t["event_type"]: t for t in response.json()["trends"]}
+        assert set(trends) == {EventType.CHECKUP.value, EventType.SYMPTOM.value}
+        symptoms = trends[EventType.SYMPTOM.value]
+        assert symptoms["weekly_counts"][-1] == 4
+        assert symptoms["is_anomaly"]
+        assert not trends[EventType.CHECKUP.value]["is_anomaly"]
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/dashboard/trends?flagged_only=true",
+            headers=headers,
+        )
+        flagged = response.json()["trends"]
+        assert [t["event_type"] for t in flagged] == [EventType.SYMPTOM.value]
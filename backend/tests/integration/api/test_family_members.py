@@ -1,5 +1,6 @@
 from tests.integration.test_base import TestBase
 from app.core.config import settings
+from app.db.query_guard import record_statements
 from app.models.family_member import MemberType
 
 
@@ -24,7 +25,8 @@ class TestFamilyMembers(TestBase):
         assert data["relation_type"] == "father"
         assert data["date_of_birth"] == "1980-01-01"
         assert data["member_type"] == MemberType.HUMAN
-        assert data["health_score"] == 90
+        # Derived from events, so the submitted score is ignored
+        assert data["health_score"] is None
         assert data["notes"] == "Healthy individual"
 
     def test_get_family_members(self):
@@ -117,7 +119,7 @@ class TestFamilyMembers(TestBase):
         data = response.json()
         assert data["id"] == family_member_id
         assert data["name"] == "John Smith"
-        assert data["health_score"] == 95
+        assert data["health_score"] is None
         assert data["notes"] == "Very healthy individual"
 
     def test_delete_family_member(self):
@@ -148,3 +150,59 @@ class TestFamilyMembers(TestBase):
             f"{settings.API_V1_STR}/family-members/{family_member_id}", headers=headers
         )
         assert get_response.status_code == 404
+
+    def test_family_member_event_summary(self, db_session):
+        headers = self.get_auth_headers()
+        create_response = self.client.post(
+            f"{settings.API_V1_STR}/family-members/",
+            headers=headers,
+            json={
+                "name": "John Doe",
+                "member_type": MemberType.HUMAN,
+                "relation_type": "father",
+            },
+        )
+        family_member_id = create_response.json()["id"]
+        detail_url = f"{settings.API_V1_STR}/family-members/{family_member_id}"
+
+        response = self.client.get(detail_url, headers=headers)
+        data = response.json()
+        assert data["event_count"] == 0
+        assert data["last_event_at"] is None
+        assert data["counts_by_type"] == {}
+        etag = response.headers["ETag"]
+
+        for event_type, date_time in (
+            ("CHECKUP", "2024-01-05T09:00:00"),
+            ("CHECKUP", "2024-02-05T09:00:00"),
+            ("MEDICATION", "2024-03-05T09:00:00"),
+        ):
+            self.client.post(
+                f"{settings.API_V1_STR}/health-events/",
+                data={
+                    "title": "Event",
+                    "event_type": event_type,
+                    "family_member_id": family_member_id,
+                    "date_time": date_time,
+                },
+                headers=headers,
+            )
+
+        # Event writes change the summary, so the old tag no longer matches
+        response = self.client.get(
+            detail_url, headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["event_count"] == 3
+        assert data["last_event_at"] == "2024-03-05T09:00:00"
+        assert data["counts_by_type"] == {"CHECKUP": 2, "MEDICATION": 1}
+
+        # The summaries come from the rollups, event rows are never read
+        with record_statements(db_session.get_bind().engine) as statements:
+            response = self.client.get(
+                f"{settings.API_V1_STR}/family-members/", headers=headers
+            )
+        assert response.status_code == 200
+        assert response.json()["items"][0]["event_count"] == 3
+        assert not [s for s in statements if "health_events" in s]
@@ -1,14 +1,30 @@
 import pytest
 from fastapi import UploadFile
 from io import BytesIO
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from app.db.query_guard import record_statements
 from app.models.health_event import HealthEvent, EventType
 from app.models.family_member import FamilyMember, MemberType
+from app.models.reminder import MedicationReminder
 from datetime import datetime, timedelta
 from tests.integration.test_base import TestBase, client, db_session
 import uuid
 from app.core.config import settings
 
 
+def _parse_timestamps(page):
+    for item in page["items"]:
+        for field in ("created_at", "updated_at"):
+            if field in item:
+                item[field] = datetime.fromisoformat(item[field])
+        for attachment in item.get("attachments", ()):
+            attachment["created_at"] = datetime.fromisoformat(
+                attachment["created_at"]
+            )
+    return page
+
+
 class TestHealthEvents(TestBase):
     def test_create_family_member_and_health_event(self, client, db_session):
         # Register and get a user
@@ -424,3 +440,148 @@ class TestHealthEvents(TestBase):
         assert response.status_code == 200
         data = response.json()
         assert len(data["items"]) == 0
+
+    def test_get_health_events_sparse_fields(self, client, db_session):
+        headers = self.get_auth_headers()
+        user_response = client.get(f"{settings.API_V1_STR}/auth/me", headers=headers)
+        user_id = user_response.json()["id"]
+
+        family_member = FamilyMember(
+            name="Timeline Member",
+            member_type=MemberType.HUMAN,
+            relation_type="child",
+            manager_id=user_id,
+        )
+        db_session.add(family_member)
+        db_session.commit()
+
+        for i in range(3):
+            client.post(
+                "/api/v1/health-events/",
+                data={
+                    "title": f"Timeline Event {i}",
+                    "event_type": EventType.SYMPTOM.value,
+                    "description": "A long description the timeline never shows",
+                    "family_member_id": str(family_member.id),
+                    "date_time": (
+                        datetime(2024, 5, 1, 8, 0) + timedelta(days=i)
+                    ).isoformat(),
+                },
+                files=[
+                    ("files", (f"{i}.pdf", BytesIO(b"%PDF-1.4"), "application/pdf"))
+                ],
+                headers=headers,
+            )
+
+        with record_statements(Engine) as statements:
+            response = client.get(
+                "/api/v1/health-events/?fields=title,event_type,date_time",
+                headers=headers,
+            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert set(data["items"][0]) == {"id", "title", "event_type", "date_time"}
+        assert data["items"][0]["title"] == "Timeline Event 2"
+        page_query = next(s for s in statements if "ORDER BY" in s)
+        assert "health_events.description" not in page_query
+        assert not [s for s in statements if "FROM attachments" in s]
+
+        response = client.get(
+            "/api/v1/health-events/?fields=title,attachments", headers=headers
+        )
+        item = response.json()["items"][0]
+        assert set(item) == {"id", "title", "attachments"}
+        assert item["attachments"][0]["filename"] == "2.pdf"
+
+        response = client.get(
+            "/api/v1/health-events/?fields=title,password", headers=headers
+        )
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
+
+    def test_get_health_events_rendered_by_database(self, client, db_session):
+        headers = self.get_auth_headers()
+        user_response = client.get(f"{settings.API_V1_STR}/auth/me", headers=headers)
+        user_id = user_response.json()["id"]
+
+        family_member = FamilyMember(
+            name="Rendered Member",
+            member_type=MemberType.HUMAN,
+            relation_type="child",
+            manager_id=user_id,
+        )
+        db_session.add(family_member)
+        db_session.commit()
+
+        for i in range(3):
+            client.post(
+                "/api/v1/health-events/",
+                data={
+                    "title": f"Rendered Event {i}",
+                    "event_type": EventType.CHECKUP.value,
+                    "description": "Notes" if i else None,
+                    "family_member_id": str(family_member.id),
+                    "date_time": (
+                        datetime(2024, 6, 1, 9, 30) + timedelta(days=i)
+                    ).isoformat(),
+                },
+                files=[
+                    ("files", (f"{i}-{j}.pdf", BytesIO(b"%PDF-1.4"), "application/pdf"))
+                    for j in range(i)
+                ]
+                or None,
+                headers=headers,
+            )
+
+        for query in ("?size=2&page=2", "?size=2", "?fields=title,file_paths"):
+            expected = client.get(f"/api/v1/health-events/{query}", headers=headers)
+            response = client.get(
+                f"/api/v1/health-events/{query}&render=db", headers=headers
+            )
+            assert response.status_code == 200
+            # Postgres trims trailing zeros of fractional seconds
+            assert _parse_timestamps(response.json()) == _parse_timestamps(
+                expected.json()
+            )
+
+        response = client.get(
+            "/api/v1/health-events/?page=5&render=db", headers=headers
+        )
+        assert response.json()["items"] == []
+        assert response.json()["total"] == 3
+
+    def test_create_medication_event_with_aware_date_time(self, client, db_session):
+        headers = self.get_auth_headers()
+        user_id = client.get(f"{settings.API_V1_STR}/auth/me", headers=headers).json()[
+            "id"
+        ]
+        family_member = FamilyMember(
+            name="Aware Member",
+            member_type=MemberType.HUMAN,
+            relation_type="self",
+            manager_id=user_id,
+        )
+        db_session.add(family_member)
+        db_session.commit()
+
+        # Browsers send toISOString(), i.e. UTC with a "Z" suffix
+        due_at = (datetime.utcnow() + timedelta(days=1)).replace(microsecond=0)
+        response = client.post(
+            "/api/v1/health-events/",
+            data={
+                "title": "Evening pill",
+                "event_type": EventType.MEDICATION.value,
+                "family_member_id": str(family_member.id),
+                "date_time": due_at.isoformat() + "Z",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert datetime.fromisoformat(response.json()["date_time"]) == due_at
+        reminder = db_session.scalars(
+            select(MedicationReminder).where(
+                MedicationReminder.family_member_id == family_member.id
+            )
+        ).one()
+        assert reminder.due_at == due_at
@@ -0,0 +1,221 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.family_member import FamilyMember, MemberType
+from app.models.measurement import Metric
+from app.services.ingest_buffer import ingest_buffer
+from tests.integration.test_base import TestBase
+
+
+class TestMeasurements(TestBase):
+    def _create_member(self, db_session, headers):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name="Measured Pet",
+            member_type=MemberType.PET,
+            relation_type="dog",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _ingest(self, headers, family_member_id, readings):
+        return self.client.post(
+            f"{settings.API_V1_STR}/measurements/",
+            json={
+                "family_member_id": str(family_member_id),
+                "readings": [
+                    {"metric": metric.value, "ts": ts.isoformat(), "value": value}
+                    for metric, ts, value in readings
+                ],
+            },
+            headers=headers,
+        )
+
+    def test_series_is_downsampled_into_buckets(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        start = datetime(2024, 1, 1)
+        readings = [
+            (Metric.WEIGHT, start + timedelta(hours=i), 20 + i % 10)
+            for i in range(1000)
+        ]
+        readings.append((Metric.HEART_RATE, start, 90))
+        response = self._ingest(headers, member.id, readings)
+        assert response.status_code == 201
+        assert response.json()["stored"] == 1001
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/measurements/",
+            params={
+                "family_member_id": str(member.id),
+                "metric": Metric.WEIGHT.value,
+                "points": 10,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["unit"] == "kg"
+        points = data["points"]
+        assert len(points) == 10
+        assert sum(point["count"] for point in points) == 1000
+        assert points[0]["start"] == start.isoformat()
+        assert points[0]["min"] == 20
+        assert points[0]["max"] == 29
+        assert points[0]["avg"] == 24.5
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/measurements/",
+            params={
+                "family_member_id": str(member.id),
+                "metric": Metric.WEIGHT.value,
+                "start": (start + timedelta(hours=10)).isoformat(),
+                "end": (start + timedelta(hours=12)).isoformat(),
+            },
+            headers=headers,
+        )
+        assert [point["count"] for point in response.json()["points"]] == [1, 1, 1]
+
+    def test_resent_readings_replace_values(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        ts = datetime(2024, 5, 1, 8, 0)
+        self._ingest(headers, member.id, [(Metric.GLUCOSE, ts, 5.1)])
+        response = self._ingest(
+            headers, member.id, [(Metric.GLUCOSE, ts, 5.4), (Metric.GLUCOSE, ts, 5.6)]
+        )
+        assert response.json()["stored"] == 1
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/measurements/",
+            params={"family_member_id": str(member.id), "metric": "glucose"},
+            headers=headers,
+        )
+        assert response.json()["points"] == [
+            {
+                "start": ts.isoformat(),
+                "end": ts.isoformat(),
+                "min": 5.6,
+                "max": 5.6,
+                "avg": 5.6,
+                "count": 1,
+            }
+        ]
+
+    def test_aware_times_are_read_as_utc(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        start = datetime(2024, 3, 1, 12, 0)
+        cest = timezone(timedelta(hours=2))
+        response = self._ingest(
+            headers,
+            member.id,
+            [
+                # 12:00 UTC sent with an offset, then 13:00 and 14:00 as UTC
+                (Metric.WEIGHT, start.replace(hour=14, tzinfo=cest), 10.0),
+                (Metric.WEIGHT, start + timedelta(hours=1), 11.0),
+                (Metric.WEIGHT, start + timedelta(hours=2), 12.0),
+            ],
+        )
+        assert response.status_code == 201
+
+        # Only one bound, given the way browsers send it
+        response = self.client.get(
+            f"{settings.API_V1_STR}/measurements/",
+            params={
+                "family_member_id": str(member.id),
+                "metric": Metric.WEIGHT.value,
+                "start": (start + timedelta(hours=1)).isoformat() + "Z",
+                "points": 2,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        points = response.json()["points"]
+        assert [point["avg"] for point in points] == [11.0, 12.0]
+        assert points[0]["start"] == (start + timedelta(hours=1)).isoformat()
+
+    def test_other_users_members_are_not_found(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        other = self.get_auth_headers(email="other@example.com")
+        response = self._ingest(
+            other, member.id, [(Metric.WEIGHT, datetime(2024, 1, 1), 12.0)]
+        )
+        assert response.status_code == 404
+
+    def test_compressed_device_batches_go_through_the_buffer(
+        self, db_session, monkeypatch
+    ):
+        # Flush into the test transaction
+        monkeypatch.setattr(
+            ingest_buffer,
+            "session_factory",
+            lambda: Session(
+                bind=db_session.connection(), join_transaction_mode="create_savepoint"
+            ),
+        )
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        start = datetime(2024, 3, 1, 7, 0)
+        body = {
+            "family_member_id": str(member.id),
+            "readings": [
+                {
+                    "metric": Metric.HEART_RATE.value,
+                    "ts": (start + timedelta(seconds=i)).isoformat(),
+                    "value": 60 + i % 40,
+                }
+                for i in range(500)
+            ],
+        }
+        response = self.client.post(
+            f"{settings.API_V1_STR}/measurements/ingest",
+            content=gzip.compress(json.dumps(body).encode()),
+            headers={
+                **headers,
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+        )
+        assert response.status_code == 201
+        assert response.json()["stored"] == 500
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/measurements/",
+            params={
+                "family_member_id": str(member.id),
+                "metric": Metric.HEART_RATE.value,
+                "points": 1,
+            },
+            headers=headers,
+        )
+        assert response.json()["points"][0]["count"] == 500
+
+        response = self.client.post(
+            f"{settings.API_V1_STR}/measurements/ingest",
+            content=b"not gzip",
+            headers={**headers, "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    def test_oversized_device_batches_are_rejected(self, db_session, monkeypatch):
+        monkeypatch.setattr(settings, "INGEST_MAX_BODY_BYTES", 1000)
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        body = json.dumps(
+            {"family_member_id": str(member.id), "readings": [{}] * 1000}
+        ).encode()
+        response = self.client.post(
+            f"{settings.API_V1_STR}/measurements/ingest",
+            content=body,
+            headers={**headers, "Content-Type": "application/json"},
+        )
+        assert response.status_code == 413
@@ -0,0 +1,90 @@
+from datetime import datetime
+from io import BytesIO
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from app.core.config import settings
+from app.db.query_guard import QueryPatternError, record_statements
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType, HealthEvent
+from tests.integration.test_base import TestBase
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+class TestQueryCounts(TestBase):
+    def _create_member(self, headers):
+        response = self.client.post(
+            f"{settings.API_V1_STR}/family-members/",
+            json={
+                "name": "Query Member",
+                "member_type": MemberType.HUMAN,
+                "relation_type": "child",
+            },
+            headers=headers,
+        )
+        return response.json()["id"]
+
+    def _create_events(self, headers, member_id, count):
+        for i in range(count):
+            response = self.client.post(
+                f"{settings.API_V1_STR}/health-events/",
+                data={
+                    "title": f"Event {i}",
+                    "event_type": EventType.CHECKUP.value,
+                    "family_member_id": member_id,
+                    "date_time": datetime(2024, 1, i + 1, 9, 0).isoformat(),
+                },
+                files=[("files", (f"{i}.png", BytesIO(PNG + bytes([i])), "image/png"))],
+                headers=headers,
+            )
+            assert response.status_code == 200
+
+    def _count(self, db_session, url, headers):
+        with record_statements(db_session.get_bind().engine) as statements:
+            response = self.client.get(url, headers=headers)
+        assert response.status_code == 200
+        return len(statements)
+
+    def test_list_endpoints_do_not_grow_with_rows(self, db_session):
+        headers = self.get_auth_headers()
+        member_id = self._create_member(headers)
+        events_url = f"{settings.API_V1_STR}/health-events/?size=50"
+        members_url = f"{settings.API_V1_STR}/family-members/"
+
+        self._create_events(headers, member_id, 2)
+        few = (
+            self._count(db_session, events_url, headers),
+            self._count(db_session, members_url, headers),
+        )
+        self._create_events(headers, member_id, 6)
+        many = (
+            self._count(db_session, events_url, headers),
+            self._count(db_session, members_url, headers),
+        )
+        assert few == many
+
+    def test_unloaded_relationships_raise(self, db_session):
+        headers = self.get_auth_headers()
+        member_id = self._create_member(headers)
+        self._create_events(headers, member_id, 1)
+
+        event = db_session.scalars(select(HealthEvent)).first()
+        with pytest.raises(InvalidRequestError):
+            event.attachments
+        member = db_session.get(FamilyMember, event.family_member_id)
+        with pytest.raises(InvalidRequestError):
+            member.health_events
+
+    def test_repeated_queries_are_reported(self, db_session):
+        headers = self.get_auth_headers()
+        member_id = self._create_member(headers)
+        self._create_events(headers, member_id, 4)
+        event_ids = db_session.scalars(select(HealthEvent.id)).all()
+
+        # One query per event instead of one for all of them
+        with pytest.raises(QueryPatternError):
+            for event_id in event_ids:
+                db_session.scalars(
+                    select(HealthEvent).where(HealthEvent.id == event_id)
+                ).one()
@@ -0,0 +1,181 @@
+from datetime import datetime
+from app.core.config import settings
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType
+from tests.integration.test_base import TestBase
+
+EVENTS_URL = f"{settings.API_V1_STR}/health-events/"
+
+
+class TestRecurringEvents(TestBase):
+    def _create_member(self, db_session, headers):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name="Recurring Member",
+            member_type=MemberType.HUMAN,
+            relation_type="self",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _create_event(self, headers, member, title, event_type, date_time):
+        response = self.client.post(
+            EVENTS_URL,
+            data={
+                "title": title,
+                "event_type": event_type.value,
+                "family_member_id": str(member.id),
+                "date_time": date_time.isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        return response.json()["id"]
+
+    def _list(self, headers, **params):
+        response = self.client.get(
+            EVENTS_URL,
+            params={
+                "start_date": "2025-01-01T00:00:00",
+                "end_date": "2025-01-31T00:00:00",
+                **params,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_occurrences_are_listed_and_paginated_with_stored_events(
+        self, db_session
+    ):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        series_id = self._create_event(
+            headers, member, "Vitamin D", EventType.MEDICATION, datetime(2025, 1, 1, 8)
+        )
+        self._create_event(
+            headers, member, "Checkup", EventType.CHECKUP, datetime(2025, 1, 5, 12)
+        )
+        response = self.client.put(
+            f"{EVENTS_URL}{series_id}/recurrence",
+            json={"frequency": "DAILY", "count": 10},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["ends_at"] == "2025-01-10T08:00:00"
+
+        page = self._list(headers, page=2, size=4)
+        assert page["total"] == 11
+        assert page["pages"] == 3
+        assert [item["date_time"] for item in page["items"]] == [
+            "2025-01-06T08:00:00",
+            "2025-01-05T12:00:00",
+            "2025-01-05T08:00:00",
+            "2025-01-04T08:00:00",
+        ]
+        assert [item["series_id"] for item in page["items"]] == [
+            series_id,
+            None,
+            series_id,
+            series_id,
+        ]
+
+        # The event itself is the first occurrence
+        last_page = self._list(headers, page=3, size=4)
+        assert last_page["items"][-1]["id"] == series_id
+        assert last_page["items"][-1]["occurrence_at"] == "2025-01-01T08:00:00"
+
+        # Only the window is expanded
+        window = self._list(headers, start_date="2025-01-03T00:00:00", size=100)
+        assert window["total"] == 9
+        assert window["items"][-1]["date_time"] == "2025-01-03T08:00:00"
+
+        render_db = self._list(
+            headers, start_date="2025-01-03T00:00:00", size=100, render="db"
+        )
+        assert [item["id"] for item in render_db["items"]] == [
+            item["id"] for item in window["items"]
+        ]
+
+    def test_single_occurrences_can_be_changed_or_cancelled(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        series_id = self._create_event(
+            headers, member, "Vitamin D", EventType.MEDICATION, datetime(2025, 1, 1, 8)
+        )
+        self.client.put(
+            f"{EVENTS_URL}{series_id}/recurrence",
+            json={"frequency": "DAILY", "count": 5},
+            headers=headers,
+        )
+        before = {
+            item["occurrence_at"]: item["id"]
+            for item in self._list(headers, size=100)["items"]
+        }
+
+        response = self.client.put(
+            f"{EVENTS_URL}{series_id}/occurrences/2025-01-03T08:00:00",
+            json={"title": "Double dose", "date_time": "2025-01-03T20:00:00"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        response = self.client.put(
+            f"{EVENTS_URL}{series_id}/occurrences/2025-01-04T08:00:00",
+            json={"cancelled": True},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        response = self.client.put(
+            f"{EVENTS_URL}{series_id}/occurrences/2025-01-04T09:00:00",
+            json={"cancelled": True},
+            headers=headers,
+        )
+        assert response.status_code == 404
+
+        page = self._list(headers, size=100)
+        assert page["total"] == 4
+        items = {item["occurrence_at"]: item for item in page["items"]}
+        assert "2025-01-04T08:00:00" not in items
+        moved = items["2025-01-03T08:00:00"]
+        assert moved["title"] == "Double dose"
+        assert moved["date_time"] == "2025-01-03T20:00:00"
+        assert moved["id"] == before["2025-01-03T08:00:00"]
+
+        # Dropping the rule leaves the event alone
+        response = self.client.delete(
+            f"{EVENTS_URL}{series_id}/recurrence", headers=headers
+        )
+        assert response.status_code == 204
+        assert self._list(headers)["total"] == 1
+
+    def test_past_occurrences_count_in_dashboard_stats(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        series_id = self._create_event(
+            headers, member, "Vitamin D", EventType.MEDICATION, datetime(2025, 1, 30, 8)
+        )
+        self.client.put(
+            f"{EVENTS_URL}{series_id}/recurrence",
+            json={"frequency": "DAILY", "count": 5},
+            headers=headers,
+        )
+
+        response = self.client.get(
+            f"{settings.API_V1_STR}/dashboard/stats",
+            params={"months": 120},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        stats = response.json()["members"][0]
+        assert stats["total_events"] == 5
+        assert stats["counts_by_type"] == {EventType.MEDICATION.value: 5}
+        assert stats["last_event_at"] == "2025-02-03T08:00:00"
+        assert stats["monthly"] == [
+            {"month": "2025-01-01", "event_count": 2},
+            {"month": "2025-02-01", "event_count": 3},
+        ]
@@ -0,0 +1,88 @@
+from datetime import datetime
+from app.core.config import settings
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType
+from tests.integration.test_base import TestBase
+
+
+class TestResponseCache(TestBase):
+    def _create_member(self, db_session, headers):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name="Cached Member",
+            member_type=MemberType.HUMAN,
+            relation_type="child",
+            date_of_birth="2015-01-01",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def test_health_event_reads_are_cached_until_write(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        response = self.client.post(
+            f"{settings.API_V1_STR}/health-events/",
+            data={
+                "title": "Cached Event",
+                "event_type": EventType.CHECKUP.value,
+                "family_member_id": str(member.id),
+                "date_time": datetime(2024, 5, 1, 10, 0).isoformat(),
+            },
+            headers=headers,
+        )
+        event_id = response.json()["id"]
+        url = f"{settings.API_V1_STR}/health-events/{event_id}"
+
+        first = self.client.get(url, headers=headers)
+        second = self.client.get(url, headers=headers)
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert first.json() == second.json()
+
+        self.client.put(url, data={"title": "Renamed Event"}, headers=headers)
+
+        after_write = self.client.get(url, headers=headers)
+        assert after_write.headers["X-Cache"] == "MISS"
+        assert after_write.json()["title"] == "Renamed Event"
+
+    def test_health_event_list_cache_keyed_by_query(self, db_session):
+        headers = self.get_auth_headers()
+        self._create_member(db_session, headers)
+        url = f"{settings.API_V1_STR}/health-events/"
+
+        assert self.client.get(url, headers=headers).headers["X-Cache"] == "MISS"
+        assert self.client.get(url, headers=headers).headers["X-Cache"] == "HIT"
+        response = self.client.get(f"{url}?page=2", headers=headers)
+        assert response.headers["X-Cache"] == "MISS"
+
+    def test_family_member_cache_invalidated_by_update(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        url = f"{settings.API_V1_STR}/family-members/{member.id}"
+
+        assert self.client.get(url, headers=headers).headers["X-Cache"] == "MISS"
+        assert self.client.get(url, headers=headers).headers["X-Cache"] == "HIT"
+
+        self.client.put(url, json={"name": "Renamed Member"}, headers=headers)
+
+        response = self.client.get(url, headers=headers)
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.json()["name"] == "Renamed Member"
+
+    def test_cache_stats_endpoint(self, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_ADMIN_EMAILS", ["test@example.com"])
+        headers = self.get_auth_headers()
+        other = self.get_auth_headers(email="other@example.com")
+        url = f"{settings.API_V1_STR}/metrics/cache"
+        assert self.client.get(url, headers=other).status_code == 403
+
+        response = self.client.get(url, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["backend"] == "memory"
+        assert 0.0 <= data["hit_ratio"] <= 1.0
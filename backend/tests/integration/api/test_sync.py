@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta, UTC
+from app.core.config import settings
+from app.models.family_member import FamilyMember, MemberType
+from app.models.health_event import EventType
+from app.models.sync import Tombstone
+from app.services.sync_service import sync_service
+from tests.integration.test_base import TestBase
+
+
+class TestSync(TestBase):
+    def _create_member(self, db_session, headers, name="Sync Member"):
+        user_response = self.client.get(
+            f"{settings.API_V1_STR}/auth/me", headers=headers
+        )
+        family_member = FamilyMember(
+            name=name,
+            member_type=MemberType.HUMAN,
+            relation_type="parent",
+            date_of_birth="1970-01-01",
+            manager_id=user_response.json()["id"],
+        )
+        db_session.add(family_member)
+        db_session.commit()
+        db_session.refresh(family_member)
+        return family_member
+
+    def _create_event(self, headers, family_member_id, title="Sync event"):
+        response = self.client.post(
+            f"{settings.API_V1_STR}/health-events/",
+            data={
+                "title": title,
+                "event_type": EventType.CHECKUP.value,
+                "family_member_id": str(family_member_id),
+                "date_time": datetime(2024, 1, 5, 9, 0).isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def _sync(self, headers, cursor=None, limit=None):
+        params = {}
+        if cursor is not None:
+            params["cursor"] = cursor
+        if limit is not None:
+            params["limit"] = limit
+        return self.client.get(
+            f"{settings.API_V1_STR}/sync/changes", params=params, headers=headers
+        )
+
+    def test_initial_sync_returns_everything(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(headers, member.id)
+
+        response = self._sync(headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["id"] for m in data["family_members"]["created"]] == [str(member.id)]
+        assert [e["id"] for e in data["health_events"]["created"]] == [event["id"]]
+        assert data["has_more"] is False
+
+        # Nothing changed since the returned cursor
+        data = self._sync(headers, data["cursor"]).json()
+        assert data["health_events"] == {"created": [], "updated": [], "deleted": []}
+        assert data["family_members"] == {"created": [], "updated": [], "deleted": []}
+
+    def test_changes_since_cursor(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        updated = self._create_event(headers, member.id, "To update")
+        deleted = self._create_event(headers, member.id, "To delete")
+        cursor = self._sync(headers).json()["cursor"]
+
+        created = self._create_event(headers, member.id, "New")
+        response = self.client.put(
+            f"{settings.API_V1_STR}/health-events/{updated['id']}",
+            data={"title": "Updated"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        response = self.client.delete(
+            f"{settings.API_V1_STR}/health-events/{deleted['id']}", headers=headers
+        )
+        assert response.status_code == 200
+
+        events = self._sync(headers, cursor).json()["health_events"]
+        assert [e["id"] for e in events["created"]] == [created["id"]]
+        assert [e["title"] for e in events["updated"]] == ["Updated"]
+        assert events["deleted"] == [deleted["id"]]
+
+    def test_pagination_covers_all_changes(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event_ids = {self._create_event(headers, member.id)["id"] for _ in range(5)}
+
+        seen, cursor, has_more = set(), None, True
+        while has_more:
+            data = self._sync(headers, cursor, limit=2).json()
+            assert (
+                len(data["health_events"]["created"])
+                + len(data["family_members"]["created"])
+                <= 2
+            )
+            seen.update(e["id"] for e in data["health_events"]["created"])
+            cursor, has_more = data["cursor"], data["has_more"]
+
+        assert seen == event_ids
+
+    def test_other_users_changes_are_not_synced(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        self._create_event(headers, member.id)
+
+        other_headers = self.get_auth_headers(email="other@example.com")
+        data = self._sync(other_headers).json()
+        assert data["health_events"]["created"] == []
+        assert data["family_members"]["created"] == []
+
+    def test_expired_cursor_requires_resync(self, db_session):
+        headers = self.get_auth_headers()
+        member = self._create_member(db_session, headers)
+        event = self._create_event(headers, member.id)
+        cursor = self._sync(headers).json()["cursor"]
+
+        self.client.delete(
+            f"{settings.API_V1_STR}/health-events/{event['id']}", headers=headers
+        )
+        db_session.query(Tombstone).update(
+            {Tombstone.deleted_at: datetime.now(UTC) - timedelta(days=365)}
+        )
+        assert sync_service.purge_tombstones(db_session, retention_days=30) == 1
+        db_session.commit()
+
+        response = self._sync(headers, cursor)
+        assert response.status_code == 410
+
+        # A full resync is still possible
+        assert self._sync(headers).status_code == 200
+
+    def test_invalid_cursor(self):
+        headers = self.get_auth_headers()
+        response = self._sync(headers, "not-a-cursor")
+        assert response.status_code == 400
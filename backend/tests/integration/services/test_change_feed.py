@@ -0,0 +1,110 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from sqlalchemy import delete
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.outbox import OutboxMessage
+from app.services.change_feed import (
+    RESYNC,
+    ChangeFeed,
+    Subscription,
+    TooManyConnectionsError,
+)
+
+
+@pytest.fixture
+async def feed(engine):
+    # Depends on the engine fixture for the schema the outbox is written to;
+    # publish commits, so remove what it appended afterwards
+    feed = ChangeFeed(
+        settings.get_database_url,
+        "test_changes",
+        max_connections=3,
+        max_connections_per_user=2,
+    )
+    yield feed
+    await feed.stop()
+    with SessionLocal() as db:
+        db.execute(delete(OutboxMessage))
+        db.commit()
+
+
+def publish(feed, user_id, entity_id, commit=True):
+    with SessionLocal() as db:
+        feed.publish(db, user_id, "health_event", entity_id, "updated")
+        if commit:
+            db.commit()
+        else:
+            db.rollback()
+
+
+async def next_message(subscription, timeout=5):
+    return json.loads(await asyncio.wait_for(subscription.queue.get(), timeout))
+
+
+async def test_committed_write_is_pushed_to_its_user(feed):
+    user_id, other_user_id, entity_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    subscription = await feed.subscribe(user_id)
+    other = await feed.subscribe(other_user_id)
+
+    publish(feed, user_id, entity_id)
+
+    assert await next_message(subscription) == {
+        "entity_type": "health_event",
+        "entity_id": str(entity_id),
+        "action": "updated",
+    }
+    assert other.queue.empty()
+
+
+async def test_rolled_back_write_is_not_pushed(feed):
+    user_id = uuid.uuid4()
+    subscription = await feed.subscribe(user_id)
+
+    publish(feed, user_id, uuid.uuid4(), commit=False)
+    publish(feed, user_id, uuid.uuid4())
+
+    # Only the committed notification arrives
+    await next_message(subscription)
+    await asyncio.sleep(0.1)
+    assert subscription.queue.empty()
+
+
+async def test_connection_limits(feed):
+    user_id = uuid.uuid4()
+    await feed.subscribe(user_id)
+    await feed.subscribe(user_id)
+    with pytest.raises(TooManyConnectionsError):
+        await feed.subscribe(user_id)
+
+    await feed.subscribe(uuid.uuid4())
+    with pytest.raises(TooManyConnectionsError):
+        await feed.subscribe(uuid.uuid4())
+
+
+async def test_stream_sends_heartbeats_and_unsubscribes(feed):
+    user_id = uuid.uuid4()
+    subscription = await feed.subscribe(user_id)
+    stream = feed.stream(subscription, heartbeat_interval=0.05)
+
+    assert (await anext(stream)).startswith("retry:")
+    assert await anext(stream) == ": heartbeat\n\n"
+
+    subscription.deliver(json.dumps({"action": "created"}))
+    assert await anext(stream) == 'event: change\ndata: {"action": "created"}\n\n'
+
+    await stream.aclose()
+    assert feed.connection_count == 0
+
+
+async def test_slow_subscriber_gets_resync_marker():
+    subscription = Subscription("user", queue_size=2)
+    for i in range(3):
+        subscription.deliver(str(i))
+
+    assert subscription.queue.qsize() == 1
+    assert subscription.queue.get_nowait() == RESYNC
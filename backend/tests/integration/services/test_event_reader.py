@@ -0,0 +1,52 @@
+import json
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.models.attachment import Attachment
+from app.models.health_event import HealthEvent
+from app.schemas.health_event import HealthEventResponse
+from app.services.event_reader import EVENT_COLUMNS, event_reader
+from app.utils.serialization import render_json
+
+
+def test_rows_render_like_orm_objects(db_session, member, add_event):
+    for i in range(3):
+        add_event(
+            member,
+            datetime(2024, 1, 1) + timedelta(days=i),
+            title=f"Event {i}",
+            description="Notes" if i else None,
+            attachments=[
+                Attachment(
+                    hash=str(j) * 64,
+                    size=10,
+                    mime="application/pdf",
+                    filename=f"{i}-{j}.pdf",
+                    storage_path=f"/storage/uploads/documents/{i}-{j}.pdf",
+                )
+                for j in range(i)
+            ],
+        )
+    db_session.commit()
+    member_id = member.id
+
+    def page(statement):
+        return statement.where(HealthEvent.family_member_id == member_id).order_by(
+            HealthEvent.date_time
+        )
+
+    db_session.expunge_all()
+    rows = event_reader.fetch(db_session, page(select(*EVENT_COLUMNS)))
+    # Nothing was added to the identity map
+    assert len(db_session.identity_map) == 0
+
+    objects = db_session.scalars(
+        page(select(HealthEvent).options(selectinload(HealthEvent.attachments)))
+    ).all()
+    assert json.loads(render_json(List[HealthEventResponse], rows)) == json.loads(
+        render_json(List[HealthEventResponse], objects)
+    )
+    assert [len(row.attachments) for row in rows] == [0, 1, 2]
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models.health_event import EventType
+from app.models.health_score import StaleHealthScore
+from app.services.health_score_service import health_score_service
+
+NOW = datetime(2025, 6, 1, 12, 0)
+
+
+@pytest.fixture
+def add_scored_event(db_session, add_event):
+    def add_scored_event(member, event_type, days_ago):
+        add_event(member, NOW - timedelta(days=days_ago), event_type)
+        health_score_service.mark_stale(db_session, member.id)
+
+    return add_scored_event
+
+
+def test_only_stale_members_are_rescored(db_session, add_member, add_scored_event):
+    checked = add_member()
+    add_scored_event(checked, EventType.CHECKUP, 10)
+    add_scored_event(checked, EventType.SYMPTOM, 0)
+    untouched = add_member(health_score=42)
+    db_session.commit()
+
+    assert health_score_service.recompute_stale(db_session, now=NOW) == 1
+    assert health_score_service.recompute_stale(db_session, now=NOW) == 0
+    assert not db_session.scalars(select(StaleHealthScore)).all()
+
+    db_session.expire_all()
+    assert checked.health_score == 90
+    assert untouched.health_score == 42
+
+
+def test_member_marked_while_scored_stays_stale(
+    db_session, add_member, add_scored_event, monkeypatch
+):
+    member = add_member()
+    add_scored_event(member, EventType.SYMPTOM, 0)
+    db_session.commit()
+    score = health_score_service._score
+
+    def score_then_mark(db, members, now):
+        managers = score(db, members, now)
+        health_score_service.mark_stale(db, member.id)
+        return managers
+
+    monkeypatch.setattr(health_score_service, "_score", score_then_mark)
+    assert health_score_service.recompute_stale(db_session, now=NOW) == 1
+    monkeypatch.undo()
+
+    assert db_session.scalars(select(StaleHealthScore.family_member_id)).all() == [
+        member.id
+    ]
+    assert health_score_service.recompute_stale(db_session, now=NOW) == 1
+    assert not db_session.scalars(select(StaleHealthScore)).all()
+
+
+def test_full_recompute_covers_every_member(db_session, add_member, add_scored_event):
+    members = [add_member(health_score=42) for _ in range(3)]
+    add_scored_event(members[0], EventType.CHECKUP, 10)
+    # Outside of the scoring window
+    add_scored_event(members[1], EventType.SYMPTOM, 1000)
+    db_session.commit()
+
+    assert health_score_service.recompute_all(db_session, now=NOW) >= 3
+
+    db_session.expire_all()
+    assert [member.health_score for member in members] == [100, None, None]
@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.db import query_guard
+from app.models.health_event import EventType
+from app.models.job import Job
+from app.services.health_score_service import (
+    RECOMPUTE_JOB,
+    health_score_service,
+    recompute_stale_job,
+)
+from app.services.job_queue import JobQueue
+
+NOW = datetime(2025, 6, 1, 8, 0)
+
+
+class SavepointSession:
+    """Runs each queue transaction in savepoints of the test session."""
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+        self.savepoint = None
+
+    def __call__(self):
+        # Each queue transaction stands for a request of its own
+        query_guard.reset(self.db_session)
+        self.savepoint = self.db_session.begin_nested()
+        return self
+
+    def execute(self, *args, **kwargs):
+        return self.db_session.execute(*args, **kwargs)
+
+    def commit(self):
+        self.savepoint.commit()
+        self.savepoint = self.db_session.begin_nested()
+
+    def rollback(self):
+        self.savepoint.rollback()
+        self.savepoint = self.db_session.begin_nested()
+
+    def close(self):
+        if self.savepoint.is_active:
+            self.savepoint.commit()
+
+
+@pytest.fixture
+def queue(db_session):
+    queue = JobQueue(
+        SavepointSession(db_session),
+        lease=timedelta(minutes=10),
+        backoff_base=timedelta(seconds=10),
+        backoff_max=timedelta(minutes=5),
+        max_attempts=2,
+        poll_interval=timedelta(seconds=1),
+        maintenance_interval=timedelta(minutes=1),
+        retention=timedelta(days=1),
+    )
+    queue.ran = []
+
+    @queue.handler("test.record")
+    def record(db, payload):
+        queue.ran.append(payload["name"])
+
+    @queue.handler("test.fail")
+    def fail(db, payload):
+        raise ConnectionError("storage unavailable")
+
+    return queue
+
+
+def jobs(db_session):
+    db_session.expire_all()
+    return db_session.scalars(select(Job).order_by(Job.id)).all()
+
+
+def test_jobs_run_by_priority_then_due_time(db_session, queue):
+    queue.enqueue(db_session, "test.record", {"name": "late"}, run_at=NOW)
+    queue.enqueue(
+        db_session, "test.record", {"name": "early"}, run_at=NOW - timedelta(1)
+    )
+    queue.enqueue(
+        db_session, "test.record", {"name": "urgent"}, priority=10, run_at=NOW
+    )
+    queue.enqueue(
+        db_session,
+        "test.record",
+        {"name": "scheduled"},
+        priority=0,
+        run_at=NOW + timedelta(hours=1),
+    )
+    db_session.commit()
+
+    while queue.run_once("worker", NOW):
+        pass
+    assert queue.ran == ["urgent", "early", "late"]
+    assert [job.status for job in jobs(db_session)] == [
+        "done",
+        "done",
+        "done",
+        "queued",
+    ]
+
+
+def test_dedup_key_only_holds_while_queued(db_session, queue):
+    for name in ["first", "second"]:
+        queue.enqueue(
+            db_session, "test.record", {"name": name}, dedup_key="k", run_at=NOW
+        )
+    db_session.commit()
+    assert len(jobs(db_session)) == 1
+
+    job = queue.claim("worker", NOW)
+    # Work arriving while the job runs gets a job of its own
+    queue.enqueue(db_session, "test.record", {"name": "third"}, dedup_key="k")
+    db_session.commit()
+    assert [j.status for j in jobs(db_session)] == ["running", "queued"]
+    assert job.payload == {"name": "first"}
+
+
+def test_failed_jobs_are_retried_with_backoff(db_session, queue):
+    queue.enqueue(db_session, "test.fail", run_at=NOW)
+    db_session.commit()
+
+    assert queue.run_once("worker", NOW)
+    (job,) = jobs(db_session)
+    assert job.status == "queued"
+    assert job.attempts == 1
+    assert job.last_error == "ConnectionError: storage unavailable"
+    assert NOW + timedelta(seconds=7.5) <= job.run_at <= NOW + timedelta(seconds=10)
+    assert not queue.run_once("worker", NOW + timedelta(seconds=5))
+
+    assert queue.run_once("worker", NOW + timedelta(seconds=10))
+    (job,) = jobs(db_session)
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert job.finished_at == NOW + timedelta(seconds=10)
+
+
+def test_expired_leases_are_requeued(db_session, queue):
+    queue.enqueue(db_session, "test.record", {"name": "orphan"}, run_at=NOW)
+    db_session.commit()
+    assert queue.claim("crashed", NOW) is not None
+
+    assert queue.requeue_expired(NOW + timedelta(minutes=5)) == 0
+    assert queue.requeue_expired(NOW + timedelta(minutes=11)) == 1
+    assert queue.run_once("worker", NOW + timedelta(minutes=11))
+    assert queue.ran == ["orphan"]
+    (job,) = jobs(db_session)
+    assert (job.status, job.attempts) == ("done", 2)
+
+
+def test_stats_report_depth_and_latency(db_session, queue):
+    queue.enqueue(db_session, "test.record", {"name": "a"}, run_at=NOW)
+    queue.enqueue(
+        db_session, "test.record", {"name": "b"}, run_at=NOW - timedelta(seconds=30)
+    )
+    queue.enqueue(db_session, "test.fail", run_at=NOW + timedelta(hours=1))
+    db_session.commit()
+    assert queue.run_once("worker", NOW + timedelta(seconds=10))
+
+    stats = queue.stats(db_session, timedelta(minutes=5), NOW + timedelta(seconds=10))
+    assert [s["kind"] for s in stats] == ["test.fail", "test.record"]
+    failing, recording = stats
+    assert (failing["queued"], failing["due"], failing["completed"]) == (1, 0, 0)
+    assert (recording["queued"], recording["due"]) == (1, 1)
+    assert recording["oldest_due_seconds"] == 10.0
+    assert recording["completed"] == 1
+    assert recording["avg_wait_seconds"] == 40.0
+
+
+def test_stale_health_scores_queue_one_recompute_job(db_session, member, add_event):
+    for _ in range(3):
+        add_event(member, datetime.utcnow() - timedelta(days=1), EventType.SYMPTOM)
+        health_score_service.mark_stale(db_session, member.id)
+    db_session.commit()
+
+    queued = db_session.scalars(select(Job).where(Job.kind == RECOMPUTE_JOB)).all()
+    assert len(queued) == 1
+    recompute_stale_job(db_session, queued[0].payload)
+    db_session.refresh(member)
+    assert member.health_score is not None
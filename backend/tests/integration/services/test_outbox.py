@@ -0,0 +1,186 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db import query_guard
+from app.models.outbox import OutboxMessage
+from app.services.change_feed import change_feed
+from app.services.outbox import Outbox
+
+NOW = datetime(2025, 6, 1, 8, 0)
+
+
+class SavepointSession:
+    """Runs each relay transaction in a savepoint of the test session."""
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+        self.savepoint = None
+
+    def __call__(self):
+        # Each relay transaction stands for a request of its own
+        query_guard.reset(self.db_session)
+        self.savepoint = self.db_session.begin_nested()
+        return self
+
+    def execute(self, *args, **kwargs):
+        return self.db_session.execute(*args, **kwargs)
+
+    def scalar(self, *args, **kwargs):
+        return self.db_session.scalar(*args, **kwargs)
+
+    def scalars(self, *args, **kwargs):
+        return self.db_session.scalars(*args, **kwargs)
+
+    def commit(self):
+        self.savepoint.commit()
+        self.savepoint = self.db_session.begin_nested()
+
+    def rollback(self):
+        self.savepoint.rollback()
+        self.savepoint = self.db_session.begin_nested()
+
+    def close(self):
+        if self.savepoint.is_active:
+            self.savepoint.commit()
+
+
+class RecordingConsumer:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+
+    def __call__(self, events):
+        if self.fail:
+            raise ConnectionError("search index down")
+        self.batches.append([(event.entity_id, event.action) for event in events])
+
+
+@pytest.fixture(scope="module")
+def lock_engine():
+    # Consumer locks need connections of their own, outside the test's
+    engine = create_engine(settings.get_database_url, poolclass=NullPool)
+    yield engine
+    engine.dispose()
+
+
+def make_outbox(db_session, lock_engine):
+    return Outbox(
+        SavepointSession(db_session),
+        lock_engine.connect,
+        batch_size=3,
+        poll_interval=timedelta(seconds=1),
+        retry_base=timedelta(seconds=5),
+        retry_max=timedelta(minutes=5),
+        purge_interval=timedelta(minutes=5),
+        retention=timedelta(days=1),
+    )
+
+
+@pytest.fixture
+def outbox(db_session, lock_engine):
+    return make_outbox(db_session, lock_engine)
+
+
+def messages(db_session):
+    return db_session.scalars(
+        select(OutboxMessage.action).order_by(OutboxMessage.change_seq)
+    ).all()
+
+
+def test_messages_are_delivered_in_compacted_batches(db_session, outbox):
+    user_id, a, b = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    consumer = RecordingConsumer()
+    outbox.register("search", consumer)
+    for entity_id, action in [
+        (a, "created"),
+        (a, "updated"),
+        (b, "updated"),
+        (a, "updated"),
+        (b, "deleted"),
+    ]:
+        outbox.append(db_session, user_id, "health_event", entity_id, action)
+
+    assert outbox.relay("search") == 3
+    assert outbox.relay("search") == 2
+    assert outbox.relay("search") == 0
+    assert consumer.batches == [
+        [(a, "created"), (b, "updated")],
+        [(a, "updated"), (b, "deleted")],
+    ]
+
+
+def test_failing_consumer_is_retried_without_holding_up_others(db_session, outbox):
+    user_id, entity_id = uuid.uuid4(), uuid.uuid4()
+    failing, working = RecordingConsumer(fail=True), RecordingConsumer()
+    outbox.register("webhook", failing)
+    outbox.register("search", working)
+    outbox.append(db_session, user_id, "family_member", entity_id, "updated")
+
+    assert outbox.relay_all(NOW) == 1
+    assert working.batches == [[(entity_id, "updated")]]
+    # Backing off, then delivered again once the consumer recovers
+    failing.fail = False
+    assert outbox.relay_all(NOW + timedelta(seconds=4)) == 0
+    assert outbox.relay_all(NOW + timedelta(seconds=5)) == 1
+    assert failing.batches == [[(entity_id, "updated")]]
+
+
+def test_purge_keeps_messages_a_consumer_has_not_received(db_session, outbox):
+    user_id = uuid.uuid4()
+    outbox.register("fast", RecordingConsumer())
+    outbox.register("slow", RecordingConsumer(fail=True))
+    for _ in range(4):
+        outbox.append(db_session, user_id, "health_event", uuid.uuid4(), "updated")
+
+    outbox.relay_all(NOW)
+    assert outbox.purge(NOW) == 0
+    outbox._consumers["slow"].fail = False
+    outbox.relay("slow")
+    assert outbox.purge(NOW) == 3
+    assert messages(db_session) == ["updated"]
+
+
+def test_without_consumers_messages_are_kept_for_the_retention(db_session, outbox):
+    user_id = uuid.uuid4()
+    for _ in range(2):
+        outbox.append(db_session, user_id, "health_event", uuid.uuid4(), "updated")
+
+    now = datetime.utcnow()
+    assert outbox.purge(now) == 0
+    assert outbox.purge(now + timedelta(days=1, minutes=1)) == 2
+    assert messages(db_session) == []
+
+
+def test_a_consumer_is_served_by_one_relay_at_a_time(
+    db_session, lock_engine, outbox
+):
+    user_id, entity_id = uuid.uuid4(), uuid.uuid4()
+    other = make_outbox(db_session, lock_engine)
+    other.register("search", RecordingConsumer())
+    nested = []
+
+    def consumer(events):
+        # The other relay skips the consumer while this one delivers
+        nested.append(other.relay("search"))
+
+    outbox.register("search", consumer)
+    outbox.append(db_session, user_id, "health_event", entity_id, "created")
+
+    assert outbox.relay("search") == 1
+    assert nested == [0]
+    assert other.relay("search") == 0
+    assert other._consumers["search"].batches == []
+
+
+def test_published_changes_are_appended_to_the_outbox(db_session):
+    user_id, entity_id = uuid.uuid4(), uuid.uuid4()
+    change_feed.publish(db_session, user_id, "health_event", entity_id, "deleted")
+    message = db_session.scalars(
+        select(OutboxMessage).where(OutboxMessage.entity_id == entity_id)
+    ).one()
+    assert (message.user_id, message.action) == (user_id, "deleted")
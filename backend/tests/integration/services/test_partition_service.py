@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from sqlalchemy import select, text
+
+from app.models.health_event import HealthEvent
+from app.services.partition_service import DEFAULT_PARTITION, partition_service
+
+
+def table_of(db_session, event):
+    return db_session.execute(
+        text("SELECT tableoid::regclass::text FROM health_events WHERE id = :id"),
+        {"id": event.id},
+    ).scalar_one()
+
+
+def test_ensure_partitions_moves_rows_out_of_default(db_session, member, add_event):
+    event = add_event(member, datetime(2011, 6, 1))
+    assert table_of(db_session, event) == DEFAULT_PARTITION
+
+    created = partition_service.ensure_partitions(db_session)
+
+    assert "health_events_y2011" in created
+    assert "health_events_y2011" in partition_service.get_partitions(db_session)
+    assert table_of(db_session, event) == "health_events_y2011"
+    assert partition_service.ensure_partitions(db_session) == []
+
+    # New rows are routed to the partition and still load through the ORM
+    later = add_event(member, datetime(2011, 12, 31, 23, 59))
+    assert table_of(db_session, later) == "health_events_y2011"
+    db_session.expire_all()
+    assert db_session.get(HealthEvent, later.id).date_time.year == 2011
+
+
+def test_moving_event_date_moves_partition(db_session, member, add_event):
+    event = add_event(member, datetime(2012, 3, 1))
+    partition_service.ensure_partitions(db_session)
+    partition_service.create_partition(db_session, 2013)
+
+    event.date_time = datetime(2013, 3, 1)
+    db_session.flush()
+    assert table_of(db_session, event) == "health_events_y2013"
+
+
+def test_date_filters_prune_partitions(db_session, member, add_event):
+    for year in (2014, 2015, 2016):
+        add_event(member, datetime(year, 5, 1))
+    partition_service.ensure_partitions(db_session)
+
+    # Same filters as the health event list endpoint
+    query = select(HealthEvent).where(
+        HealthEvent.date_time >= datetime(2015, 1, 1),
+        HealthEvent.date_time <= datetime(2015, 12, 31),
+    )
+    compiled = query.compile(
+        dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = "\n".join(db_session.execute(text(f"EXPLAIN {compiled}")).scalars())
+
+    assert "health_events_y2015" in plan
+    assert "health_events_y2014" not in plan
+    assert "health_events_y2016" not in plan
+    assert DEFAULT_PARTITION not in plan
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models.health_event import EventType
+from app.models.reminder import MedicationReminder
+from app.services.reminder_scheduler import ReminderScheduler
+from app.services.reminder_service import reminder_service
+
+NOW = datetime(2025, 6, 1, 8, 0)
+
+
+class RecordingNotifier:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+
+    def send(self, reminders):
+        if self.fail:
+            raise ConnectionError("push service down")
+        self.batches.append([reminder.title for reminder in reminders])
+
+
+class SavepointSession:
+    """Runs each scheduler transaction in a savepoint of the test session."""
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+        self.savepoint = None
+
+    def __call__(self):
+        self.savepoint = self.db_session.begin_nested()
+        return self
+
+    def execute(self, *args, **kwargs):
+        return self.db_session.execute(*args, **kwargs)
+
+    def commit(self):
+        self.savepoint.commit()
+
+    def rollback(self):
+        self.savepoint.rollback()
+
+    def close(self):
+        if self.savepoint.is_active:
+            self.savepoint.commit()
+
+
+@pytest.fixture
+def add_reminder_event(db_session, add_event):
+    """Factory of events due ``due_in`` after NOW, synced to reminders."""
+
+    def add_reminder_event(member, title, due_in, event_type=EventType.MEDICATION):
+        event = add_event(member, NOW + due_in, event_type, title=title)
+        reminder_service.sync_event(db_session, event, now=NOW)
+        return event
+
+    return add_reminder_event
+
+
+def scheduler(db_session, notifier, batch_size=100):
+    return ReminderScheduler(
+        SavepointSession(db_session),
+        notifier,
+        window=timedelta(minutes=15),
+        refresh_interval=timedelta(minutes=1),
+        batch_size=batch_size,
+        retry_delay=timedelta(seconds=30),
+    )
+
+
+def test_only_future_medication_events_get_reminders(
+    db_session, member, add_reminder_event
+):
+    add_reminder_event(member, "Pill", timedelta(hours=1))
+    add_reminder_event(member, "Taken", -timedelta(hours=1))
+    add_reminder_event(member, "Checkup", timedelta(hours=1), EventType.CHECKUP)
+    titles = db_session.scalars(select(MedicationReminder.title)).all()
+    assert titles == ["Pill"]
+
+
+def test_due_reminders_fire_once_in_batches(db_session, member, add_reminder_event):
+    # Events due at NOW or before get no reminder
+    for i in range(1, 6):
+        add_reminder_event(member, f"Pill {i}", timedelta(minutes=i))
+    add_reminder_event(member, "Later", timedelta(hours=2))
+    db_session.commit()
+    notifier = RecordingNotifier()
+    reminders = scheduler(db_session, notifier, batch_size=2)
+
+    assert reminders.tick(NOW + timedelta(minutes=3)) == 3
+    assert notifier.batches == [["Pill 1", "Pill 2"], ["Pill 3"]]
+    # Only the window is held in memory
+    assert reminders.pending == 2
+    assert reminders.next_wakeup() == NOW + timedelta(minutes=4)
+
+    assert reminders.tick(NOW + timedelta(minutes=5)) == 2
+    # A restarted scheduler doesn't send them again
+    assert scheduler(db_session, notifier).tick(NOW + timedelta(minutes=5)) == 0
+    assert len(notifier.batches) == 3
+
+
+def test_moved_and_cancelled_reminders_are_skipped(
+    db_session, member, add_reminder_event
+):
+    moved = add_reminder_event(member, "Moved", timedelta(seconds=30))
+    cancelled = add_reminder_event(member, "Cancelled", timedelta(seconds=30))
+    db_session.commit()
+    notifier = RecordingNotifier()
+    reminders = scheduler(db_session, notifier)
+    reminders.refresh(NOW)
+
+    moved.date_time = NOW + timedelta(hours=1)
+    reminder_service.sync_event(db_session, moved, now=NOW)
+    reminder_service.cancel_event(db_session, cancelled.id)
+    db_session.commit()
+    # Claimed from the loaded window, before it is refreshed
+    assert reminders.tick(NOW + timedelta(seconds=30)) == 0
+    assert reminders.tick(NOW + timedelta(hours=1)) == 1
+    assert notifier.batches == [["Moved"]]
+
+
+def test_failed_delivery_is_retried(db_session, member, add_reminder_event):
+    add_reminder_event(member, "Pill", timedelta(seconds=1))
+    db_session.commit()
+    notifier = RecordingNotifier(fail=True)
+    reminders = scheduler(db_session, notifier)
+
+    assert reminders.tick(NOW + timedelta(seconds=1)) == 0
+    notifier.fail = False
+    assert reminders.tick(NOW + timedelta(seconds=11)) == 0
+    assert reminders.tick(NOW + timedelta(seconds=31)) == 1
+    assert notifier.batches == [["Pill"]]
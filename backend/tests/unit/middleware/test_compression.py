@@ -0,0 +1,97 @@
+import gzip
+import json
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+from app.middleware.compression import (
+    CompressionMiddleware,
+    is_compressible,
+    negotiate_encoding,
+)
+
+PAYLOAD = {"items": [{"id": i, "title": f"Event {i}"} for i in range(200)]}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large():
+        return PAYLOAD
+
+    @app.get("/small")
+    def small():
+        return {"message": "ok"}
+
+    @app.get("/image")
+    def image():
+        return Response(b"\xff\xd8" + b"0" * 5000, media_type="image/jpeg")
+
+    @app.get("/stream")
+    def stream():
+        def chunks():
+            for i in range(50):
+                yield json.dumps({"line": i, "padding": "x" * 50}).encode() + b"\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding_honours_quality_values():
+    available = ["br", "zstd", "gzip"]
+    assert negotiate_encoding("gzip, deflate, br", available) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", available) == "gzip"
+    assert negotiate_encoding("br;q=0, *;q=0.1", available) == "zstd"
+    assert negotiate_encoding("identity", available) is None
+    assert negotiate_encoding("", available) is None
+
+
+def test_is_compressible():
+    assert is_compressible("application/json")
+    assert is_compressible("text/event-stream; charset=utf-8")
+    assert is_compressible("image/svg+xml")
+    assert not is_compressible("image/png")
+    assert not is_compressible("application/pdf")
+
+
+def test_large_json_is_gzipped(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(json.dumps(PAYLOAD))
+    assert response.json() == PAYLOAD
+
+
+@pytest.mark.parametrize("coding", ["br", "zstd"])
+def test_large_json_uses_preferred_coding(client, coding):
+    pytest.importorskip({"br": "brotli", "zstd": "zstandard"}[coding])
+    response = client.get(
+        "/large", headers={"Accept-Encoding": f"gzip;q=0.5, {coding}"}
+    )
+    assert response.headers["content-encoding"] == coding
+
+
+def test_small_response_is_not_compressed(client):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"message": "ok"}
+
+
+def test_already_compressed_type_is_skipped(client):
+    response = client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert len(response.content) == 5002
+
+
+def test_streaming_response_is_compressed_incrementally(client):
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as r:
+        assert r.headers["content-encoding"] == "gzip"
+        assert "content-length" not in r.headers
+        raw = b"".join(r.iter_raw())
+    lines = gzip.decompress(raw).splitlines()
+    assert len(lines) == 50
+    assert json.loads(lines[-1])["line"] == 49
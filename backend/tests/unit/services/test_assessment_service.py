@@ -0,0 +1,70 @@
+import pytest
+
+from app.services.assessment_service import (
+    AnswerError,
+    CompiledScale,
+    ScaleDefinitionError,
+)
+
+OPTIONS = [{"value": "no", "score": 0}, {"value": "yes", "score": 2}]
+DEFINITION = {
+    "items": [
+        {"id": "a", "text": "A", "options": OPTIONS},
+        {"id": "b", "text": "B", "options": OPTIONS, "weight": 1.5},
+        {"id": "c", "text": "C", "options": OPTIONS, "required": False},
+    ],
+    "subscales": {"first": ["a"], "rest": ["b", "c"]},
+    "bands": [
+        {"min_score": 4, "label": "High"},
+        {"min_score": 0, "label": "Low"},
+    ],
+}
+
+
+def test_answer_sets_are_scored_in_bulk():
+    scale = CompiledScale(DEFINITION)
+    scores = scale.score(
+        [
+            {"a": "no", "b": "no"},
+            {"a": "yes", "b": "no", "c": "yes"},
+            {"a": "yes", "b": "yes", "c": "yes"},
+        ]
+    )
+    assert scores.totals.tolist() == [0, 4, 7]
+    assert scale.subscale_names == ["first", "rest"]
+    assert scores.subscales.tolist() == [[0, 0], [2, 2], [2, 5]]
+    assert scores.bands == ["Low", "High", "High"]
+
+
+def test_total_below_every_band_has_none():
+    definition = dict(DEFINITION, bands=[{"min_score": 1, "label": "Any"}])
+    assert CompiledScale(definition).score([{"a": "no", "b": "no"}]).bands == [None]
+
+
+@pytest.mark.parametrize(
+    "answers, message",
+    [
+        ({"a": "no"}, "missing answer to b"),
+        ({"a": "no", "b": "maybe"}, "invalid answer 'maybe' to b"),
+        ({"a": "no", "b": "no", "d": "no"}, "unknown item d"),
+    ],
+)
+def test_invalid_answers_are_rejected(answers, message):
+    with pytest.raises(AnswerError) as raised:
+        CompiledScale(DEFINITION).score([{"a": "no", "b": "no"}, answers])
+    assert raised.value.index == 1
+    assert raised.value.message == message
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        {"items": []},
+        dict(DEFINITION, subscales={"first": ["z"]}),
+        dict(DEFINITION, items=DEFINITION["items"] + DEFINITION["items"][:1]),
+        {"items": [{"id": "a", "text": "A", "options": OPTIONS + OPTIONS[:1]}]},
+    ],
+)
+def test_invalid_definitions_do_not_compile(definition):
+    with pytest.raises(ScaleDefinitionError):
+        CompiledScale(definition)
@@ -0,0 +1,48 @@
+import numpy as np
+
+from app.services.health_score_service import EventArrays, compute_scores
+
+
+def events(*rows):
+    member_index, event_type, age_days = zip(*rows) if rows else ((), (), ())
+    return EventArrays(
+        np.array(member_index, dtype=np.intp),
+        np.array(event_type, dtype=str),
+        np.array(age_days, dtype=float),
+    )
+
+
+def test_members_are_scored_independently():
+    scores = compute_scores(
+        events(
+            (0, "CHECKUP", 30.0),
+            (1, "CHECKUP", 30.0),
+            (1, "SYMPTOM", 0.0),
+            (1, "SYMPTOM", 90.0),
+            (2, "MEDICATION", 0.0),
+        ),
+        4,
+    )
+    assert scores[0] == 100
+    # A symptom today costs 10 points, one from a half-life ago 5
+    assert scores[1] == 85
+    # No checkup at all, plus a medication today
+    assert scores[2] == 100 - 20 - 4
+    assert np.isnan(scores[3])
+
+
+def test_overdue_checkup_penalty_grows_over_an_interval():
+    scores = compute_scores(
+        events((0, "CHECKUP", 365.0), (1, "CHECKUP", 547.5), (2, "CHECKUP", 900.0)),
+        3,
+    )
+    assert scores.tolist() == [100, 90, 80]
+
+
+def test_scores_stay_within_bounds():
+    scores = compute_scores(events(*[(0, "SYMPTOM", 0.0)] * 20), 1)
+    assert scores[0] == 0
+
+
+def test_no_events():
+    assert np.isnan(compute_scores(events(), 2)).all()
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from app.services.ingest_buffer import IngestBuffer, IngestBufferFullError
+
+BAD_MEMBER = uuid.uuid4()
+
+
+class FakeSession:
+    """Records the rows of every committed upsert."""
+
+    def __init__(self, commits, release=None):
+        self.commits = commits
+        self.release = release
+        self.rows = None
+
+    def execute(self, statement, rows):
+        if self.release is not None:
+            self.release.wait(5)
+        if any(row["family_member_id"] == BAD_MEMBER for row in rows):
+            raise ValueError("foreign key violation")
+        self.rows = rows
+
+    def commit(self):
+        self.commits.append(self.rows)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def readings(count, member=None):
+    member = member or uuid.uuid4()
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "family_member_id": member,
+            "metric": "heart_rate",
+            "ts": start + timedelta(seconds=i),
+            "value": 60.0 + i,
+        }
+        for i in range(count)
+    ]
+
+
+def make_buffer(commits, release=None, **options):
+    config = dict(
+        flush_readings=1000, flush_interval=10, max_pending=1000, submit_timeout=1
+    )
+    config.update(options)
+    return IngestBuffer(lambda: FakeSession(commits, release), **config)
+
+
+async def test_batches_are_committed_together_once_enough_are_pending():
+    commits = []
+    buffer = make_buffer(commits, flush_readings=4)
+    results = await asyncio.gather(
+        buffer.submit(readings(2)), buffer.submit(readings(2))
+    )
+    assert results == [2, 2]
+    assert [len(rows) for rows in commits] == [4]
+    assert buffer.pending_readings == 0
+
+
+async def test_batches_are_committed_after_the_flush_interval():
+    commits = []
+    buffer = make_buffer(commits, flush_interval=0.01)
+    assert await buffer.submit(readings(3)) == 3
+    assert [len(rows) for rows in commits] == [3]
+
+
+async def test_submit_fails_while_the_buffer_stays_full():
+    commits = []
+    release = threading.Event()
+    buffer = make_buffer(
+        commits, release, flush_readings=3, max_pending=3, submit_timeout=0.05
+    )
+    first = asyncio.ensure_future(buffer.submit(readings(3)))
+    await asyncio.sleep(0.01)
+    with pytest.raises(IngestBufferFullError):
+        await buffer.submit(readings(1))
+
+    release.set()
+    assert await first == 3
+    assert await buffer.submit(readings(3)) == 3
+
+
+async def test_a_failing_batch_does_not_fail_the_others():
+    commits = []
+    buffer = make_buffer(commits, flush_readings=4)
+    good, bad = await asyncio.gather(
+        buffer.submit(readings(2)),
+        buffer.submit(readings(2, BAD_MEMBER)),
+        return_exceptions=True,
+    )
+    assert good == 2
+    assert isinstance(bad, ValueError)
+    assert [len(rows) for rows in commits] == [2]
+
+
+async def test_stop_flushes_pending_batches():
+    commits = []
+    buffer = make_buffer(commits)
+    submitted = asyncio.ensure_future(buffer.submit(readings(1)))
+    await asyncio.sleep(0.01)
+    await buffer.stop()
+    assert await submitted == 1
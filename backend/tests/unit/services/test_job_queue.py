@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from app.services.job_queue import JobQueue
+
+
+def make_queue():
+    return JobQueue(
+        session_factory=None,
+        lease=timedelta(minutes=10),
+        backoff_base=timedelta(seconds=10),
+        backoff_max=timedelta(minutes=5),
+        max_attempts=5,
+        poll_interval=timedelta(seconds=1),
+        maintenance_interval=timedelta(minutes=1),
+        retention=timedelta(days=1),
+    )
+
+
+def test_backoff_doubles_up_to_the_maximum():
+    queue = make_queue()
+    for attempts, seconds in [(1, 10), (2, 20), (3, 40), (10, 300)]:
+        delay = queue.backoff(attempts).total_seconds()
+        assert 0.75 * seconds <= delay <= seconds
+
+
+def test_handlers_are_registered_by_kind():
+    queue = make_queue()
+
+    @queue.handler("reports.build")
+    def build_report(db, payload):
+        return payload
+
+    assert queue._handlers == {"reports.build": build_report}
+    assert build_report(None, {"id": 1}) == {"id": 1}
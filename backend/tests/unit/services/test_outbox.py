@@ -0,0 +1,88 @@
+import hashlib
+import hmac
+import json
+import uuid
+from datetime import datetime
+
+from app.services import outbox as outbox_module
+from app.services.outbox import OutboxEvent, WebhookConsumer, compact
+
+USER = uuid.uuid4()
+NOW = datetime(2025, 6, 1, 8, 0)
+
+
+def event(entity_id, action, entity_type="health_event"):
+    return OutboxEvent(USER, entity_type, entity_id, action, NOW)
+
+
+def test_compaction_keeps_the_last_change_of_each_entity():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    compacted = compact(
+        [
+            event(a, "updated"),
+            event(b, "updated"),
+            event(a, "deleted"),
+            event(a, "updated", entity_type="family_member"),
+        ]
+    )
+    assert [(e.entity_id, e.action) for e in compacted] == [
+        (b, "updated"),
+        (a, "deleted"),
+        (a, "updated"),
+    ]
+
+
+def test_compaction_keeps_creations_and_drops_short_lived_rows():
+    created, short_lived = uuid.uuid4(), uuid.uuid4()
+    compacted = compact(
+        [
+            event(created, "created"),
+            event(short_lived, "created"),
+            event(created, "updated"),
+            event(short_lived, "updated"),
+            event(short_lived, "deleted"),
+        ]
+    )
+    assert [(e.entity_id, e.action) for e in compacted] == [(created, "created")]
+
+
+class FakeResponse:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self):
+        return b""
+
+
+def test_webhook_posts_signed_batches(monkeypatch):
+    requests = []
+
+    def urlopen(request, timeout):
+        requests.append((request, timeout))
+        return FakeResponse()
+
+    monkeypatch.setattr(outbox_module.urllib.request, "urlopen", urlopen)
+    entity_id = uuid.uuid4()
+    WebhookConsumer("http://hooks.example.com/changes", "s3cret", 5.0)(
+        [event(entity_id, "updated")]
+    )
+
+    ((request, timeout),) = requests
+    assert timeout == 5.0
+    assert request.get_method() == "POST"
+    assert json.loads(request.data) == {
+        "events": [
+            {
+                "user_id": str(USER),
+                "entity_type": "health_event",
+                "entity_id": str(entity_id),
+                "action": "updated",
+                "created_at": "2025-06-01T08:00:00",
+            }
+        ]
+    }
+    expected = hmac.new(b"s3cret", request.data, hashlib.sha256).hexdigest()
+    assert request.get_header("X-sesame-signature") == f"sha256={expected}"
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from app.models.recurrence import RecurrenceFrequency
+from app.services.recurrence_service import (
+    last_occurrence,
+    occurrence,
+    occurrence_index,
+)
+
+DAILY = RecurrenceFrequency.DAILY.value
+WEEKLY = RecurrenceFrequency.WEEKLY.value
+MONTHLY = RecurrenceFrequency.MONTHLY.value
+START = datetime(2024, 1, 31, 8, 0)
+
+
+def test_monthly_occurrences_stay_on_the_day_of_the_event():
+    assert [occurrence(START, MONTHLY, 1, n) for n in range(4)] == [
+        datetime(2024, 1, 31, 8, 0),
+        datetime(2024, 2, 29, 8, 0),
+        datetime(2024, 3, 31, 8, 0),
+        datetime(2024, 4, 30, 8, 0),
+    ]
+
+
+def test_weekly_occurrences_follow_the_interval():
+    assert occurrence(START, WEEKLY, 2, 3) == datetime(2024, 3, 13, 8, 0)
+
+
+def test_index_of_the_last_occurrence_at_or_before_a_time():
+    assert occurrence_index(START, DAILY, 1, datetime(2024, 1, 31, 7, 0)) == -1
+    assert occurrence_index(START, DAILY, 1, datetime(2024, 2, 2, 8, 0)) == 2
+    assert occurrence_index(START, DAILY, 3, datetime(2024, 2, 2, 8, 0)) == 0
+    assert occurrence_index(START, MONTHLY, 1, datetime(2024, 3, 31, 7, 0)) == 1
+    assert occurrence_index(START, MONTHLY, 1, datetime(2024, 3, 31, 8, 0)) == 2
+
+
+def test_last_occurrence_of_bounded_series():
+    assert last_occurrence(START, DAILY, 1) is None
+    assert last_occurrence(START, DAILY, 1, count=3) == datetime(2024, 2, 2, 8, 0)
+    until = datetime(2024, 2, 20)
+    assert last_occurrence(START, WEEKLY, 1, until=until) == datetime(
+        2024, 2, 14, 8, 0
+    )
+    assert last_occurrence(START, WEEKLY, 1, count=2, until=until) == datetime(
+        2024, 2, 7, 8, 0
+    )
@@ -0,0 +1,121 @@
+import fnmatch
+import uuid
+import pytest
+from app.services.response_cache import (
+    LRUCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+)
+
+
+class FakeRedis:
+    """Local stand-in implementing the subset of redis-py used by the cache."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        if isinstance(value, int):
+            value = str(value).encode()
+        self.data[key] = value
+        return True
+
+    def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    def scan_iter(self, match):
+        return (key for key in self.data if fnmatch.fnmatchcase(key, match))
+
+    def info(self, section):
+        return {"used_memory": sum(len(v) for v in self.data.values())}
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        backend = LRUCacheBackend(max_entries=100, max_bytes=1024 * 1024)
+    else:
+        backend = RedisCacheBackend(client=FakeRedis())
+    return ResponseCache(backend, ttl=60)
+
+
+def test_key_normalizes_query_params(cache):
+    user_id = uuid.uuid4()
+    key = cache.key(user_id, "health_events", {"page": 1, "size": 10, "search": None})
+    assert key == cache.key(user_id, "health_events", {"size": 10, "page": 1})
+    assert key != cache.key(user_id, "health_events", {"page": 2, "size": 10})
+    assert key != cache.key(uuid.uuid4(), "health_events", {"page": 1, "size": 10})
+
+
+def test_invalidate_user_hides_previous_entries(cache):
+    user_id = uuid.uuid4()
+    other_user_id = uuid.uuid4()
+    key = cache.key(user_id, "health_event", {"event_id": 1})
+    other_key = cache.key(other_user_id, "health_event", {"event_id": 1})
+    cache.set(key, b'{"id": 1}', {"ETag": 'W/"1"'})
+    cache.set(other_key, b'{"id": 1}', {"ETag": 'W/"1"'})
+
+    cache.invalidate_user(user_id)
+
+    assert cache.get(cache.key(user_id, "health_event", {"event_id": 1})) is None
+    cached = cache.get(cache.key(other_user_id, "health_event", {"event_id": 1}))
+    assert cached.body == b'{"id": 1}'
+    assert cached.headers == {"ETag": 'W/"1"'}
+
+
+def test_stats_report_hit_ratio_and_memory(cache):
+    key = cache.key(uuid.uuid4(), "family_member", {"family_member_id": 1})
+    assert cache.get(key) is None
+    cache.set(key, b"x" * 100)
+    assert cache.get(key).body == b"x" * 100
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["memory_bytes"] >= 100
+
+
+def test_redis_backend_counts_only_its_own_keys():
+    client = FakeRedis()
+    client.set("other-app:session", b"x")
+    backend = RedisCacheBackend(client=client)
+    backend.set("a", b"1", ttl=60)
+    assert backend.entry_count() == 1
+
+
+def test_lru_backend_evicts_least_recently_used():
+    backend = LRUCacheBackend(max_entries=2, max_bytes=1024)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    backend.get("a")
+    backend.set("c", b"3", ttl=60)
+
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.entry_count() == 2
+
+
+def test_lru_backend_respects_byte_budget():
+    backend = LRUCacheBackend(max_entries=100, max_bytes=10)
+    backend.set("a", b"12345", ttl=60)
+    backend.set("b", b"12345", ttl=60)
+    backend.set("c", b"12345", ttl=60)
+
+    assert backend.memory_usage() <= 10
+    assert backend.get("a") is None
+
+
+def test_disabled_cache_is_a_no_op():
+    cache = ResponseCache(None, ttl=60)
+    key = cache.key(uuid.uuid4(), "health_event", {"event_id": 1})
+    cache.set(key, b"{}")
+    assert cache.get(key) is None
+    assert cache.stats()["backend"] == "none"
@@ -0,0 +1,40 @@
+import numpy as np
+
+from app.services.trend_service import SERIES_WEEKS, analyze
+
+
+def series(*values):
+    return np.array(values + (0,) * (SERIES_WEEKS - len(values)))
+
+
+def test_rolling_mean_over_available_weeks():
+    trends = analyze(series(4, 0, 0, 0, 8)[None, :])
+    assert trends.rolling_mean[0, :6].tolist() == [4, 2, 4 / 3, 1, 2, 2]
+
+
+def test_spike_in_latest_week_is_an_anomaly():
+    counts = np.zeros((3, SERIES_WEEKS))
+    counts[0, -1] = 5
+    counts[1, -1] = 1
+    counts[2] = 2
+    trends = analyze(counts)
+    assert trends.zscore[0] == 10
+    assert trends.is_anomaly.tolist() == [True, False, False]
+
+
+def test_shift_of_the_mean_is_a_change_point():
+    counts = np.stack(
+        [
+            np.repeat([0, 3], SERIES_WEEKS // 2),
+            np.full(SERIES_WEEKS, 2),
+        ]
+    )
+    trends = analyze(counts)
+    assert trends.change_index[0] == SERIES_WEEKS // 2
+    assert trends.is_change_point.tolist() == [True, False]
+    assert trends.change_score[1] == 0
+
+
+def test_slope_of_a_linear_series():
+    trends = analyze(np.arange(SERIES_WEEKS)[None, :] * 2)
+    assert np.isclose(trends.slope[0], 2)
@@ -0,0 +1,33 @@
+import gzip
+
+import pytest
+
+from app.utils.decompression import UnsupportedEncodingError, decompress
+
+
+def test_gzip_body_is_decoded():
+    assert decompress(gzip.compress(b"readings"), "gzip", 100) == b"readings"
+
+
+@pytest.mark.parametrize("coding", ["gzip", "br"])
+def test_body_inflating_past_the_limit_is_rejected(coding):
+    data = b"0" * 1_000_000
+    if coding == "br":
+        brotli = pytest.importorskip("brotli")
+        body = brotli.compress(data)
+    else:
+        body = gzip.compress(data)
+    with pytest.raises(ValueError, match="once decoded"):
+        decompress(body, coding, 1000)
+
+
+def test_truncated_brotli_body_is_rejected():
+    brotli = pytest.importorskip("brotli")
+    body = brotli.compress(b"readings" * 100)
+    with pytest.raises(ValueError, match="Invalid br body"):
+        decompress(body[:-4], "br", 10_000)
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(UnsupportedEncodingError):
+        decompress(b"data", "compress", 100)
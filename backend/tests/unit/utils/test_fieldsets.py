@@ -0,0 +1,20 @@
+import pytest
+from app.schemas.health_event import HealthEventResponse
+from app.utils.fieldsets import parse_fields, sparse_model
+
+
+def test_parse_fields_adds_id_and_ignores_blanks():
+    allowed = {"id", "title", "date_time"}
+    assert parse_fields("title, ,date_time,", allowed) == {"id", "title", "date_time"}
+
+
+def test_parse_fields_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="secret"):
+        parse_fields("title,secret", {"id", "title"})
+
+
+def test_sparse_model_is_built_once_per_field_set():
+    fields = frozenset({"id", "title"})
+    model = sparse_model(HealthEventResponse, fields)
+    assert set(model.model_fields) == fields
+    assert sparse_model(HealthEventResponse, frozenset({"title", "id"})) is model
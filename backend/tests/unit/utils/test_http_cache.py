@@ -0,0 +1,44 @@
+from datetime import datetime
+from app.utils.http_cache import (
+    http_date,
+    is_not_modified,
+    make_etag,
+    validator_headers,
+)
+
+
+def test_make_etag_is_weak_and_stable():
+    etag = make_etag("a", 1, datetime(2024, 1, 1))
+    assert etag.startswith('W/"')
+    assert etag == make_etag("a", 1, datetime(2024, 1, 1))
+    assert etag != make_etag("a", 2, datetime(2024, 1, 1))
+
+
+def test_http_date_treats_naive_values_as_utc():
+    assert http_date(datetime(2024, 1, 2, 3, 4, 5)) == "Tue, 02 Jan 2024 03:04:05 GMT"
+
+
+def test_if_none_match_uses_weak_comparison():
+    headers = validator_headers('W/"abc"')
+    assert is_not_modified(headers, if_none_match='"abc"')
+    assert is_not_modified(headers, if_none_match='W/"xyz", W/"abc"')
+    assert is_not_modified(headers, if_none_match="*")
+    assert not is_not_modified(headers, if_none_match='W/"xyz"')
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    headers = validator_headers('W/"abc"', datetime(2024, 1, 1))
+    assert not is_not_modified(
+        headers,
+        if_none_match='W/"xyz"',
+        if_modified_since="Tue, 02 Jan 2024 00:00:00 GMT",
+    )
+
+
+def test_if_modified_since():
+    headers = validator_headers('W/"abc"', datetime(2024, 1, 1, 12, 0, 0))
+    assert is_not_modified(headers, if_modified_since="Mon, 01 Jan 2024 12:00:00 GMT")
+    assert not is_not_modified(
+        headers, if_modified_since="Mon, 01 Jan 2024 11:59:59 GMT"
+    )
+    assert not is_not_modified(headers, if_modified_since="not a date")
@@ -0,0 +1,46 @@
+import json
+import uuid
+from datetime import datetime
+from app.models import HealthEvent, EventType
+from app.schemas.health_event import HealthEventResponse, PaginatedResponse
+from app.utils.serialization import ORJSONResponse, render_json
+
+
+def _event():
+    return HealthEvent(
+        id=uuid.uuid4(),
+        title="Checkup",
+        event_type=EventType.CHECKUP.value,
+        date_time=datetime(2024, 1, 1, 9, 30),
+        family_member_id=uuid.uuid4(),
+        created_by_id=uuid.uuid4(),
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+def test_render_json_matches_response_model_output():
+    event = _event()
+    body = render_json(HealthEventResponse, event)
+    assert isinstance(body, bytes)
+    assert json.loads(body) == json.loads(
+        HealthEventResponse.model_validate(event).model_dump_json()
+    )
+
+
+def test_render_json_page_from_orm_items():
+    page = {
+        "items": [_event(), _event()],
+        "total": 2,
+        "page": 1,
+        "size": 10,
+        "pages": 1,
+    }
+    data = json.loads(render_json(PaginatedResponse, page))
+    assert len(data["items"]) == 2
+    assert data["items"][0]["date_time"] == "2024-01-01T09:30:00"
+
+
+def test_orjson_response_renders_bytes():
+    response = ORJSONResponse({"message": "ok", 1: "non-string key"})
+    assert json.loads(response.body) == {"message": "ok", "1": "non-string key"}